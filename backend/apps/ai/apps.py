@@ -2,6 +2,8 @@
 # FILE: backend/apps/ai/apps.py
 # =============================================================================
 
+import atexit
+
 from django.apps import AppConfig
 
 
@@ -9,3 +11,9 @@ class AiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.ai'
     verbose_name = 'AI Workflow Generation'
+
+    def ready(self):
+        """Close the pooled provider HTTP clients when the process exits."""
+        from .views import close_http_clients
+
+        atexit.register(close_http_clients)
@@ -0,0 +1,56 @@
+# =============================================================================
+# FILE: backend/apps/ai/schemas.py
+# =============================================================================
+# Pydantic models describing the JSON workflow returned by the LLM.
+# Parsing and validation run in one pass inside pydantic-core.
+# =============================================================================
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class NodeData(BaseModel):
+    """Display and configuration payload of a generated node."""
+
+    model_config = ConfigDict(extra="allow")
+
+    label: str = ""
+    configValues: dict[str, Any] = Field(default_factory=dict)
+
+
+class WorkflowNode(BaseModel):
+    """A single node placed on the canvas."""
+
+    # Models sometimes emit numeric ids
+    model_config = ConfigDict(extra="allow", coerce_numbers_to_str=True)
+
+    id: str
+    type: str
+    position: dict[str, Any] = Field(default_factory=lambda: {"x": 0, "y": 0})
+    data: NodeData = Field(default_factory=NodeData)
+
+    @model_validator(mode="after")
+    def default_label_to_type(self) -> "WorkflowNode":
+        """Nodes without a label display their node type instead."""
+        if not self.data.label:
+            self.data.label = self.type
+        return self
+
+
+class GeneratedWorkflow(BaseModel):
+    """Nodes and edges proposed by the model."""
+
+    model_config = ConfigDict(extra="allow")
+
+    nodes: list[WorkflowNode] = Field(default_factory=list)
+    edges: list[dict[str, Any]] = Field(default_factory=list)
+
+
+class AIWorkflowResponse(BaseModel):
+    """Top-level object the system prompt asks the model to return."""
+
+    model_config = ConfigDict(extra="allow")
+
+    message: str = ""
+    workflow: GeneratedWorkflow | None = None
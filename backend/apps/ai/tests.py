@@ -0,0 +1,172 @@
+# =============================================================================
+# FILE: backend/apps/ai/tests.py
+# =============================================================================
+# Unit tests for the AI workflow generation app.
+# =============================================================================
+"""
+Tests for AI workflow generation.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import asyncio
+import threading
+from unittest import mock
+
+import httpx
+import orjson
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from apps.ai import views
+
+
+# =============================================================================
+# PROVIDER CLIENT TESTS
+# =============================================================================
+
+class ProviderClientPoolTests(SimpleTestCase):
+    """Tests for the shared provider HTTP clients."""
+
+    def setUp(self):
+        """Route Anthropic calls to a mock transport counting requests."""
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(200, json={
+                "content": [{"type": "text", "text": '{"message": "ok", "workflow": null}'}],
+            })
+
+        client = httpx.Client(
+            base_url=views.ANTHROPIC_BASE_URL,
+            transport=httpx.MockTransport(handler),
+        )
+        self.addCleanup(client.close)
+        patcher = mock.patch.dict(
+            views._HTTP_CLIENTS, {(views.ANTHROPIC_BASE_URL, 60.0): client}, clear=True
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pooled = client
+
+    def _generate(self, prompt):
+        return self.client.post(
+            reverse('ai:generate-workflow'),
+            orjson.dumps({"prompt": prompt, "provider": "anthropic", "api_key": "key"}),
+            content_type="application/json",
+        )
+
+    def test_requests_share_one_client(self):
+        """Separate requests (each on its own event loop) reuse the pooled client."""
+        for prompt in ("first", "second"):
+            response = self._generate(prompt)
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertIs(views.get_http_client(views.ANTHROPIC_BASE_URL), self.pooled)
+        self.assertFalse(self.pooled.is_closed)
+
+
+# =============================================================================
+# OUTPUT BUDGET TESTS
+# =============================================================================
+
+class MaxOutputTokensTests(SimpleTestCase):
+    """Tests for the completion token budget."""
+
+    def test_budget_grows_with_canvas(self):
+        """Each existing node adds room on top of the base allowance."""
+        self.assertEqual(views.max_output_tokens(0), views.BASE_OUTPUT_TOKENS)
+        self.assertEqual(
+            views.max_output_tokens(10),
+            views.BASE_OUTPUT_TOKENS + 10 * views.OUTPUT_TOKENS_PER_EXISTING_NODE,
+        )
+
+    def test_budget_capped_at_model_output_limit(self):
+        """Large canvases never ask for more than 4096 output tokens."""
+        self.assertEqual(views.MAX_OUTPUT_TOKENS, 4096)
+        self.assertEqual(views.max_output_tokens(1000), 4096)
+
+
+# =============================================================================
+# REQUEST COALESCING TESTS
+# =============================================================================
+
+class CoalesceRequestTests(SimpleTestCase):
+    """Tests for sharing one provider call between identical requests."""
+
+    def setUp(self):
+        """Signal when a second caller joins an in-flight request."""
+        self.joined = threading.Event()
+        self.leader_started = threading.Event()
+        self.calls = []
+
+        def debug(message, *args):
+            if message.startswith("Joining"):
+                self.joined.set()
+
+        patcher = mock.patch.object(views.logger, 'debug', side_effect=debug)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _join_from_thread(self, provider_call, results):
+        """Call coalesce_request on its own event loop once the leader runs."""
+        def run():
+            self.leader_started.wait(5)
+            results.append(async_to_sync(views.coalesce_request)('key', provider_call))
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    def test_joiner_on_another_loop_shares_result(self):
+        """A request on a second thread's loop reuses the first one's reply."""
+        async def leader_call():
+            self.calls.append('leader')
+            self.leader_started.set()
+            await asyncio.to_thread(self.joined.wait, 5)
+            return {"message": "shared", "workflow": None}
+
+        async def joiner_call():
+            self.calls.append('joiner')
+            return {"message": "own", "workflow": None}
+
+        joined = []
+        thread = self._join_from_thread(joiner_call, joined)
+        result = async_to_sync(views.coalesce_request)('key', leader_call)
+        thread.join(5)
+
+        self.assertEqual(self.calls, ['leader'])
+        self.assertEqual(joined, [result])
+        self.assertIsNot(joined[0], result)
+        self.assertNotIn('key', views._INFLIGHT)
+
+    def test_leader_cancelled_joiner_runs_fresh(self):
+        """Cancelling the first request makes waiting callers call the provider."""
+        async def leader_call():
+            self.calls.append('leader')
+            self.leader_started.set()
+            await asyncio.sleep(10)
+
+        async def joiner_call():
+            self.calls.append('joiner')
+            return {"message": "fresh", "workflow": None}
+
+        async def cancel_leader():
+            task = asyncio.ensure_future(views.coalesce_request('key', leader_call))
+            await asyncio.to_thread(self.joined.wait, 5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        joined = []
+        thread = self._join_from_thread(joiner_call, joined)
+        async_to_sync(cancel_leader)()
+        thread.join(5)
+
+        self.assertEqual(self.calls, ['leader', 'joiner'])
+        self.assertEqual(joined, [{"message": "fresh", "workflow": None}])
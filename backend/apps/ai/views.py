@@ -5,212 +5,271 @@
 # Supports Anthropic, OpenAI, and Ollama (local) models.
 # =============================================================================
 
-import json
+import asyncio
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import importlib.util
 import logging
+import sys
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
 import httpx
-from typing import Any
+import orjson
+from asgiref.sync import sync_to_async
+from pydantic import ValidationError
 
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
+from .schemas import AIWorkflowResponse
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
-# NODE TYPE DEFINITIONS (for AI context)
+# SHARED HTTP CLIENTS
+# =============================================================================
+
+ANTHROPIC_BASE_URL = "https://api.anthropic.com"
+OPENAI_BASE_URL = "https://api.openai.com"
+
+# Keep connections warm between generations so repeat calls skip the
+# TCP + TLS handshake to the provider.
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=60,
+)
+
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``)
+_HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# One synchronous, thread-safe client per (base URL, timeout), shared by
+# every request. Under WSGI each async view runs on its own short-lived
+# event loop, so per-loop AsyncClients would never be reused; provider
+# calls run in worker threads (sync_to_async) against these instead.
+_HTTP_CLIENTS: dict[tuple[str, float], httpx.Client] = {}
+_HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+def get_http_client(base_url: str, timeout: float = 60.0) -> httpx.Client:
+    """
+    Return the pooled Client for ``base_url``.
+
+    Clients are created on first use and reused by every later request
+    in the process.
+    """
+    key = (base_url, timeout)
+    with _HTTP_CLIENTS_LOCK:
+        client = _HTTP_CLIENTS.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                base_url=base_url,
+                timeout=timeout,
+                limits=_HTTP_LIMITS,
+                http2=_HTTP2_ENABLED,
+            )
+            _HTTP_CLIENTS[key] = client
+        return client
+
+
+def close_http_clients() -> None:
+    """Close every pooled client."""
+    with _HTTP_CLIENTS_LOCK:
+        for client in _HTTP_CLIENTS.values():
+            client.close()
+        _HTTP_CLIENTS.clear()
+
+
+# =============================================================================
+# SYSTEM PROMPT
 # =============================================================================
 
-NODE_TYPES_CONTEXT = """
-Available node types for workflow generation:
-
-## CONFIGURATION NODES
-- credential_chainalysis: Configure Chainalysis API credentials. Outputs: credentials
-- credential_trm: Configure TRM Labs API credentials. Outputs: credentials
-
-## INPUT NODES
-- single_address: Enter a single cryptocurrency address. Config: address, blockchain. Outputs: address, blockchain
-- batch_input: Upload file with multiple addresses. Config: file, format, blockchain. Outputs: addresses, count, blockchain
-- transaction_hash: Enter a transaction hash. Config: tx_hash, blockchain. Outputs: tx_hash, blockchain
-- batch_transaction: Upload file with multiple transaction hashes. Outputs: tx_hashes, count, blockchain
-
-## CHAINALYSIS QUERY NODES (require address input)
-- chainalysis_cluster_info: Get cluster name, category, root address. Inputs: credentials (optional), address. Outputs: cluster_name, category, cluster_address, address
-- chainalysis_cluster_balance: Get balance and transfer stats. Inputs: credentials (optional), address. Outputs: balance, total_sent, total_received, transfer_count, address
-- chainalysis_cluster_counterparties: Get counterparty addresses. Inputs: credentials (optional), address. Outputs: counterparties, count, address
-- chainalysis_transaction_details: Get transaction details. Inputs: credentials (optional), tx_hash. Outputs: transaction_details, tx_hash, inputs, outputs, fee, block_height
-- chainalysis_exposure_category: Get risk category exposure. Inputs: credentials (optional), address. Outputs: direct_exposure, indirect_exposure, total_risk, high_risk_flags, address
-- chainalysis_exposure_service: Get service exposure. Inputs: credentials (optional), address. Outputs: direct_exposure, indirect_exposure, service_count, address
-
-## TRM LABS QUERY NODES (require address and blockchain inputs)
-- trm_address_attribution: Get entities for address. Inputs: credentials (optional), address, blockchain. Outputs: entities, entity_count, address
-- trm_total_exposure: Get total exposure analysis. Inputs: credentials (optional), address, blockchain. Outputs: exposures, total_volume, high_risk_entities, address
-- trm_address_summary: Get address metrics. Inputs: credentials (optional), address, blockchain. Outputs: metrics, address
-- trm_address_transfers: Get transfer list. Inputs: credentials (optional), address, blockchain. Outputs: transfers, transfer_count, total_volume_usd, address
-- trm_network_intelligence: Get network/IP data. Inputs: credentials (optional), address. Outputs: ip_data, address
-
-## OUTPUT NODES
-- excel_export: Export to Excel. Inputs: data. Outputs: file_path. Config: sheet_name
-- json_export: Export to JSON. Inputs: data. Outputs: file_path. Config: pretty_print
-- csv_export: Export to CSV. Inputs: data. Outputs: file_path
-- txt_export: Export to text. Inputs: data. Outputs: file_path
-- pdf_export: Generate PDF report. Inputs: data. Outputs: file_path. Config: report_title, include_graphs
-- console_log: Log to console. Inputs: data. Config: label, format
-- output_path: Set output file path. Inputs: file_path_input. Config: output_path
-
-## CONNECTION RULES
-- Connections go from output pins to input pins
-- address output connects to address input
-- blockchain output connects to blockchain input
-- credentials output connects to credentials input
-- data outputs (any query result) connect to data input on export nodes
-- file_path output connects to file_path_input on output_path node
-
-## LAYOUT GUIDELINES
-- Position nodes left-to-right: Input -> Query -> Output
-- Space nodes ~300px apart horizontally
-- Align related nodes vertically
-- Start input nodes around x=100
-- Query nodes around x=450
-- Output nodes around x=800
-"""
-
-SYSTEM_PROMPT = f"""You are an expert workflow designer for EasyCall, a blockchain investigation platform.
-
-Your job is to create workflow nodes and connections based on user requests.
-
-{NODE_TYPES_CONTEXT}
-
-When generating a workflow, respond with ONLY a JSON object (no markdown, no explanation before or after):
-
-{{
-    "message": "Brief description of what you created",
-    "workflow": {{
-        "nodes": [
-            {{
-                "id": "unique_id_1",
-                "type": "node_type_here",
-                "position": {{"x": 100, "y": 100}},
-                "data": {{
-                    "label": "Node Display Name",
-                    "configValues": {{}}
-                }}
-            }}
-        ],
-        "edges": [
-            {{
-                "id": "edge_1",
-                "source": "source_node_id",
-                "target": "target_node_id",
-                "sourceHandle": "output_pin_id",
-                "targetHandle": "input_pin_id"
-            }}
-        ]
-    }}
-}}
-
-Important rules:
-1. Use ONLY the node types listed above
-2. Always connect nodes properly (output -> input)
-3. Position nodes logically left-to-right
-4. Include all necessary nodes for a complete workflow
-5. Generate unique IDs for nodes and edges
-6. If adding to existing workflow, offset positions to avoid overlap
-7. Return ONLY valid JSON, no markdown code blocks
-"""
+# Node-type documentation and output format the model is instructed with
+PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
+
+
+@functools.cache
+def _system_prompt() -> str:
+    """Load the system prompt from disk on first use."""
+    return (PROMPTS_DIR / "system_prompt.txt").read_text(encoding="utf-8")
+
+
+@functools.cache
+def _anthropic_system_blocks() -> list[dict[str, Any]]:
+    """
+    Anthropic system block marked cacheable so the provider reuses the
+    prompt prefix across calls instead of re-processing it every request.
+    """
+    return [
+        {
+            "type": "text",
+            "text": _system_prompt(),
+            "cache_control": {"type": "ephemeral"},
+        },
+    ]
+
+
+@functools.cache
+def _ollama_prefix() -> str:
+    """Ollama takes a single flat prompt, so the static prefix is built once."""
+    return _system_prompt() + "\n\n"
+
+
+# Node types documented in the system prompt; anything else is a hallucination
+VALID_NODE_TYPES: frozenset[str] = frozenset(
+    sys.intern(node_type)
+    for node_type in (
+        # Configuration
+        "credential_chainalysis",
+        "credential_trm",
+        # Input
+        "single_address",
+        "batch_input",
+        "transaction_hash",
+        "batch_transaction",
+        # Chainalysis queries
+        "chainalysis_cluster_info",
+        "chainalysis_cluster_balance",
+        "chainalysis_cluster_counterparties",
+        "chainalysis_transaction_details",
+        "chainalysis_exposure_category",
+        "chainalysis_exposure_service",
+        # TRM Labs queries
+        "trm_address_attribution",
+        "trm_total_exposure",
+        "trm_address_summary",
+        "trm_address_transfers",
+        "trm_network_intelligence",
+        # Output
+        "excel_export",
+        "json_export",
+        "csv_export",
+        "txt_export",
+        "pdf_export",
+        "console_log",
+        "output_path",
+    )
+)
+
+# Speaker labels used when flattening chat history into an Ollama prompt
+_OLLAMA_ROLES: dict[str, str] = {"user": "User"}
+
+# Streamed Ollama output with no '{' after this many characters is abandoned
+OLLAMA_MAX_PREAMBLE_CHARS = 8 * 1024
+
+# Output budget: a fresh workflow fits comfortably in the base allowance and
+# each node already on the canvas adds room for offsets and extra wiring, up
+# to the 4096-token output limit of the models offered in the sidebar
+MAX_OUTPUT_TOKENS = 4096
+BASE_OUTPUT_TOKENS = 2048
+OUTPUT_TOKENS_PER_EXISTING_NODE = 64
+
+# The reply is a bare JSON object, so generation can stop at a new turn marker
+STOP_SEQUENCES = ["\n\nHuman:"]
+
+
+def max_output_tokens(existing_node_count: int) -> int:
+    """Scale the completion budget with the size of the current canvas."""
+    return min(
+        MAX_OUTPUT_TOKENS,
+        BASE_OUTPUT_TOKENS + OUTPUT_TOKENS_PER_EXISTING_NODE * existing_node_count,
+    )
 
 
 # =============================================================================
 # AI PROVIDER HANDLERS
 # =============================================================================
 
-async def call_anthropic(
+def call_anthropic(
     prompt: str,
     api_key: str,
     model: str,
     conversation_history: list,
+    existing_node_count: int = 0,
 ) -> dict[str, Any]:
     """Call Anthropic Claude API."""
 
-    messages = []
-    for msg in conversation_history:
-        messages.append({
-            "role": msg["role"],
-            "content": msg["content"],
-        })
-    messages.append({
-        "role": "user",
-        "content": prompt,
-    })
-
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            "https://api.anthropic.com/v1/messages",
-            headers={
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
-            json={
-                "model": model,
-                "max_tokens": 4096,
-                "system": SYSTEM_PROMPT,
-                "messages": messages,
-            },
-        )
-
-        if response.status_code != 200:
-            error_data = response.json()
-            raise Exception(f"Anthropic API error: {error_data.get('error', {}).get('message', 'Unknown error')}")
-
-        data = response.json()
-        content = data["content"][0]["text"]
-        return parse_ai_response(content)
-
-
-async def call_openai(
+    messages = [
+        {"role": msg["role"], "content": msg["content"]}
+        for msg in conversation_history
+    ]
+    messages.append({"role": "user", "content": prompt})
+
+    client = get_http_client(ANTHROPIC_BASE_URL)
+    response = client.post(
+        "/v1/messages",
+        headers={
+            "x-api-key": api_key,
+            "anthropic-version": "2023-06-01",
+            "anthropic-beta": "prompt-caching-2024-07-31",
+            "content-type": "application/json",
+        },
+        content=orjson.dumps({
+            "model": model,
+            "max_tokens": max_output_tokens(existing_node_count),
+            "stop_sequences": STOP_SEQUENCES,
+            "system": _anthropic_system_blocks(),
+            "messages": messages,
+        }),
+    )
+
+    if response.status_code != 200:
+        error_data = response.json()
+        raise Exception(f"Anthropic API error: {error_data.get('error', {}).get('message', 'Unknown error')}")
+
+    data = response.json()
+    content = data["content"][0]["text"]
+    return parse_ai_response(content)
+
+
+def call_openai(
     prompt: str,
     api_key: str,
     model: str,
     conversation_history: list,
+    existing_node_count: int = 0,
 ) -> dict[str, Any]:
     """Call OpenAI API."""
 
-    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-    for msg in conversation_history:
-        messages.append({
-            "role": msg["role"],
-            "content": msg["content"],
-        })
-    messages.append({
-        "role": "user",
-        "content": prompt,
-    })
-
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": messages,
-                "max_tokens": 4096,
-                "temperature": 0.7,
-            },
-        )
-
-        if response.status_code != 200:
-            error_data = response.json()
-            raise Exception(f"OpenAI API error: {error_data.get('error', {}).get('message', 'Unknown error')}")
-
-        data = response.json()
-        content = data["choices"][0]["message"]["content"]
-        return parse_ai_response(content)
-
-
-async def call_ollama(
+    # System message stays first so OpenAI's automatic prefix caching applies
+    messages = [
+        {"role": "system", "content": _system_prompt()},
+        *({"role": msg["role"], "content": msg["content"]} for msg in conversation_history),
+        {"role": "user", "content": prompt},
+    ]
+
+    client = get_http_client(OPENAI_BASE_URL)
+    response = client.post(
+        "/v1/chat/completions",
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+        content=orjson.dumps({
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_output_tokens(existing_node_count),
+            "stop": STOP_SEQUENCES,
+            "temperature": 0.7,
+        }),
+    )
+
+    if response.status_code != 200:
+        error_data = response.json()
+        raise Exception(f"OpenAI API error: {error_data.get('error', {}).get('message', 'Unknown error')}")
+
+    data = response.json()
+    content = data["choices"][0]["message"]["content"]
+    return parse_ai_response(content)
+
+
+def call_ollama(
     prompt: str,
     endpoint: str,
     model: str,
@@ -219,67 +278,153 @@ async def call_ollama(
     """Call Ollama local API."""
 
     # Build conversation context
-    context = SYSTEM_PROMPT + "\n\n"
-    for msg in conversation_history:
-        role = "User" if msg["role"] == "user" else "Assistant"
-        context += f"{role}: {msg['content']}\n\n"
-    context += f"User: {prompt}\n\nAssistant:"
-
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        response = await client.post(
-            f"{endpoint}/api/generate",
-            json={
-                "model": model,
-                "prompt": context,
-                "stream": False,
-            },
-        )
-
+    parts = [_ollama_prefix()]
+    parts.extend(
+        f"{_OLLAMA_ROLES.get(msg['role'], 'Assistant')}: {msg['content']}\n\n"
+        for msg in conversation_history
+    )
+    parts.append(f"User: {prompt}\n\nAssistant:")
+    context = "".join(parts)
+
+    # Stream NDJSON chunks so the reply is assembled while it is generated
+    client = get_http_client(endpoint.rstrip("/"), timeout=120.0)
+    chunks: list[str] = []
+    received = 0
+    seen_json = False
+
+    with client.stream(
+        "POST",
+        "/api/generate",
+        headers={"Content-Type": "application/json"},
+        content=orjson.dumps({
+            "model": model,
+            "prompt": context,
+            "stream": True,
+        }),
+    ) as response:
         if response.status_code != 200:
+            response.read()
             raise Exception(f"Ollama error: {response.text}")
 
-        data = response.json()
-        content = data.get("response", "")
-        return parse_ai_response(content)
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = orjson.loads(line)
+            if "error" in chunk:
+                raise Exception(f"Ollama error: {chunk['error']}")
+
+            text = chunk.get("response", "")
+            chunks.append(text)
+            received += len(text)
+            seen_json = seen_json or "{" in text
+
+            # Bail out early if the model is rambling instead of emitting JSON
+            if not seen_json and received > OLLAMA_MAX_PREAMBLE_CHARS:
+                logger.warning(
+                    "Ollama produced %d chars without JSON; aborting stream",
+                    received,
+                )
+                break
+
+            if chunk.get("done"):
+                break
+
+    return parse_ai_response("".join(chunks))
+
+
+def strip_code_fence(content: str) -> str:
+    """Remove a surrounding markdown code fence (```json ... ```) if present."""
+    return (
+        content.strip()
+        .removeprefix("```json")
+        .removeprefix("```")
+        .removesuffix("```")
+        .strip()
+    )
+
+
+def extract_json_object(content: str) -> str | None:
+    """
+    Return the first balanced ``{...}`` object embedded in ``content``.
+
+    Single linear scan that tracks brace depth while skipping braces inside
+    JSON strings, so malformed LLM output cannot trigger regex backtracking.
+    """
+    start = content.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(content)):
+        char = content[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return content[start:index + 1]
+
+    return None
+
+
+def validate_ai_response(json_text: str) -> dict[str, Any]:
+    """
+    Parse and validate a JSON workflow reply in a single pydantic-core pass.
+
+    Missing node ``data``/``configValues``/``label`` fields are filled in by
+    the schema defaults.
+
+    Raises:
+        ValidationError: If the text is not JSON or does not match the schema.
+    """
+    response = AIWorkflowResponse.model_validate_json(json_text)
+
+    if "workflow" not in response.model_fields_set:
+        return {
+            "message": "I've analyzed your request but couldn't generate a valid workflow. Please try rephrasing.",
+            "workflow": None,
+        }
+
+    return response.model_dump()
 
 
 def parse_ai_response(content: str) -> dict[str, Any]:
     """Parse AI response and extract JSON workflow."""
 
     # Clean up response - remove markdown code blocks if present
-    content = content.strip()
-    if content.startswith("```json"):
-        content = content[7:]
-    elif content.startswith("```"):
-        content = content[3:]
-    if content.endswith("```"):
-        content = content[:-3]
-    content = content.strip()
+    content = strip_code_fence(content)
 
     try:
-        result = json.loads(content)
+        return validate_ai_response(content)
 
-        # Validate structure
-        if "workflow" not in result:
-            result = {
-                "message": "I've analyzed your request but couldn't generate a valid workflow. Please try rephrasing.",
+    except ValidationError as e:
+        if not any(error["type"] == "json_invalid" for error in e.errors()):
+            logger.error(f"AI response did not match the workflow schema: {e}")
+            return {
+                "message": "I couldn't generate a valid workflow. Please try again.",
                 "workflow": None,
             }
 
-        return result
-
-    except json.JSONDecodeError as e:
         logger.error(f"Failed to parse AI response as JSON: {e}")
         logger.error(f"Response content: {content[:500]}")
 
         # Try to extract JSON from response
-        import re
-        json_match = re.search(r'\{[\s\S]*\}', content)
-        if json_match:
+        json_text = extract_json_object(content)
+        if json_text:
             try:
-                result = json.loads(json_match.group())
-                return result
-            except json.JSONDecodeError:
+                return validate_ai_response(json_text)
+            except ValidationError:
                 pass
 
         return {
@@ -288,13 +433,101 @@ def parse_ai_response(content: str) -> dict[str, Any]:
         }
 
 
+# =============================================================================
+# IN-FLIGHT REQUEST COALESCING
+# =============================================================================
+
+# Identical generations already waiting on a provider, keyed by request hash.
+# Thread-safe futures, since each request may run on its own event loop
+_INFLIGHT: dict[str, concurrent.futures.Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def build_request_key(
+    provider: str,
+    model: str,
+    credential: str,
+    prompt: str,
+    conversation_history: list,
+) -> str:
+    """
+    Hash everything that determines a provider reply into a compact key.
+
+    The credential is part of the key so callers using different API keys
+    (or Ollama endpoints) never share a response.
+    """
+    payload = orjson.dumps([provider, model, credential, prompt, conversation_history])
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+async def coalesce_request(
+    key: str,
+    provider_call: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """
+    Run ``provider_call`` once for all concurrent requests sharing ``key``.
+
+    The first caller performs the upstream request; callers arriving while it
+    is in flight await the same future (from whichever event loop they run
+    on) and receive a copy of its result. If the first caller is cancelled,
+    waiting callers run the request themselves.
+    """
+    with _INFLIGHT_LOCK:
+        pending = _INFLIGHT.get(key)
+        if pending is None:
+            future = _INFLIGHT[key] = concurrent.futures.Future()
+
+    if pending is not None:
+        logger.debug("Joining in-flight AI request %s", key)
+        try:
+            result = await asyncio.shield(asyncio.wrap_future(pending))
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise
+            logger.debug("In-flight AI request %s was cancelled; retrying", key)
+            return await coalesce_request(key, provider_call)
+        return copy.deepcopy(result)
+
+    try:
+        result = await provider_call()
+    except BaseException as exc:
+        # Unregister before resolving so late arrivals start a new call
+        # instead of joining a cancelled or failed one
+        _release_inflight(key, future)
+        if isinstance(exc, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(exc)
+        raise
+
+    _release_inflight(key, future)
+    future.set_result(result)
+    return result
+
+
+def _release_inflight(key: str, future: concurrent.futures.Future) -> None:
+    """Remove ``future`` from the in-flight map if it is still registered."""
+    with _INFLIGHT_LOCK:
+        if _INFLIGHT.get(key) is future:
+            del _INFLIGHT[key]
+
+
 # =============================================================================
 # API VIEW
 # =============================================================================
 
+def orjson_response(data: Any, status: int = 200) -> HttpResponse:
+    """Serialize ``data`` with orjson and wrap it in a JSON HttpResponse."""
+    return HttpResponse(
+        orjson.dumps(data, option=orjson.OPT_NAIVE_UTC),
+        status=status,
+        content_type="application/json",
+    )
+
+
 @csrf_exempt
 @require_POST
-def generate_workflow(request):
+async def generate_workflow(request):
     """
     Generate workflow nodes and edges from natural language.
 
@@ -311,11 +544,13 @@ def generate_workflow(request):
         "existing_nodes": [...],
         "existing_edges": [...]
     }
-    """
-    import asyncio
 
+    Provider calls run in worker threads over the shared, pooled provider
+    clients, so repeat generations reuse warm connections whether the view
+    is served under WSGI or ASGI.
+    """
     try:
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
 
         prompt = data.get("prompt", "").strip()
         provider = data.get("provider", "anthropic")
@@ -327,43 +562,61 @@ def generate_workflow(request):
         existing_edges = data.get("existing_edges", [])
 
         if not prompt:
-            return JsonResponse({"error": "Prompt is required"}, status=400)
+            return orjson_response({"error": "Prompt is required"}, status=400)
 
         # Add context about existing workflow if present
         if existing_nodes:
-            node_summary = ", ".join([f"{n.get('type', 'unknown')}" for n in existing_nodes[:10]])
+            node_summary = ", ".join(n.get("type", "unknown") for n in islice(existing_nodes, 10))
             prompt = f"{prompt}\n\n[Context: The canvas already has these nodes: {node_summary}. Position new nodes to avoid overlap, starting at x=100 + (existing node count * 350).]"
 
         # Call appropriate provider
         if provider == "anthropic":
             if not api_key:
-                return JsonResponse({"error": "API key required for Anthropic"}, status=400)
-            result = asyncio.run(call_anthropic(prompt, api_key, model, conversation_history))
+                return orjson_response({"error": "API key required for Anthropic"}, status=400)
+            credential = api_key
+            provider_call = functools.partial(
+                call_anthropic, prompt, api_key, model, conversation_history,
+                existing_node_count=len(existing_nodes),
+            )
 
         elif provider == "openai":
             if not api_key:
-                return JsonResponse({"error": "API key required for OpenAI"}, status=400)
-            result = asyncio.run(call_openai(prompt, api_key, model, conversation_history))
+                return orjson_response({"error": "API key required for OpenAI"}, status=400)
+            credential = api_key
+            provider_call = functools.partial(
+                call_openai, prompt, api_key, model, conversation_history,
+                existing_node_count=len(existing_nodes),
+            )
 
         elif provider == "ollama":
-            result = asyncio.run(call_ollama(prompt, offline_endpoint, model, conversation_history))
+            credential = offline_endpoint
+            provider_call = functools.partial(
+                call_ollama, prompt, offline_endpoint, model, conversation_history
+            )
 
         else:
-            return JsonResponse({"error": f"Unknown provider: {provider}"}, status=400)
+            return orjson_response({"error": f"Unknown provider: {provider}"}, status=400)
+
+        request_key = build_request_key(
+            provider, model, credential, prompt, conversation_history
+        )
+        result = await coalesce_request(
+            request_key, sync_to_async(provider_call, thread_sensitive=False)
+        )
 
-        # Post-process workflow nodes to ensure proper structure
+        # Node structure is guaranteed by the response schema; just flag
+        # node types the frontend will not recognise
         if result.get("workflow") and result["workflow"].get("nodes"):
             for node in result["workflow"]["nodes"]:
-                # Ensure data structure
-                if "data" not in node:
-                    node["data"] = {}
-                if "configValues" not in node["data"]:
-                    node["data"]["configValues"] = {}
-                if "label" not in node["data"]:
-                    node["data"]["label"] = node.get("type", "Unknown Node")
+                if node["type"] not in VALID_NODE_TYPES:
+                    logger.warning(
+                        "AI generated unknown node type %r (node %s)",
+                        node["type"],
+                        node["id"],
+                    )
 
-        return JsonResponse(result)
+        return orjson_response(result)
 
     except Exception as e:
         logger.exception("Error generating workflow")
-        return JsonResponse({"error": str(e)}, status=500)
+        return orjson_response({"error": str(e)}, status=500)
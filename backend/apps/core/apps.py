@@ -7,7 +7,13 @@
 Core application configuration.
 """
 
+import logging
+from pathlib import Path
+
 from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
 
 
 class CoreConfig(AppConfig):
@@ -15,4 +21,19 @@ class CoreConfig(AppConfig):
 
     default_auto_field: str = "django.db.models.BigAutoField"
     name: str = "apps.core"
-    verbose_name: str = "Core"
\ No newline at end of file
+    verbose_name: str = "Core"
+
+    def ready(self) -> None:
+        """
+        Register signal handlers once the app registry is loaded.
+
+        Also creates the media directory once per process so health
+        checks only need to test that it is writable.
+        """
+        from apps.core import signals  # noqa: F401
+
+        try:
+            Path(settings.MEDIA_ROOT).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            # Surfaced by the detailed health check rather than at startup
+            logger.warning("Could not create media directory: %s", e)
\ No newline at end of file
@@ -73,7 +73,9 @@ class EasyCallException(APIException):
 
         # Log the exception
         logger.error(
-            f"{self.__class__.__name__}: {self.detail}",
+            "%s: %s",
+            self.__class__.__name__,
+            self.detail,
             extra={"code": self.code, "params": self.params}
         )
 
@@ -277,7 +279,9 @@ def custom_exception_handler(
 
     # Log the exception
     logger.error(
-        f"Exception in {view.__class__.__name__ if view else 'unknown'}: {exc}",
+        "Exception in %s: %s",
+        view.__class__.__name__ if view else "unknown",
+        exc,
         extra={
             "exception_type": exc.__class__.__name__,
             "path": request.path if request else None,
@@ -0,0 +1,167 @@
+# =============================================================================
+# FILE: easycall/backend/apps/core/fields.py
+# =============================================================================
+# Custom model fields shared across the application.
+# =============================================================================
+"""
+Custom model fields for the EasyCall application.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import logging
+import uuid
+from typing import Any, Callable, Optional
+
+from django.db import migrations, models
+
+# =============================================================================
+# LOGGER
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# BINARY UUID FIELD
+# =============================================================================
+
+# Column types for backends without a native UUID type. Django's own
+# UUIDField stores char(32) there: twice the bytes per key and index entry.
+BINARY_UUID_DB_TYPES: dict[str, str] = {
+    "sqlite": "blob",
+    "mysql": "binary(16)",
+}
+
+
+class BinaryUUIDField(models.UUIDField):
+    """
+    UUIDField stored as 16 raw bytes on SQLite and MySQL.
+
+    PostgreSQL keeps its native uuid column. Python code always sees
+    uuid.UUID values; the packing happens at the database boundary, and
+    foreign keys pointing at this field inherit the same column type.
+    """
+
+    def get_internal_type(self) -> str:
+        # Keeps the backend's text-UUID converter off the read path
+        return "BinaryUUIDField"
+
+    def db_type(self, connection) -> Optional[str]:
+        """Return the column type for the given backend."""
+        if connection.vendor in BINARY_UUID_DB_TYPES:
+            return BINARY_UUID_DB_TYPES[connection.vendor]
+        if connection.vendor == "postgresql":
+            return "uuid"
+        return connection.data_types["UUIDField"] % self.db_type_parameters(
+            connection
+        )
+
+    def rel_db_type(self, connection) -> Optional[str]:
+        """Foreign keys use the same column type as the target."""
+        return self.db_type(connection)
+
+    def get_db_prep_value(
+        self, value: Any, connection, prepared: bool = False
+    ) -> Any:
+        """Pack UUIDs to bytes on binary backends."""
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = self.to_python(value)
+        if connection.vendor in BINARY_UUID_DB_TYPES:
+            return value.bytes
+        if connection.features.has_native_uuid_field:
+            return value
+        return value.hex
+
+    def from_db_value(self, value: Any, expression, connection) -> Any:
+        """Unpack database values back into uuid.UUID."""
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return uuid.UUID(bytes=bytes(value))
+        return self.to_python(value)
+
+
+# =============================================================================
+# MIGRATION HELPERS
+# =============================================================================
+
+
+def _uuid_columns(model) -> list[tuple[str, str]]:
+    """List (table, column) pairs holding a model's primary key UUIDs."""
+    pk = model._meta.pk
+    columns = [(model._meta.db_table, pk.column)]
+    for relation in model._meta.related_objects:
+        if relation.many_to_many:
+            continue
+        if relation.field.target_field.name == pk.name:
+            columns.append(
+                (relation.related_model._meta.db_table, relation.field.column)
+            )
+    return columns
+
+
+def _rewrite_uuid_columns(
+    app_label: str,
+    model_name: str,
+    convert: Callable[[Any], Any],
+) -> Callable:
+    """Build a RunPython callable that rewrites stored UUID values."""
+
+    def operation(apps, schema_editor) -> None:
+        connection = schema_editor.connection
+        if connection.vendor != "sqlite":
+            return
+
+        model = apps.get_model(app_label, model_name)
+        quote = schema_editor.quote_name
+        with connection.cursor() as cursor:
+            for table, column in _uuid_columns(model):
+                cursor.execute(
+                    f"SELECT DISTINCT {quote(column)} FROM {quote(table)} "
+                    f"WHERE {quote(column)} IS NOT NULL"
+                )
+                for (value,) in cursor.fetchall():
+                    converted = convert(value)
+                    if converted == value:
+                        continue
+                    cursor.execute(
+                        f"UPDATE {quote(table)} SET {quote(column)} = %s "
+                        f"WHERE {quote(column)} = %s",
+                        [converted, value],
+                    )
+        logger.info("Rewrote UUID storage for %s.%s", app_label, model_name)
+
+    return operation
+
+
+def _to_bytes(value: Any) -> Any:
+    return uuid.UUID(value).bytes if isinstance(value, str) else value
+
+
+def _to_hex(value: Any) -> Any:
+    return uuid.UUID(bytes=bytes(value)).hex if isinstance(value, bytes) else value
+
+
+def convert_uuid_storage(app_label: str, model_name: str) -> migrations.RunPython:
+    """
+    Migration operation that repacks a model's UUID keys as bytes.
+
+    Altering the column type on SQLite copies the existing char(32)
+    values verbatim, so the primary key and every foreign key column
+    pointing at it are rewritten in the same migration. Reversible.
+
+    Args:
+        app_label: App containing the model.
+        model_name: Model whose primary key is a BinaryUUIDField.
+
+    Returns:
+        RunPython operation to append after the AlterField.
+    """
+    return migrations.RunPython(
+        _rewrite_uuid_columns(app_label, model_name, _to_bytes),
+        _rewrite_uuid_columns(app_label, model_name, _to_hex),
+    )
@@ -5,6 +5,13 @@
 #
 # All application models should inherit from these base classes to ensure
 # consistent behavior across the application.
+#
+# Choosing a base class:
+# - BaseModelInt: the default for new tables. 8-byte BigAutoField primary
+#   key (small PK/FK indexes, fast joins) plus a unique UUID column for
+#   anything exposed outside the database.
+# - BaseModel: UUID primary key. Use only when IDs must be generated
+#   outside the database (e.g. by clients working offline).
 # =============================================================================
 """
 Base model classes for the EasyCall application.
@@ -15,12 +22,16 @@ Base model classes for the EasyCall application.
 # =============================================================================
 
 import logging
-import uuid
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
+from uuid import UUID
 
 from django.db import models
 from django.utils import timezone
 
+from apps.core.fields import BinaryUUIDField
+from apps.core.signals import active_state_changed
 from fields.names import (
     FIELD_CREATED_AT,
     FIELD_IS_ACTIVE,
@@ -28,6 +39,7 @@ from fields.names import (
     FIELD_UUID,
     get_verbose_name,
 )
+from utils.helpers import uuid7
 
 # =============================================================================
 # LOGGER
@@ -35,6 +47,44 @@ from fields.names import (
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# SHARED INDEXES
+# =============================================================================
+
+# Serves the common "active rows, newest first" listing in one index scan
+# (ActiveManager filter + "-created_at" ordering). Concrete models that
+# declare their own Meta should subclass BaseModel.Meta and include it.
+ACTIVE_CREATED_INDEX = models.Index(
+    fields=["is_active", "-created_at"],
+    name="%(class)s_active_created",
+)
+
+# =============================================================================
+# SERIALIZATION SHAPES
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class BaseModelDTO:
+    """
+    Immutable snapshot of the common BaseModel fields.
+
+    orjson serializes slotted dataclasses directly, so lists of these
+    render to JSON without building an intermediate dict per row.
+
+    Attributes:
+        uuid: Public identifier of the record.
+        created_at: Timestamp when the record was created.
+        updated_at: Timestamp when the record was last updated.
+        is_active: Whether the record is active (not soft-deleted).
+    """
+
+    uuid: UUID
+    created_at: datetime
+    updated_at: datetime
+    is_active: bool
+
+
 # =============================================================================
 # ABSTRACT BASE MODELS
 # =============================================================================
@@ -55,7 +105,6 @@ class TimeStampedModel(models.Model):
     created_at = models.DateTimeField(
         verbose_name=get_verbose_name(FIELD_CREATED_AT),
         auto_now_add=True,
-        db_index=True,
         help_text="Timestamp when this record was created.",
     )
 
@@ -76,8 +125,11 @@ class TimeStampedModel(models.Model):
         This is useful when you want to mark a record as updated
         without changing any other data.
         """
+        # Single UPDATE: skips save() signals and the full-row write
         self.updated_at = timezone.now()
-        self.save(update_fields=["updated_at"])
+        type(self)._base_manager.filter(pk=self.pk).update(
+            updated_at=self.updated_at
+        )
 
 
 class UUIDModel(models.Model):
@@ -86,15 +138,18 @@ class UUIDModel(models.Model):
 
     Uses UUID instead of auto-incrementing integer for the primary key.
     This is useful for distributed systems and provides better URL security.
+    Keys are time-ordered UUID7 values, so new rows append to the end of
+    the primary key index rather than scattering across it, and are
+    stored as 16 raw bytes rather than 32 hex characters on SQLite.
 
     Attributes:
         uuid: UUID primary key for the record.
     """
 
-    uuid = models.UUIDField(
+    uuid = BinaryUUIDField(
         verbose_name=get_verbose_name(FIELD_UUID),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         help_text="Unique identifier for this record.",
     )
@@ -112,41 +167,119 @@ class ActiveModel(models.Model):
 
     Attributes:
         is_active: Whether the record is active (not soft-deleted).
+        SOFT_DELETE_ENABLED: Set to False on a subclass to make
+            ActiveManager skip the is_active filter.
     """
 
+    SOFT_DELETE_ENABLED: bool = True
+
     is_active = models.BooleanField(
         verbose_name=get_verbose_name(FIELD_IS_ACTIVE),
         default=True,
-        db_index=True,
         help_text="Whether this record is active.",
     )
 
     class Meta:
         abstract = True
 
+    @classmethod
+    def _active_update_values(cls, is_active: bool) -> dict[str, Any]:
+        """
+        Build the UPDATE values for flipping is_active.
+
+        Models that also carry updated_at get it bumped in the same
+        statement, since QuerySet.update() bypasses auto_now.
+        """
+        values: dict[str, Any] = {"is_active": is_active}
+        if any(f.name == "updated_at" for f in cls._meta.concrete_fields):
+            values["updated_at"] = timezone.now()
+        return values
+
+    @classmethod
+    def _send_active_state_changed(cls, is_active: bool, count: int) -> None:
+        """
+        Notify listeners that UPDATE-based soft delete/restore changed rows.
+
+        Args:
+            is_active: The value is_active was set to.
+            count: The number of rows changed; nothing is sent for zero.
+        """
+        if count:
+            active_state_changed.send(sender=cls, is_active=is_active, count=count)
+
     def soft_delete(self) -> None:
         """
         Mark the record as inactive (soft delete).
 
         This sets is_active to False instead of deleting the record.
+        Issues a single UPDATE and sends active_state_changed instead of
+        save signals.
         """
         logger.info(
-            f"Soft deleting {self.__class__.__name__} with pk={self.pk}"
+            "Soft deleting %s with pk=%s", self.__class__.__name__, self.pk
         )
-        self.is_active = False
-        self.save(update_fields=["is_active"])
+        values = self._active_update_values(False)
+        updated = type(self)._base_manager.filter(
+            pk=self.pk, is_active=True
+        ).update(**values)
+        for field, value in values.items():
+            setattr(self, field, value)
+        type(self)._send_active_state_changed(False, updated)
 
     def restore(self) -> None:
         """
         Restore a soft-deleted record.
 
         This sets is_active back to True.
+        Issues a single UPDATE and sends active_state_changed instead of
+        save signals.
         """
         logger.info(
-            f"Restoring {self.__class__.__name__} with pk={self.pk}"
+            "Restoring %s with pk=%s", self.__class__.__name__, self.pk
+        )
+        values = self._active_update_values(True)
+        updated = type(self)._base_manager.filter(
+            pk=self.pk, is_active=False
+        ).update(**values)
+        for field, value in values.items():
+            setattr(self, field, value)
+        type(self)._send_active_state_changed(True, updated)
+
+    @classmethod
+    def bulk_soft_delete(cls, queryset: models.QuerySet) -> int:
+        """
+        Soft delete every record in a queryset with one UPDATE.
+
+        Args:
+            queryset: Records of this model to deactivate.
+
+        Returns:
+            The number of rows changed.
+        """
+        updated = queryset.filter(is_active=True).update(
+            **cls._active_update_values(False)
         )
-        self.is_active = True
-        self.save(update_fields=["is_active"])
+        logger.info("Soft deleted %d %s record(s)", updated, cls.__name__)
+        cls._send_active_state_changed(False, updated)
+        return updated
+
+    @classmethod
+    def bulk_restore(cls, queryset: models.QuerySet) -> int:
+        """
+        Restore every soft-deleted record in a queryset with one UPDATE.
+
+        Args:
+            queryset: Records of this model to reactivate.
+
+        Returns:
+            The number of rows changed.
+        """
+        updated = queryset.filter(is_active=False).update(
+            **cls._active_update_values(True)
+        )
+        logger.info("Restored %d %s record(s)", updated, cls.__name__)
+        cls._send_active_state_changed(True, updated)
+        return updated
 
 
 class BaseModel(UUIDModel, TimeStampedModel, ActiveModel):
@@ -169,6 +302,80 @@ class BaseModel(UUIDModel, TimeStampedModel, ActiveModel):
     class Meta:
         abstract = True
         ordering = ["-created_at"]
+        indexes = [ACTIVE_CREATED_INDEX]
+
+    def __str__(self) -> str:
+        """
+        Return string representation of the model.
+
+        Returns:
+            A string in the format "ClassName (uuid)".
+        """
+        return f"{self.__class__.__name__} ({self.uuid})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the model instance to a dictionary.
+
+        UUID and datetime values are returned as-is; the ORJSON renderer
+        formats them when the response is written.
+
+        Returns:
+            Dictionary representation of the model's fields.
+        """
+        return {
+            "uuid": self.uuid,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "is_active": self.is_active,
+        }
+
+    def to_dto(self) -> BaseModelDTO:
+        """
+        Convert the common fields to a lightweight serialization object.
+
+        Returns:
+            BaseModelDTO for this record.
+        """
+        return BaseModelDTO(
+            uuid=self.uuid,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            is_active=self.is_active,
+        )
+
+
+class BaseModelInt(TimeStampedModel, ActiveModel):
+    """
+    Base model with an integer primary key and a separate external UUID.
+
+    Same timestamps and soft-delete behaviour as BaseModel, but the primary
+    key is a BigAutoField so the PK and every foreign key pointing at it
+    take 8 bytes instead of 16. The ``uuid`` column (time-ordered UUID7,
+    unique and indexed) is what APIs and URLs should expose.
+
+    Attributes:
+        id: Auto-incrementing 64-bit primary key (internal use only).
+        uuid: Unique external identifier for the record.
+        created_at: Timestamp when the record was created.
+        updated_at: Timestamp when the record was last updated.
+        is_active: Whether the record is active (not soft-deleted).
+    """
+
+    id = models.BigAutoField(primary_key=True)
+
+    uuid = BinaryUUIDField(
+        verbose_name=get_verbose_name(FIELD_UUID),
+        default=uuid7,
+        unique=True,
+        editable=False,
+        help_text="Unique external identifier for this record.",
+    )
+
+    class Meta:
+        abstract = True
+        ordering = ["-created_at"]
+        indexes = [ACTIVE_CREATED_INDEX]
 
     def __str__(self) -> str:
         """
@@ -183,16 +390,34 @@ class BaseModel(UUIDModel, TimeStampedModel, ActiveModel):
         """
         Convert the model instance to a dictionary.
 
+        The integer primary key is internal and is not included. UUID
+        and datetime values are returned as-is; the ORJSON renderer
+        formats them when the response is written.
+
         Returns:
             Dictionary representation of the model's fields.
         """
         return {
-            "uuid": str(self.uuid),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "uuid": self.uuid,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
             "is_active": self.is_active,
         }
 
+    def to_dto(self) -> BaseModelDTO:
+        """
+        Convert the common fields to a lightweight serialization object.
+
+        Returns:
+            BaseModelDTO for this record.
+        """
+        return BaseModelDTO(
+            uuid=self.uuid,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            is_active=self.is_active,
+        )
+
 
 # =============================================================================
 # MANAGER CLASSES
@@ -216,13 +441,68 @@ class ActiveManager(models.Manager):
 
         # All records including inactive
         MyModel.all_objects.all()
+        MyModel.objects.with_inactive()
     """
 
     def get_queryset(self) -> models.QuerySet:
         """
         Return queryset filtered to active records only.
 
+        Models that set SOFT_DELETE_ENABLED = False get an unfiltered
+        queryset, so no redundant is_active predicate is added.
+
         Returns:
             QuerySet with is_active=True filter applied.
         """
-        return super().get_queryset().filter(is_active=True)
\ No newline at end of file
+        queryset = super().get_queryset()
+        if getattr(self.model, "SOFT_DELETE_ENABLED", True):
+            return queryset.filter(is_active=True)
+        return queryset
+
+    def with_inactive(self) -> models.QuerySet:
+        """
+        Return all records, including soft-deleted ones.
+
+        Returns:
+            Unfiltered QuerySet for the model.
+        """
+        return super().get_queryset()
+
+
+class BaseModelManager(ActiveManager):
+    """
+    Active-records manager that also applies default related loading.
+
+    Subclasses list the relations their list views always touch, so
+    every queryset joins or prefetches them instead of issuing one
+    query per row.
+
+    Example:
+        class ExecutionLogManager(BaseModelManager):
+            related_select = ("workflow",)
+
+        class ExecutionLog(BaseModel):
+            objects = ExecutionLogManager()
+
+    Attributes:
+        related_select: Forward FK/one-to-one paths for select_related().
+        related_prefetch: Reverse or many-to-many paths for
+            prefetch_related().
+    """
+
+    related_select: tuple[str, ...] = ()
+    related_prefetch: tuple[str, ...] = ()
+
+    def get_queryset(self) -> models.QuerySet:
+        """
+        Return active records with the configured relations preloaded.
+
+        Returns:
+            QuerySet with select_related/prefetch_related applied.
+        """
+        queryset = super().get_queryset()
+        if self.related_select:
+            queryset = queryset.select_related(*self.related_select)
+        if self.related_prefetch:
+            queryset = queryset.prefetch_related(*self.related_prefetch)
+        return queryset
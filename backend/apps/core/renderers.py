@@ -0,0 +1,89 @@
+# =============================================================================
+# FILE: easycall/backend/apps/core/renderers.py
+# =============================================================================
+# DRF renderers shared across the application.
+# =============================================================================
+"""
+Response renderers for the EasyCall API.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from typing import Any, Mapping, Optional
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# datetime, UUID, dataclasses and numpy arrays are handled natively;
+# naive datetimes are emitted as-is and aware UTC ones end in "Z"
+ORJSON_OPTIONS: int = (
+    orjson.OPT_UTC_Z
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_SERIALIZE_NUMPY
+)
+
+# Fallback for types orjson does not know (Decimal, lazy translation
+# strings, QuerySets, timedelta, ...), matching DRF's own JSON output
+_drf_encoder = JSONEncoder()
+
+# =============================================================================
+# RENDERERS
+# =============================================================================
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Drop-in replacement for rest_framework.renderers.JSONRenderer that
+    serializes in native code. Indented output is produced when a
+    client or the browsable API asks for it.
+    """
+
+    media_type: str = "application/json"
+    format: str = "json"
+    charset: Optional[str] = None
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        """
+        Serialize data to JSON bytes.
+
+        Args:
+            data: The response data.
+            accepted_media_type: Negotiated media type, may carry an
+                "indent" parameter.
+            renderer_context: Context passed by the view.
+
+        Returns:
+            Encoded JSON, or empty bytes when data is None.
+        """
+        if data is None:
+            return b""
+
+        options = ORJSON_OPTIONS
+        if self._wants_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=_drf_encoder.default, option=options)
+
+    @staticmethod
+    def _wants_indent(
+        accepted_media_type: Optional[str],
+        renderer_context: Mapping[str, Any],
+    ) -> bool:
+        """Return True if pretty-printed output was requested."""
+        if renderer_context.get("indent"):
+            return True
+        return bool(accepted_media_type and "indent=" in accepted_media_type)
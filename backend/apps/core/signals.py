@@ -0,0 +1,69 @@
+# =============================================================================
+# FILE: easycall/backend/apps/core/signals.py
+# =============================================================================
+# Signal handlers shared across the application.
+# =============================================================================
+"""
+Signal handlers for the core application.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import logging
+
+from django.db.backends.signals import connection_created
+from django.dispatch import Signal, receiver
+
+# =============================================================================
+# LOGGER
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# SOFT DELETE
+# =============================================================================
+
+# Sent by ActiveModel.soft_delete/restore and bulk_soft_delete/bulk_restore.
+# Those flip is_active with QuerySet.update(), which sends no save or
+# delete signals, so caches keyed on active records listen for this instead.
+# Arguments: sender (model class), is_active (new value), count (rows changed)
+active_state_changed = Signal()
+
+# =============================================================================
+# SQLITE TUNING
+# =============================================================================
+
+# Applied to every new SQLite connection:
+# - WAL lets readers proceed while a single writer commits
+# - synchronous=NORMAL is safe under WAL and avoids an fsync per commit
+# - temp tables, mmap and a 64 MB page cache keep hot pages in memory
+SQLITE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+)
+
+
+@receiver(connection_created)
+def configure_sqlite_connection(sender, connection, **kwargs) -> None:
+    """
+    Apply performance PRAGMAs when Django opens a SQLite connection.
+
+    Args:
+        sender: The database wrapper class.
+        connection: The newly created database connection wrapper.
+        **kwargs: Additional signal arguments.
+    """
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+
+    logger.debug("Applied SQLite PRAGMAs to connection '%s'", connection.alias)
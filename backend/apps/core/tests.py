@@ -0,0 +1,141 @@
+"""
+Core Tests
+Unit tests for the abstract base models.
+"""
+
+import datetime
+import decimal
+import uuid
+
+from django.db import connection
+from django.test import TestCase
+
+from apps.core.models import BaseModelManager
+from apps.core.renderers import ORJSONRenderer
+from apps.execution.models import ExecutionLog
+from apps.workflows.models import Workflow
+
+
+class SoftDeleteTests(TestCase):
+    """Test soft delete and restore on BaseModel subclasses."""
+
+    def setUp(self):
+        """Create sample workflows."""
+        self.workflow = Workflow.objects.create(name="Workflow A")
+        Workflow.objects.create(name="Workflow B")
+
+    def test_soft_delete_single_query(self):
+        """soft_delete issues one UPDATE and syncs the instance."""
+        before = self.workflow.updated_at
+
+        with self.assertNumQueries(1):
+            self.workflow.soft_delete()
+
+        self.assertFalse(self.workflow.is_active)
+        self.workflow.refresh_from_db()
+        self.assertFalse(self.workflow.is_active)
+        self.assertGreaterEqual(self.workflow.updated_at, before)
+
+    def test_restore(self):
+        """restore reactivates a soft-deleted record."""
+        self.workflow.soft_delete()
+        self.workflow.restore()
+
+        self.workflow.refresh_from_db()
+        self.assertTrue(self.workflow.is_active)
+
+    def test_bulk_soft_delete_and_restore(self):
+        """Bulk helpers update all matching rows in one query."""
+        with self.assertNumQueries(1):
+            deleted = Workflow.bulk_soft_delete(Workflow.objects.all())
+
+        self.assertEqual(deleted, 2)
+        self.assertFalse(Workflow.objects.filter(is_active=True).exists())
+
+        restored = Workflow.bulk_restore(Workflow.objects.all())
+        self.assertEqual(restored, 2)
+
+
+class BaseModelManagerTests(TestCase):
+    """Test default related loading on BaseModelManager subclasses."""
+
+    def setUp(self):
+        """Create runs for two workflows, one of them soft-deleted."""
+        for name in ("Workflow A", "Workflow B"):
+            workflow = Workflow.objects.create(name=name)
+            log = ExecutionLog.objects.create(workflow=workflow)
+        log.soft_delete()
+
+    @staticmethod
+    def _manager(model, **related):
+        """Build a BaseModelManager subclass bound to a model."""
+        manager = type("Manager", (BaseModelManager,), related)()
+        manager.model = model
+        return manager
+
+    def test_related_select(self):
+        """Forward relations are joined and inactive rows are excluded."""
+        manager = self._manager(ExecutionLog, related_select=("workflow",))
+
+        with self.assertNumQueries(1):
+            names = [log.workflow.name for log in manager.all()]
+
+        self.assertEqual(names, ["Workflow A"])
+
+    def test_related_prefetch(self):
+        """Reverse relations are prefetched in one extra query."""
+        manager = self._manager(Workflow, related_prefetch=("executions",))
+
+        with self.assertNumQueries(2):
+            counts = [len(workflow.executions.all()) for workflow in manager.all()]
+
+        self.assertEqual(counts, [1, 1])
+
+
+class BinaryUUIDFieldTests(TestCase):
+    """Test UUID primary keys stored as raw bytes."""
+
+    def test_round_trip_and_storage_size(self):
+        """UUIDs are stored in 16 bytes and read back as uuid.UUID."""
+        workflow = Workflow.objects.create(name="Workflow A")
+
+        fetched = Workflow.objects.get(uuid=str(workflow.uuid))
+        self.assertEqual(fetched.uuid, workflow.uuid)
+        self.assertIsInstance(fetched.uuid, uuid.UUID)
+
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT length(uuid) FROM workflows")
+                self.assertEqual(cursor.fetchone()[0], 16)
+
+
+class ORJSONRendererTests(TestCase):
+    """Test the project-wide JSON renderer."""
+
+    def test_renders_native_types(self):
+        """UUIDs, aware datetimes and Decimals serialize like DRF's output."""
+        value = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        when = datetime.datetime(2024, 1, 15, 10, 30, tzinfo=datetime.timezone.utc)
+
+        body = ORJSONRenderer().render(
+            {"uuid": value, "at": when, "amount": decimal.Decimal("1.5")}
+        )
+
+        self.assertEqual(
+            body,
+            b'{"uuid":"12345678-1234-5678-1234-567812345678",'
+            b'"at":"2024-01-15T10:30:00Z","amount":1.5}',
+        )
+
+    def test_renders_none_as_empty_body(self):
+        """A None payload renders as an empty body."""
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_renders_model_dtos(self):
+        """BaseModel.to_dto() output renders without an intermediate dict."""
+        workflow = Workflow.objects.create(name="Workflow A")
+
+        body = ORJSONRenderer().render([workflow.to_dto()])
+
+        self.assertIn(str(workflow.uuid).encode(), body)
+        self.assertIn(b'"is_active":true', body)
@@ -12,15 +12,23 @@ Core views for the EasyCall application.
 # IMPORTS
 # =============================================================================
 
+import functools
 import logging
+import os
 import platform
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Any, Dict
 
 import django
+import orjson
 from django.conf import settings
+from django.core.cache import cache
 from django.db import connection
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
@@ -33,19 +41,118 @@ from rest_framework.response import Response
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Bursts of probes share one successful "SELECT 1" within this window
+HEALTH_DB_CACHE_KEY = "health:db"
+HEALTH_DB_CACHE_TIMEOUT = 5  # seconds
+
+PING_RESPONSE_BODY = b'{"message":"pong"}'
+
+# =============================================================================
+# HEALTH CHECK HELPERS
+# =============================================================================
+
+
+@functools.lru_cache(maxsize=1)
+def _format_utc_second(epoch_second: int) -> str:
+    """
+    Format a whole epoch second as an ISO 8601 UTC string.
+
+    Args:
+        epoch_second: Seconds since the Unix epoch.
+
+    Returns:
+        Timestamp such as "2024-01-15T10:30:00Z".
+    """
+    return (
+        datetime.fromtimestamp(epoch_second, tz=timezone.utc)
+        .isoformat()
+        .replace("+00:00", "Z")
+    )
+
+
+def _utc_timestamp() -> str:
+    """
+    Return the current UTC time for health responses.
+
+    Second precision is enough for probes, so the formatted string is
+    reused for every request within the same second.
+
+    Returns:
+        Current timestamp as an ISO 8601 UTC string.
+    """
+    return _format_utc_second(int(time.time()))
+
+
+@functools.lru_cache(maxsize=1)
+def _health_payload(epoch_second: int) -> bytes:
+    """
+    Build the basic health check body for a given second.
+
+    Args:
+        epoch_second: Seconds since the Unix epoch.
+
+    Returns:
+        Encoded JSON body shared by all probes within that second.
+    """
+    return orjson.dumps(
+        {"status": "healthy", "timestamp": _format_utc_second(epoch_second)}
+    )
+
+
+def _check_database() -> Dict[str, Any]:
+    """
+    Probe database connectivity, reusing a recent successful result.
+
+    Only healthy results are cached so a failing database is re-checked
+    on every request.
+
+    Returns:
+        Component status dictionary for the database.
+    """
+    cached = cache.get(HEALTH_DB_CACHE_KEY)
+    if cached is not None:
+        return cached
+
+    try:
+        start_time = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        latency = (time.perf_counter() - start_time) * 1000.0
+    except Exception as e:
+        logger.error("Database health check failed: %s", e)
+        return {
+            "status": "unhealthy",
+            "error": str(e),
+        }
+
+    result = {
+        "status": "healthy",
+        "latency_ms": round(latency, 2),
+    }
+    cache.set(HEALTH_DB_CACHE_KEY, result, timeout=HEALTH_DB_CACHE_TIMEOUT)
+    return result
+
+
 # =============================================================================
 # HEALTH CHECK VIEWS
 # =============================================================================
 
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def health_check(request: Request) -> Response:
+@require_GET
+@never_cache
+def health_check(request: HttpRequest) -> HttpResponse:
     """
     Basic health check endpoint.
 
     Returns a simple response indicating the API is running.
     This endpoint is useful for load balancers and monitoring systems.
+    Served as a plain Django view to keep DRF negotiation, permission
+    and renderer overhead off the probe path.
 
     Args:
         request: The HTTP request object.
@@ -56,17 +163,14 @@ def health_check(request: Request) -> Response:
     Example Response:
         {
             "status": "healthy",
-            "timestamp": "2024-01-15T10:30:00.000Z"
+            "timestamp": "2024-01-15T10:30:00Z"
         }
     """
     logger.debug("Health check requested")
 
-    return Response(
-        {
-            "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-        },
-        status=status.HTTP_200_OK
+    return HttpResponse(
+        _health_payload(int(time.time())),
+        content_type="application/json",
     )
 
 
@@ -90,7 +194,7 @@ def detailed_health_check(request: Request) -> Response:
     Example Response:
         {
             "status": "healthy",
-            "timestamp": "2024-01-15T10:30:00.000Z",
+            "timestamp": "2024-01-15T10:30:00Z",
             "components": {
                 "database": {"status": "healthy", "latency_ms": 5},
                 "filesystem": {"status": "healthy"},
@@ -103,48 +207,28 @@ def detailed_health_check(request: Request) -> Response:
     overall_status = "healthy"
 
     # Check database connectivity
-    try:
-        start_time = datetime.utcnow()
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-        latency = (datetime.utcnow() - start_time).total_seconds() * 1000
-
-        components["database"] = {
-            "status": "healthy",
-            "latency_ms": round(latency, 2),
-        }
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        components["database"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
+    components["database"] = _check_database()
+    if components["database"]["status"] != "healthy":
         overall_status = "unhealthy"
 
-    # Check file system (media directory)
-    try:
-        media_path = settings.MEDIA_ROOT
-        media_path.mkdir(parents=True, exist_ok=True)
-
-        # Test write access
-        test_file = media_path / ".health_check"
-        test_file.write_text("test")
-        test_file.unlink()
-
+    # Check file system (media directory, created at startup by CoreConfig)
+    if os.access(settings.MEDIA_ROOT, os.W_OK):
         components["filesystem"] = {"status": "healthy"}
-    except Exception as e:
-        logger.error(f"Filesystem health check failed: {e}")
+    else:
+        logger.error(
+            "Filesystem health check failed: %s is not writable",
+            settings.MEDIA_ROOT,
+        )
         components["filesystem"] = {
             "status": "unhealthy",
-            "error": str(e),
+            "error": "Media directory is not writable",
         }
         overall_status = "degraded"
 
     return Response(
         {
             "status": overall_status,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
             "components": components,
         },
         status=(
@@ -160,9 +244,42 @@ def detailed_health_check(request: Request) -> Response:
 # =============================================================================
 
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def system_info(request: Request) -> Response:
+@functools.cache
+def _system_info_body() -> bytes:
+    """
+    Build the system info response body.
+
+    Nothing in it changes while the process runs (platform.platform()
+    can even spawn a subprocess), so it is encoded once and reused.
+
+    Returns:
+        Encoded JSON body for system_info.
+    """
+    return orjson.dumps(
+        {
+            "application": {
+                "name": "EasyCall",
+                "version": "0.1.0",
+                "description": "Blockchain Intelligence Workflow Builder",
+                "environment": "development" if settings.DEBUG else "production",
+            },
+            "system": {
+                "python_version": sys.version.split()[0],
+                "django_version": ".".join(map(str, django.VERSION[:3])),
+                "platform": platform.platform(),
+                "database": "SQLite",
+            },
+            "configuration": {
+                "debug_mode": settings.DEBUG,
+                "batch_size_limit": settings.BATCH_SIZE_LIMIT,
+                "execution_timeout": settings.EXECUTION_TIMEOUT,
+            },
+        }
+    )
+
+
+@require_GET
+def system_info(request: HttpRequest) -> HttpResponse:
     """
     Get system and application information.
 
@@ -191,28 +308,7 @@ def system_info(request: Request) -> Response:
     """
     logger.debug("System info requested")
 
-    return Response(
-        {
-            "application": {
-                "name": "EasyCall",
-                "version": "0.1.0",
-                "description": "Blockchain Intelligence Workflow Builder",
-                "environment": "development" if settings.DEBUG else "production",
-            },
-            "system": {
-                "python_version": sys.version.split()[0],
-                "django_version": ".".join(map(str, django.VERSION[:3])),
-                "platform": platform.platform(),
-                "database": "SQLite",
-            },
-            "configuration": {
-                "debug_mode": settings.DEBUG,
-                "batch_size_limit": settings.BATCH_SIZE_LIMIT,
-                "execution_timeout": settings.EXECUTION_TIMEOUT,
-            },
-        },
-        status=status.HTTP_200_OK
-    )
+    return HttpResponse(_system_info_body(), content_type="application/json")
 
 
 # =============================================================================
@@ -220,9 +316,9 @@ def system_info(request: Request) -> Response:
 # =============================================================================
 
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def ping(request: Request) -> Response:
+@require_GET
+@never_cache
+def ping(request: HttpRequest) -> HttpResponse:
     """
     Simple ping endpoint for connectivity testing.
 
@@ -234,7 +330,4 @@ def ping(request: Request) -> Response:
     Returns:
         Response with "pong" message.
     """
-    return Response(
-        {"message": "pong"},
-        status=status.HTTP_200_OK
-    )
\ No newline at end of file
+    return HttpResponse(PING_RESPONSE_BODY, content_type="application/json")
@@ -20,6 +20,6 @@ class DashboardConfig(AppConfig):
         """
         Initialize app when Django starts.
         
-        Currently no initialization needed.
+        Registers cache invalidation signal handlers.
         """
-        pass
\ No newline at end of file
+        from apps.dashboard import signals  # noqa: F401
\ No newline at end of file
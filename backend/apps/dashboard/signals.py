@@ -0,0 +1,102 @@
+"""
+Dashboard Signals
+Invalidate cached dashboard payloads when the underlying data changes.
+"""
+
+import logging
+from datetime import date
+from typing import Optional
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.core.signals import active_state_changed
+from apps.execution.models import ExecutionLog
+from apps.integrations.models import OpenAPISpec
+from apps.workflows.models import Workflow
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CACHE KEYS
+# ============================================================================
+
+# Bump the version suffix whenever the shape of the stats payload changes
+DASHBOARD_STATS_CACHE_PREFIX = "dashboard:stats:v1"
+DASHBOARD_STATS_CACHE_TIMEOUT = 30  # seconds
+
+
+def dashboard_stats_cache_key(day: Optional[date] = None) -> str:
+    """
+    Build the stats cache key for a local date bucket.
+
+    Keying on the date makes the "today" counters roll over at midnight
+    instead of serving yesterday's numbers until the entry expires.
+
+    Args:
+        day: Local date of the bucket (defaults to today)
+
+    Returns:
+        Cache key string
+    """
+    day = day or timezone.localdate()
+    return f"{DASHBOARD_STATS_CACHE_PREFIX}:{day.isoformat()}"
+
+
+RECENT_ACTIVITY_CACHE_PREFIX = "dashboard:recent_activity:v1"
+RECENT_ACTIVITY_CACHE_TIMEOUT = 30  # seconds
+RECENT_ACTIVITY_MAX_LIMIT = 50
+
+
+def recent_activity_cache_key(limit: int) -> str:
+    """
+    Build the recent activity cache key for a page size.
+
+    Args:
+        limit: Number of activity items requested
+
+    Returns:
+        Cache key string
+    """
+    return f"{RECENT_ACTIVITY_CACHE_PREFIX}:{limit}"
+
+
+# ============================================================================
+# INVALIDATION
+# ============================================================================
+
+
+@receiver(post_save, sender=Workflow)
+@receiver(post_delete, sender=Workflow)
+@receiver(post_save, sender=ExecutionLog)
+@receiver(post_delete, sender=ExecutionLog)
+@receiver(post_save, sender=OpenAPISpec)
+@receiver(post_delete, sender=OpenAPISpec)
+@receiver(active_state_changed, sender=Workflow)
+@receiver(active_state_changed, sender=ExecutionLog)
+@receiver(active_state_changed, sender=OpenAPISpec)
+def invalidate_dashboard_caches(sender, **kwargs) -> None:
+    """
+    Drop cached dashboard payloads after a tracked model changes.
+
+    Clears today's statistics and every recent activity page size.
+    Soft deletes and restores are UPDATEs that skip post_save, so they
+    are caught through active_state_changed. Other QuerySet.update()
+    writes send no signals and are picked up when the entries expire.
+
+    Args:
+        sender: Model class that was saved, deleted, or soft deleted
+        **kwargs: Additional signal arguments
+    """
+    cache.delete_many([
+        dashboard_stats_cache_key(),
+        *(
+            recent_activity_cache_key(limit)
+            for limit in range(RECENT_ACTIVITY_MAX_LIMIT + 1)
+        ),
+    ])
+    logger.debug("Invalidated dashboard caches (%s changed)", sender.__name__)
@@ -5,6 +5,7 @@ Unit tests for dashboard endpoints.
 
 from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -43,6 +44,55 @@ class DashboardStatsTests(TestCase):
         self.assertIn('executions', response.data)
         self.assertEqual(response.data['workflows']['total'], 2)
 
+    def test_stats_query_count(self):
+        """Test a cache miss runs one aggregate per model plus two lookups."""
+        with self.assertNumQueries(5):
+            response = self.client.get(self.stats_url)
+
+        self.assertEqual(response.data['workflows']['active'], 1)
+        self.assertEqual(response.data['workflows']['inactive'], 1)
+        self.assertIn('last_workflow_created', response.data['recent_activity'])
+
+    def test_last_execution_ignores_pending_runs(self):
+        """Test last_execution is the latest started run, not a pending one."""
+        workflow = Workflow.objects.first()
+        started = ExecutionLog.objects.create(workflow=workflow)
+        started.start()
+        ExecutionLog.objects.create(workflow=workflow)
+
+        response = self.client.get(self.stats_url)
+
+        self.assertEqual(
+            response.data['recent_activity']['last_execution'],
+            ExecutionLog.objects.get(pk=started.pk).started_at
+        )
+
+    def test_stats_cached_and_invalidated(self):
+        """Test stats are served from cache until a workflow changes."""
+        self.client.get(self.stats_url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.stats_url)
+        self.assertEqual(response.data['workflows']['total'], 2)
+
+        Workflow.objects.create(name="Test Workflow 3", description="Test")
+        response = self.client.get(self.stats_url)
+        self.assertEqual(response.data['workflows']['total'], 3)
+
+    def test_stats_invalidated_by_soft_delete(self):
+        """Test soft delete and restore (UPDATEs, no save signal) refresh stats."""
+        workflow = Workflow.objects.get(is_active=True)
+        self.client.get(self.stats_url)
+
+        workflow.soft_delete()
+        response = self.client.get(self.stats_url)
+        self.assertEqual(response.data['workflows']['active'], 0)
+        self.assertEqual(response.data['workflows']['inactive'], 2)
+
+        workflow.restore()
+        response = self.client.get(self.stats_url)
+        self.assertEqual(response.data['workflows']['active'], 1)
+
 
 class QuickActionsTests(TestCase):
     """Test quick actions endpoint."""
@@ -64,4 +114,124 @@ class QuickActionsTests(TestCase):
         first_action = response.data['actions'][0]
         self.assertIn('id', first_action)
         self.assertIn('label', first_action)
-        self.assertIn('route', first_action)
\ No newline at end of file
+        self.assertIn('route', first_action)
+
+
+class RecentActivityTests(TestCase):
+    """Test recent activity endpoint."""
+
+    def setUp(self):
+        """Set up test client and workflows with executions."""
+        self.client = APIClient()
+        self.activity_url = reverse('dashboard:recent-activity')
+
+        for index in range(3):
+            workflow = Workflow.objects.create(name=f"Workflow {index}")
+            ExecutionLog.objects.create(workflow=workflow).start()
+
+    def test_feed_merges_limited_sources(self):
+        """Test each source is one limited query, merged newest first."""
+        with self.assertNumQueries(3):
+            response = self.client.get(self.activity_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        executions = [
+            item for item in response.data['activities']
+            if item['type'] == 'execution_run'
+        ]
+        self.assertEqual(len(executions), 3)
+        self.assertTrue(
+            all(item['description'].startswith('Workflow') for item in executions)
+        )
+        timestamps = [item['timestamp'] for item in response.data['activities']]
+        self.assertEqual(timestamps, sorted(timestamps, reverse=True))
+
+    def test_activity_cached_and_invalidated(self):
+        """Test the feed is cached per limit until a tracked model changes."""
+        self.client.get(self.activity_url, {'limit': 5})
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.activity_url, {'limit': 5})
+        self.assertEqual(len(response.data['activities']), 5)
+
+        Workflow.objects.create(name="Newest workflow")
+        response = self.client.get(self.activity_url, {'limit': 5})
+        self.assertIn(
+            "Newest workflow",
+            [item['description'] for item in response.data['activities']]
+        )
+
+    def test_invalid_limit_rejected(self):
+        """Test non-positive or non-integer limits return 400 and large ones are clamped."""
+        for value in ('abc', '-5', '1.5', '0'):
+            response = self.client.get(self.activity_url, {'limit': value})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.activity_url, {'limit': 1000})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['activities']), 6)
+
+    def test_keyset_pagination(self):
+        """Test next_before pages through older items without overlap."""
+        first = self.client.get(self.activity_url, {'limit': 4})
+        cursor = first.data['next_before']
+        self.assertIsNotNone(cursor)
+
+        second = self.client.get(self.activity_url, {
+            'limit': 4,
+            'before': cursor.isoformat(),
+            'before_id': first.data['next_before_id'],
+        })
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(second.data['activities']), 2)
+        self.assertIsNone(second.data['next_before'])
+        self.assertTrue(
+            all(item['timestamp'] <= cursor for item in second.data['activities'])
+        )
+        ids = [item['id'] for item in first.data['activities'] + second.data['activities']]
+        self.assertEqual(len(set(ids)), 6)
+
+    def test_keyset_pagination_shared_timestamp(self):
+        """Test items sharing the cursor timestamp are neither skipped nor repeated."""
+        moment = timezone.now()
+        Workflow.objects.update(created_at=moment)
+        ExecutionLog.objects.update(started_at=moment)
+
+        seen = []
+        params = {'limit': 2}
+        while True:
+            response = self.client.get(self.activity_url, params)
+            seen.extend(item['id'] for item in response.data['activities'])
+            if response.data['next_before'] is None:
+                break
+            params = {
+                'limit': 2,
+                'before': response.data['next_before'].isoformat(),
+                'before_id': response.data['next_before_id'],
+            }
+
+        self.assertEqual(len(seen), 6)
+        self.assertEqual(len(set(seen)), 6)
+
+    def test_invalid_cursor_rejected(self):
+        """Test a malformed before cursor returns 400."""
+        response = self.client.get(self.activity_url, {'before': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(
+            self.activity_url,
+            {'before': timezone.now().isoformat(), 'before_id': 'not-a-uuid'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class DashboardURLTests(TestCase):
+    """Test dashboard URL configuration."""
+
+    def test_route_names_are_unique(self):
+        """Test no two dashboard routes share a name."""
+        from apps.dashboard.urls import urlpatterns
+
+        names = [p.name for p in urlpatterns]
+        self.assertEqual(len(set(names)), len(names))
@@ -6,6 +6,8 @@
 # UPDATED: Added /upload-provider/ route
 # =============================================================================
 
+from functools import partial
+
 from django.urls import path
 from . import views
 
@@ -23,11 +25,11 @@ urlpatterns = [
     path('upload-provider/', views.upload_provider, name='upload_provider'),
     
     # Placeholder pages for features under development
-    path('workflows/new/', lambda r: views.coming_soon(r, 'create_workflow'), name='create-workflow'),
-    path('workflows/', lambda r: views.coming_soon(r, 'view_workflows'), name='view-workflows'),
-    path('execution/logs/', lambda r: views.coming_soon(r, 'view_executions'), name='view-executions'),
-    path('settings/', lambda r: views.coming_soon(r, 'manage_settings'), name='manage-settings'),
-    path('integrations/specs/', lambda r: views.coming_soon(r, 'add_provider'), name='add-provider'),
+    path('workflows/new/', partial(views.coming_soon, feature='create_workflow'), name='create-workflow'),
+    path('workflows/', partial(views.coming_soon, feature='view_workflows'), name='view-workflows'),
+    path('execution/logs/', partial(views.coming_soon, feature='view_executions'), name='view-executions'),
+    path('settings/', partial(views.coming_soon, feature='manage_settings'), name='manage-settings'),
+    path('integrations/specs/', partial(views.coming_soon, feature='add_provider'), name='add-provider'),
     
     # ========================================================================
     # API ENDPOINTS
@@ -5,12 +5,21 @@
 # UPDATED: Changed Add API Provider route to Django backend upload page
 # =============================================================================
 
+import functools
+import heapq
 import logging
-from typing import Any, Dict, List
+import uuid
+from datetime import date, datetime, time
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
-from django.db.models import Count, Q
+from django.core.cache import cache
+from django.db.models import CharField, Count, F, Q, Value
 from django.shortcuts import render
+from django.views.decorators.cache import cache_page
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.request import Request
@@ -19,6 +28,13 @@ from rest_framework.response import Response
 from apps.workflows.models import Workflow
 from apps.execution.models import ExecutionLog
 from apps.integrations.models import OpenAPISpec
+from apps.dashboard.signals import (
+    DASHBOARD_STATS_CACHE_TIMEOUT,
+    RECENT_ACTIVITY_CACHE_TIMEOUT,
+    RECENT_ACTIVITY_MAX_LIMIT,
+    dashboard_stats_cache_key,
+    recent_activity_cache_key,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -59,10 +75,14 @@ def upload_provider(request):
     return render(request, 'dashboard/upload_provider.html')
 
 
+@cache_page(60 * 60)
 def coming_soon(request, feature):
     """
     Coming soon placeholder page.
     
+    The page is static per feature name, so responses are cached for
+    an hour.
+    
     Args:
         request: HTTP request object
         feature: Feature name to display
@@ -81,6 +101,119 @@ def coming_soon(request, feature):
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=2)
+def _day_start(day: date) -> datetime:
+    """
+    Return the aware datetime at local midnight for a date.
+    
+    Args:
+        day: Local date
+        
+    Returns:
+        Start of that day in the current time zone
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _compute_dashboard_stats(day: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Compute dashboard statistics from the database.
+    
+    Called on a cache miss by dashboard_stats.
+    
+    Args:
+        day: Local date that "today" counters refer to (defaults to today)
+        
+    Returns:
+        Dictionary of workflow, provider, execution and activity stats
+    """
+    logger.info("Computing dashboard statistics")
+    
+    # ================================================================
+    # WORKFLOW STATISTICS
+    # ================================================================
+    
+    # One aggregate query per model: COUNT(*) FILTER (WHERE ...) columns
+    workflow_stats = Workflow.objects.aggregate(
+        total=Count('pk'),
+        active=Count('pk', filter=Q(is_active=True)),
+        inactive=Count('pk', filter=Q(is_active=False))
+    )
+    
+    # ================================================================
+    # PROVIDER STATISTICS (FIXED: using is_active instead of is_deleted)
+    # ================================================================
+    
+    provider_stats = OpenAPISpec.objects.filter(is_active=True).aggregate(
+        total=Count('pk'),
+        parsed=Count('pk', filter=Q(is_parsed=True)),
+        failed=Count(
+            'pk',
+            filter=Q(is_parsed=False, parse_error__isnull=False)
+        )
+    )
+    
+    # ================================================================
+    # EXECUTION STATISTICS
+    # ================================================================
+    
+    today_start = _day_start(day or timezone.localdate())
+    execution_counts = ExecutionLog.objects.aggregate(
+        total=Count('pk'),
+        successful=Count('pk', filter=Q(status='completed')),
+        today=Count('pk', filter=Q(started_at__gte=today_start))
+    )
+    total_executions = execution_counts['total']
+    
+    # Calculate success rate
+    success_rate = 0.0
+    if total_executions > 0:
+        success_rate = round(
+            (execution_counts['successful'] / total_executions) * 100,
+            2
+        )
+    
+    execution_stats = {
+        "total": total_executions,
+        "today": execution_counts['today'],
+        "success_rate": success_rate
+    }
+    
+    # ================================================================
+    # RECENT ACTIVITY
+    # ================================================================
+    
+    recent_activity = {}
+    
+    # Last workflow created (timestamp only, no model instance)
+    last_workflow_created = Workflow.objects.order_by(
+        '-created_at'
+    ).values_list('created_at', flat=True).first()
+    
+    if last_workflow_created:
+        recent_activity['last_workflow_created'] = last_workflow_created
+    
+    # Last execution (pending runs have no started_at; Postgres sorts
+    # NULLs first on DESC, so exclude them explicitly)
+    last_execution = ExecutionLog.objects.filter(
+        started_at__isnull=False
+    ).order_by('-started_at').values_list('started_at', flat=True).first()
+    
+    if last_execution:
+        recent_activity['last_execution'] = last_execution
+    
+    # ================================================================
+    # RESPONSE
+    # ================================================================
+    
+    return {
+        "workflows": workflow_stats,
+        "providers": provider_stats,
+        "executions": execution_stats,
+        "recent_activity": recent_activity
+    }
+
+
 @api_view(['GET'])
 def dashboard_stats(request: Request) -> Response:
     """
@@ -124,100 +257,20 @@ def dashboard_stats(request: Request) -> Response:
     try:
         logger.info("Fetching dashboard statistics")
         
-        # ================================================================
-        # WORKFLOW STATISTICS
-        # ================================================================
-        
-        workflow_stats = {
-            "total": Workflow.objects.count(),
-            "active": Workflow.objects.filter(is_active=True).count(),
-            "inactive": Workflow.objects.filter(is_active=False).count()
-        }
-        
-        # ================================================================
-        # PROVIDER STATISTICS (FIXED: using is_active instead of is_deleted)
-        # ================================================================
-        
-        provider_stats = {
-            "total": OpenAPISpec.objects.filter(is_active=True).count(),
-            "parsed": OpenAPISpec.objects.filter(
-                is_active=True,
-                is_parsed=True
-            ).count(),
-            "failed": OpenAPISpec.objects.filter(
-                is_active=True,
-                is_parsed=False,
-                parse_error__isnull=False
-            ).count()
-        }
-        
-        # ================================================================
-        # EXECUTION STATISTICS
-        # ================================================================
-        
-        total_executions = ExecutionLog.objects.count()
-        successful_executions = ExecutionLog.objects.filter(
-            status='completed'
-        ).count()
-        
-        # Calculate success rate
-        success_rate = 0.0
-        if total_executions > 0:
-            success_rate = round(
-                (successful_executions / total_executions) * 100,
-                2
-            )
-        
-        # Today's executions
-        today_start = timezone.now().replace(
-            hour=0, minute=0, second=0, microsecond=0
+        # Dashboards tolerate a few seconds of staleness; writes to the
+        # counted models invalidate the entry via apps.dashboard.signals
+        today = timezone.localdate()
+        response_data = cache.get_or_set(
+            dashboard_stats_cache_key(today),
+            functools.partial(_compute_dashboard_stats, today),
+            timeout=DASHBOARD_STATS_CACHE_TIMEOUT,
         )
-        today_executions = ExecutionLog.objects.filter(
-            started_at__gte=today_start
-        ).count()
-        
-        execution_stats = {
-            "total": total_executions,
-            "today": today_executions,
-            "success_rate": success_rate
-        }
-        
-        # ================================================================
-        # RECENT ACTIVITY
-        # ================================================================
-        
-        recent_activity = {}
-        
-        # Last workflow created
-        last_workflow = Workflow.objects.order_by('-created_at').first()
-        
-        if last_workflow:
-            recent_activity['last_workflow_created'] = last_workflow.created_at
-        
-        # Last execution
-        last_execution = ExecutionLog.objects.order_by('-started_at').first()
-        
-        if last_execution:
-            recent_activity['last_execution'] = last_execution.started_at
-        
-        # ================================================================
-        # RESPONSE
-        # ================================================================
-        
-        response_data = {
-            "workflows": workflow_stats,
-            "providers": provider_stats,
-            "executions": execution_stats,
-            "recent_activity": recent_activity
-        }
         
         logger.info("Dashboard statistics retrieved successfully")
         return Response(response_data, status=status.HTTP_200_OK)
         
     except Exception as e:
-        logger.error(f"Error fetching dashboard statistics: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("Error fetching dashboard statistics: %s", e)
         return Response(
             {"error": "Failed to fetch dashboard statistics"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -229,6 +282,67 @@ def dashboard_stats(request: Request) -> Response:
 # ============================================================================
 
 
+# Static payload, built once at import rather than per request
+QUICK_ACTIONS: List[Dict[str, Any]] = [
+    {
+        "id": "add_provider",
+        "label": "Add API Provider",
+        "description": "Upload OpenAPI specification to integrate new blockchain intelligence APIs",
+        "icon": "cloud_upload",
+        "route": "/upload-provider/",  # ← CHANGED: Now points to Django backend
+        "color": "primary",
+        "order": 1
+    },
+    {
+        "id": "create_workflow",
+        "label": "Create Workflow",
+        "description": "Build visual blockchain intelligence workflows with drag-and-drop nodes",
+        "icon": "add_box",
+        "route": "http://localhost:3000/workflows/new",  # React frontend canvas
+        "color": "success",
+        "order": 2
+    },
+    {
+        "id": "view_workflows",
+        "label": "View Workflows",
+        "description": "Browse and manage existing investigation workflows",
+        "icon": "list",
+        "route": "http://localhost:3000/workflows",  # React frontend
+        "color": "info",
+        "order": 3
+    },
+    {
+        "id": "view_executions",
+        "label": "View Executions",
+        "description": "Monitor workflow execution history and logs",
+        "icon": "history",
+        "route": "http://localhost:3000/executions",  # React frontend
+        "color": "warning",
+        "order": 4
+    },
+    {
+        "id": "manage_settings",
+        "label": "Manage Settings",
+        "description": "Configure API credentials and global settings",
+        "icon": "settings",
+        "route": "http://localhost:3000/settings",  # React frontend
+        "color": "secondary",
+        "order": 5
+    },
+    {
+        "id": "api_docs",
+        "label": "API Documentation",
+        "description": "Explore REST API endpoints with Swagger UI",
+        "icon": "description",
+        "route": "/api/docs/",  # Keep this on backend
+        "color": "default",
+        "order": 6
+    }
+]
+
+QUICK_ACTIONS_RESPONSE: Dict[str, Any] = {"actions": QUICK_ACTIONS}
+
+
 @api_view(['GET'])
 def quick_actions(request: Request) -> Response:
     """
@@ -249,84 +363,198 @@ def quick_actions(request: Request) -> Response:
     UPDATED: Changed "Add API Provider" route from React frontend
     to Django backend upload page at /upload-provider/
     """
-    try:
-        logger.info("Fetching quick actions")
+    logger.info("Fetching quick actions")
+    return Response(QUICK_ACTIONS_RESPONSE, status=status.HTTP_200_OK)
+
+
+# ============================================================================
+# RECENT ACTIVITY FEED
+# ============================================================================
+
+
+# Display fields per activity type: (title, icon, link prefix)
+ACTIVITY_DISPLAY: Dict[str, tuple] = {
+    "workflow_created": ("Workflow created", "add_box", "/workflows/"),
+    "provider_added": ("API Provider added", "cloud_upload", "/integrations/specs/"),
+    "execution_run": ("Workflow executed", "play_arrow", "/execution/logs/"),
+}
+
+
+def _activity_rows(queryset, activity_type: str, **columns):
+    """
+    Project a queryset onto the shared activity row shape.
+    
+    Every source yields rows with the same keys so they can be merged
+    into one feed, so all of them are annotations with fixed names.
+    
+    Args:
+        queryset: Source queryset
+        activity_type: Value for the "type" column
+        **columns: Expressions for row_uuid, label, ts, run_status
         
-        actions: List[Dict[str, Any]] = [
-            {
-                "id": "add_provider",
-                "label": "Add API Provider",
-                "description": "Upload OpenAPI specification to integrate new blockchain intelligence APIs",
-                "icon": "cloud_upload",
-                "route": "/upload-provider/",  # ← CHANGED: Now points to Django backend
-                "color": "primary",
-                "order": 1
-            },
-            {
-                "id": "create_workflow",
-                "label": "Create Workflow",
-                "description": "Build visual blockchain intelligence workflows with drag-and-drop nodes",
-                "icon": "add_box",
-                "route": "http://localhost:3000/workflows/new",  # React frontend canvas
-                "color": "success",
-                "order": 2
-            },
-            {
-                "id": "view_workflows",
-                "label": "View Workflows",
-                "description": "Browse and manage existing investigation workflows",
-                "icon": "list",
-                "route": "http://localhost:3000/workflows",  # React frontend
-                "color": "info",
-                "order": 3
-            },
-            {
-                "id": "view_executions",
-                "label": "View Executions",
-                "description": "Monitor workflow execution history and logs",
-                "icon": "history",
-                "route": "http://localhost:3000/executions",  # React frontend
-                "color": "warning",
-                "order": 4
-            },
-            {
-                "id": "manage_settings",
-                "label": "Manage Settings",
-                "description": "Configure API credentials and global settings",
-                "icon": "settings",
-                "route": "http://localhost:3000/settings",  # React frontend
-                "color": "secondary",
-                "order": 5
-            },
-            {
-                "id": "api_docs",
-                "label": "API Documentation",
-                "description": "Explore REST API endpoints with Swagger UI",
-                "icon": "description",
-                "route": "/api/docs/",  # Keep this on backend
-                "color": "default",
-                "order": 6
-            }
-        ]
+    Returns:
+        Unordered values queryset
+    """
+    return queryset.order_by().annotate(
+        kind=Value(activity_type, output_field=CharField()),
+        **columns
+    ).values('kind', 'row_uuid', 'label', 'ts', 'run_status')
 
-        response_data = {
-            "actions": actions
+
+def _compute_recent_activity(
+    limit: int,
+    before: Optional[datetime] = None,
+    before_id: Optional[uuid.UUID] = None
+) -> List[Dict[str, Any]]:
+    """
+    Build the recent activity feed from the database.
+    
+    Called on a cache miss by recent_activity. Each source is fetched
+    newest first and limited in the database, then the three sorted
+    streams are merged lazily, so no full-table sort happens on either
+    side.
+    
+    Args:
+        limit: Maximum number of items to return
+        before: Only include items strictly older than this (keyset
+            pagination cursor)
+        before_id: UUID of the last item on the previous page; items
+            sharing its timestamp are included if their UUID sorts lower
+        
+    Returns:
+        Activity items, newest first
+    """
+    no_status = Value('', output_field=CharField())
+    
+    workflows = _activity_rows(
+        Workflow.objects.all(),
+        "workflow_created",
+        row_uuid=F('uuid'),
+        label=F('name'),
+        ts=F('created_at'),
+        run_status=no_status,
+    )
+    
+    # FIXED: using is_active instead of is_deleted
+    specs = _activity_rows(
+        OpenAPISpec.objects.filter(is_active=True),
+        "provider_added",
+        row_uuid=F('uuid'),
+        label=F('name'),
+        ts=F('created_at'),
+        run_status=no_status,
+    )
+    
+    # Pending runs have no start time yet and are not activity
+    executions = _activity_rows(
+        ExecutionLog.objects.filter(started_at__isnull=False),
+        "execution_run",
+        row_uuid=F('uuid'),
+        label=F('workflow__name'),
+        ts=F('started_at'),
+        run_status=F('status'),
+    )
+    
+    sources = (workflows, specs, executions)
+    if before is not None:
+        # Keyset on (ts, uuid) so items sharing a timestamp are not skipped
+        older = Q(ts__lt=before)
+        if before_id is not None:
+            older |= Q(ts=before, row_uuid__lt=before_id)
+        sources = tuple(source.filter(older) for source in sources)
+    
+    # SQLite cannot LIMIT the branches of a UNION, so each source is a
+    # separate index-friendly "ORDER BY ... LIMIT" query
+    rows = islice(
+        heapq.merge(
+            *(source.order_by('-ts', '-row_uuid')[:limit] for source in sources),
+            key=itemgetter('ts', 'row_uuid'),
+            reverse=True
+        ),
+        limit
+    )
+    
+    activities: List[Dict[str, Any]] = []
+    for row in rows:
+        title, icon, link_prefix = ACTIVITY_DISPLAY[row['kind']]
+        item = {
+            "id": row['row_uuid'],
+            "type": row['kind'],
+            "title": title,
+            "description": row['label'] or "Unknown",
+            "timestamp": row['ts'],
+            "icon": icon,
+            "link": f"{link_prefix}{row['row_uuid']}"
         }
+        if row['kind'] == "execution_run":
+            item["status"] = row['run_status']
+        activities.append(item)
+    
+    return activities
+
+
+RECENT_ACTIVITY_DEFAULT_LIMIT = 10
+
+
+def _parse_before(raw: Optional[str]) -> Tuple[bool, Optional[datetime]]:
+    """
+    Parse the recent activity ``before`` cursor.
+    
+    Args:
+        raw: Raw query string value (None if absent)
         
-        logger.info(f"Retrieved {len(actions)} quick actions")
-        return Response(response_data, status=status.HTTP_200_OK)
+    Returns:
+        (valid, cursor): cursor is None when no cursor was given; valid
+        is False when the value is not an ISO 8601 datetime
+    """
+    if not raw:
+        return True, None
+    try:
+        cursor = parse_datetime(raw)
+    except ValueError:
+        cursor = None
+    if cursor is None:
+        return False, None
+    if timezone.is_naive(cursor):
+        cursor = timezone.make_aware(cursor)
+    return True, cursor
+
+
+def _parse_before_id(raw: Optional[str]) -> Tuple[bool, Optional[uuid.UUID]]:
+    """
+    Parse the recent activity ``before_id`` cursor tie-breaker.
+    
+    Args:
+        raw: Raw query string value (None if absent)
         
-    except Exception as e:
-        logger.error(f"Error fetching quick actions: {str(e)}")
-        return Response(
-            {"error": "Failed to fetch quick actions"},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+    Returns:
+        (valid, cursor_id): cursor_id is None when no id was given;
+        valid is False when the value is not a UUID
+    """
+    if not raw:
+        return True, None
+    try:
+        return True, uuid.UUID(raw)
+    except ValueError:
+        return False, None
 
 
-# ============================================================================
-# RECENT ACTIVITY FEED
-# ============================================================================
+def _parse_limit(raw: Optional[str]) -> Optional[int]:
+    """
+    Parse and clamp the recent activity ``limit`` query parameter.
+    
+    Args:
+        raw: Raw query string value (None if absent)
+        
+    Returns:
+        Limit between 1 and RECENT_ACTIVITY_MAX_LIMIT, or None if the
+        value is not a positive integer
+    """
+    if not raw:
+        return RECENT_ACTIVITY_DEFAULT_LIMIT
+    if not raw.isdigit() or int(raw) < 1:
+        return None
+    return min(int(raw), RECENT_ACTIVITY_MAX_LIMIT)
 
 
 @api_view(['GET'])
@@ -340,7 +568,12 @@ def recent_activity(request: Request) -> Response:
     - Executions run
     
     Query Parameters:
-        limit: Number of items to return (default: 10, max: 50)
+        limit: Number of items to return (default: 10, clamped to 1-50;
+            400 if not a positive integer)
+        before: ISO 8601 datetime; only return items older than this.
+            Pass the previous response's next_before to page back.
+        before_id: UUID breaking ties at the before timestamp. Pass the
+            previous response's next_before_id alongside next_before.
         
     Args:
         request: HTTP request object
@@ -352,6 +585,7 @@ def recent_activity(request: Request) -> Response:
         {
             "activities": [
                 {
+                    "id": "3f2b8c1e-...",
                     "type": "workflow_created",
                     "title": "New workflow created",
                     "description": "Address Attribution Workflow",
@@ -359,89 +593,59 @@ def recent_activity(request: Request) -> Response:
                     "icon": "add_box"
                 },
                 ...
-            ]
+            ],
+            "next_before": "2025-12-19T14:45:00Z",
+            "next_before_id": "3f2b8c1e-..."
         }
     """
+    # Reject malformed limits up front as a client error
+    limit = _parse_limit(request.query_params.get('limit'))
+    if limit is None:
+        return Response(
+            {"error": "limit must be a positive integer"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    valid_cursor, before = _parse_before(request.query_params.get('before'))
+    if not valid_cursor:
+        return Response(
+            {"error": "before must be an ISO 8601 datetime"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    valid_cursor_id, before_id = _parse_before_id(request.query_params.get('before_id'))
+    if not valid_cursor_id:
+        return Response(
+            {"error": "before_id must be a UUID"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
     try:
-        # Get limit from query params
-        limit = int(request.query_params.get('limit', 10))
-        limit = min(limit, 50)  # Cap at 50
-        
-        logger.info(f"Fetching recent activity (limit: {limit})")
-        
-        activities: List[Dict[str, Any]] = []
-        
-        # ================================================================
-        # RECENT WORKFLOWS
-        # ================================================================
-        
-        recent_workflows = Workflow.objects.order_by('-created_at')[:limit]
+        logger.info("Fetching recent activity (limit: %d)", limit)
         
-        for workflow in recent_workflows:
-            activities.append({
-                "type": "workflow_created",
-                "title": "Workflow created",
-                "description": workflow.name,
-                "timestamp": workflow.created_at,
-                "icon": "add_box",
-                "link": f"/workflows/{workflow.uuid}"
-            })
-        
-        # ================================================================
-        # RECENT PROVIDERS (FIXED: using is_active instead of is_deleted)
-        # ================================================================
-        
-        recent_specs = OpenAPISpec.objects.filter(
-            is_active=True
-        ).order_by('-created_at')[:limit]
-        
-        for spec in recent_specs:
-            activities.append({
-                "type": "provider_added",
-                "title": "API Provider added",
-                "description": spec.name,
-                "timestamp": spec.created_at,
-                "icon": "cloud_upload",
-                "link": f"/integrations/specs/{spec.uuid}"
-            })
-        
-        # ================================================================
-        # RECENT EXECUTIONS
-        # ================================================================
-        
-        recent_executions = ExecutionLog.objects.order_by(
-            '-started_at'
-        )[:limit]
-        
-        for execution in recent_executions:
-            activities.append({
-                "type": "execution_run",
-                "title": "Workflow executed",
-                "description": execution.workflow.name if execution.workflow else "Unknown",
-                "timestamp": execution.started_at,
-                "icon": "play_arrow",
-                "status": execution.status,
-                "link": f"/execution/logs/{execution.uuid}"
-            })
-        
-        # ================================================================
-        # SORT BY TIMESTAMP
-        # ================================================================
-        
-        activities.sort(key=lambda x: x['timestamp'], reverse=True)
-        activities = activities[:limit]  # Trim to limit
+        if before is None:
+            activities = cache.get_or_set(
+                recent_activity_cache_key(limit),
+                functools.partial(_compute_recent_activity, limit),
+                timeout=RECENT_ACTIVITY_CACHE_TIMEOUT,
+            )
+        else:
+            # Older pages are not cached; they are cheap index range scans
+            activities = _compute_recent_activity(limit, before, before_id)
         
+        # Cursor for the next (older) page, if there may be one
+        last = activities[-1] if len(activities) == limit else None
         response_data = {
-            "activities": activities
+            "activities": activities,
+            "next_before": last["timestamp"] if last else None,
+            "next_before_id": last["id"] if last else None,
         }
         
-        logger.info(f"Retrieved {len(activities)} activity items")
+        logger.info("Retrieved %d activity items", len(activities))
         return Response(response_data, status=status.HTTP_200_OK)
         
     except Exception as e:
-        logger.error(f"Error fetching recent activity: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("Error fetching recent activity: %s", e)
         return Response(
             {"error": "Failed to fetch recent activity"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -18,11 +18,20 @@ handling authentication, parameter mapping, and response parsing automatically.
 # IMPORTS
 # =============================================================================
 
+import base64
+import hashlib
 import logging
-import requests
-from typing import Dict, Any, Optional
+import re
+import string
+import time
+from functools import lru_cache
+import httpx
+import orjson
+from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urljoin
 
+from django.core.cache import cache
+
 # =============================================================================
 # LOGGER
 # =============================================================================
@@ -30,6 +39,195 @@ from urllib.parse import urljoin
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# SHARED HTTP CLIENTS
+# =============================================================================
+
+# HTTP/2 multiplexes concurrent requests to one provider over a single
+# TLS connection; the pool still allows many hosts to be kept warm
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Reconnect attempts when a connection cannot be established
+HTTP_CONNECT_RETRIES = 3
+
+# Retry idempotent requests on transient gateway errors, with exponential
+# backoff. The final response is returned rather than raised so error
+# handling below still sees the real status code.
+HTTP_RETRY_STATUSES = frozenset({502, 503, 504})
+HTTP_RETRY_ATTEMPTS = 3
+HTTP_RETRY_BACKOFF = 0.2  # seconds, doubled per attempt
+HTTP_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS', 'TRACE'})
+
+
+def _should_retry(method: str, status_code: int, attempt: int) -> bool:
+    """Whether a response warrants another attempt."""
+    return (
+        status_code in HTTP_RETRY_STATUSES
+        and method in HTTP_IDEMPOTENT_METHODS
+        and attempt < HTTP_RETRY_ATTEMPTS
+    )
+
+
+def _retry_delay(attempt: int) -> float:
+    """Backoff before retry number ``attempt + 1``."""
+    return HTTP_RETRY_BACKOFF * (2 ** attempt)
+
+
+def _build_client() -> httpx.Client:
+    """Create the pooled HTTP/2 client used for synchronous requests."""
+    transport = httpx.HTTPTransport(
+        http2=True,
+        limits=HTTP_LIMITS,
+        retries=HTTP_CONNECT_RETRIES,
+    )
+    return httpx.Client(transport=transport)
+
+
+# Shared by every executor so connections to a provider are reused
+# across nodes and workflow runs
+_CLIENT = _build_client()
+
+# Responses are streamed and abandoned past this size so a misbehaving
+# endpoint cannot exhaust worker memory
+MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+# =============================================================================
+# RESPONSE CACHE
+# =============================================================================
+
+# GET responses are cached when the API allows it (Cache-Control max-age)
+# or the caller sets request_config['cache_ttl']. Stale entries carrying
+# an ETag or Last-Modified are kept a while longer so the next request
+# can be a conditional GET answered with 304 Not Modified.
+HTTP_CACHE_PREFIX = 'api_executor:response:v1'
+HTTP_CACHE_REVALIDATE_SECONDS = 60 * 60
+
+_MAX_AGE_RE = re.compile(r'(?:^|[\s,])max-age=(\d+)')
+_VALIDATOR_HEADERS = {'ETag': 'If-None-Match', 'Last-Modified': 'If-Modified-Since'}
+
+
+def _response_cache_key(url: str, headers: dict, params: dict) -> str:
+    """Key a GET by URL, query and headers (credentials included)."""
+    payload = orjson.dumps(
+        [url, headers, params],
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    )
+    return f"{HTTP_CACHE_PREFIX}:{hashlib.sha256(payload).hexdigest()}"
+
+
+def _conditional_headers(entry: dict) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since from a cached entry."""
+    return {
+        _VALIDATOR_HEADERS[name]: value
+        for name, value in entry['validators'].items()
+    }
+
+
+def _build_cache_entry(
+    data: Any,
+    response,
+    default_ttl: int,
+    previous: Optional[dict] = None
+) -> Optional[Tuple[dict, int]]:
+    """
+    Decide whether and for how long a response may be cached.
+    
+    Args:
+        data: Parsed response body
+        response: httpx response
+        default_ttl: Freshness lifetime when the API sends none
+        previous: Entry being revalidated, if any
+    
+    Returns:
+        (entry, cache timeout) or None if the response must not be stored
+    """
+    cache_control = response.headers.get('Cache-Control', '').lower()
+    if 'no-store' in cache_control:
+        return None
+
+    if 'no-cache' in cache_control:
+        ttl = 0
+    else:
+        match = _MAX_AGE_RE.search(cache_control)
+        ttl = int(match.group(1)) if match else default_ttl
+
+    validators = dict(previous['validators']) if previous else {}
+    for name in _VALIDATOR_HEADERS:
+        if name in response.headers:
+            validators[name] = response.headers[name]
+
+    if ttl <= 0 and not validators:
+        return None
+
+    entry = {'data': data, 'expires': time.time() + ttl, 'validators': validators}
+    timeout = ttl + (HTTP_CACHE_REVALIDATE_SECONDS if validators else 0)
+    return entry, timeout
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+# Headers sent with every request; build_headers() copies this
+DEFAULT_HEADERS: Dict[str, str] = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+}
+
+
+@lru_cache(maxsize=256)
+def _basic_auth_header(username: str, password: str) -> str:
+    """Encode a Basic auth header value once per credential pair."""
+    credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+    return f'Basic {credentials}'
+
+
+def _check_declared_size(response) -> None:
+    """Reject a response up front when Content-Length is over the cap."""
+    declared = response.headers.get('Content-Length')
+    if declared and declared.isdigit() and int(declared) > MAX_RESPONSE_BYTES:
+        raise APIExecutionError(
+            f"Response too large: {declared} bytes (limit {MAX_RESPONSE_BYTES})"
+        )
+
+
+def _append_chunk(body: bytearray, chunk: bytes) -> None:
+    """Add a chunk to the body buffer, enforcing the size cap."""
+    body.extend(chunk)
+    if len(body) > MAX_RESPONSE_BYTES:
+        raise APIExecutionError(
+            f"Response too large: over {MAX_RESPONSE_BYTES} bytes"
+        )
+
+
+_FORMATTER = string.Formatter()
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(path: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Parse a path template into (literal, field name) pairs, once per path.
+    
+    Returns:
+        The parsed template, or None if the path is not a plain {name}
+        template (stray braces, positional or attribute fields)
+    """
+    try:
+        parts = tuple(
+            (literal, field)
+            for literal, field, _, _ in _FORMATTER.parse(path)
+        )
+    except ValueError:
+        return None
+    
+    for _, field in parts:
+        if field is not None and (not field or not field.isidentifier()):
+            return None
+    return parts
+
+
 # =============================================================================
 # EXCEPTIONS
 # =============================================================================
@@ -69,8 +267,8 @@ class GenericAPIExecutor:
     """
     
     def __init__(self):
-        """Initialize the executor."""
-        self.session = requests.Session()
+        """Initialize the executor with the shared pooled client."""
+        self.client = _CLIENT
     
     def execute(self, request_config: dict) -> dict:
         """
@@ -84,6 +282,8 @@ class GenericAPIExecutor:
                 - params: Query parameters (optional)
                 - json: Request body as JSON (optional)
                 - timeout: Request timeout in seconds (default: 30)
+                - cache_ttl: Seconds to cache a GET response when the
+                  API sends no Cache-Control max-age (default: 0)
         
         Returns:
             Response data as dictionary
@@ -99,58 +299,113 @@ class GenericAPIExecutor:
         json_data = request_config.get('json')
         timeout = request_config.get('timeout', 30)
         
-        logger.info(f"[API] Generic executor: {method} {url}")
-        logger.debug(f"[API] Headers: {list(headers.keys())}")
-        logger.debug(f"[API] Params: {list(params.keys())}")
+        cache_ttl = request_config.get('cache_ttl', 0)
+        
+        logger.info("[API] Generic executor: %s %s", method, url)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[API] Headers: %s", list(headers))
+            logger.debug("[API] Params: %s", list(params))
+        
+        # Serve fresh cached GETs, revalidate stale ones
+        cache_key = None
+        cached = None
+        if method == 'GET':
+            cache_key = _response_cache_key(url, headers, params)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                if cached['expires'] > time.time():
+                    logger.debug("[API] Cache hit: %s", url)
+                    return cached['data']
+                headers = {**headers, **_conditional_headers(cached)}
         
         try:
-            # Make request
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=json_data,
-                timeout=timeout
-            )
+            # Make request, streaming the body under the size cap
+            attempt = 0
+            while True:
+                with self.client.stream(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    json=json_data,
+                    timeout=timeout
+                ) as response:
+                    if _should_retry(method, response.status_code, attempt):
+                        logger.warning("[API] %s from %s, retrying", response.status_code, url)
+                    else:
+                        _check_declared_size(response)
+                        body = bytearray()
+                        for chunk in response.iter_bytes(RESPONSE_CHUNK_SIZE):
+                            _append_chunk(body, chunk)
+                        break
+                time.sleep(_retry_delay(attempt))
+                attempt += 1
             
-            # Log response
-            logger.info(f"[API] Response: {response.status_code}")
+            if cached is not None and response.status_code == 304:
+                data = cached['data']
+            else:
+                data = self._parse_response(response, bytes(body))
             
-            # Check for errors
-            if response.status_code >= 400:
-                error_msg = f"API error {response.status_code}"
-                try:
-                    error_data = response.json()
-                    error_msg = f"{error_msg}: {error_data.get('message', error_data)}"
-                except:
-                    error_msg = f"{error_msg}: {response.text[:200]}"
-                
-                raise APIExecutionError(error_msg)
+            if cache_key:
+                stored = _build_cache_entry(data, response, cache_ttl, cached)
+                if stored:
+                    cache.set(cache_key, *stored)
             
-            # Parse response
-            try:
-                return response.json()
-            except ValueError:
-                # If response is not JSON, return text wrapped in dict
-                return {'response': response.text}
+            return data
         
-        except requests.Timeout:
-            logger.error(f"[API] Timeout: {url}")
+        except httpx.TimeoutException:
+            logger.error("[API] Timeout: %s", url)
             raise APIExecutionError(f"Request timeout after {timeout} seconds")
         
-        except requests.ConnectionError as e:
-            logger.error(f"[API] Connection error: {e}")
+        except httpx.TransportError as e:
+            logger.error("[API] Connection error: %s", e)
             raise APIExecutionError(f"Connection failed: {str(e)}")
         
-        except requests.HTTPError as e:
-            logger.error(f"[API] HTTP error: {e}")
+        except httpx.HTTPError as e:
+            logger.error("[API] HTTP error: %s", e)
             raise APIExecutionError(f"HTTP error: {str(e)}")
         
         except Exception as e:
-            logger.error(f"[API] Unexpected error: {e}")
+            logger.error("[API] Unexpected error: %s", e)
             raise APIExecutionError(f"Execution failed: {str(e)}")
     
+    def _parse_response(self, response, body: bytes) -> dict:
+        """
+        Check status and decode the body of an httpx response.
+        
+        Args:
+            response: The (already read) response
+            body: Raw, decompressed response body
+        
+        Raises:
+            APIExecutionError: If the API returned an error status
+        """
+        # Log response
+        logger.info("[API] Response: %s", response.status_code)
+        
+        # Check for errors
+        if response.status_code >= 400:
+            error_msg = f"API error {response.status_code}"
+            try:
+                error_data = orjson.loads(body)
+                error_msg = f"{error_msg}: {error_data.get('message', error_data)}"
+            except:
+                error_msg = f"{error_msg}: {self._decode_text(response, body)[:200]}"
+            
+            raise APIExecutionError(error_msg)
+        
+        # Parse response (orjson.JSONDecodeError is a ValueError)
+        try:
+            return orjson.loads(body)
+        except ValueError:
+            # If response is not JSON, return text wrapped in dict
+            return {'response': self._decode_text(response, body)}
+    
+    @staticmethod
+    def _decode_text(response, body: bytes) -> str:
+        """Decode a body using the charset the server declared."""
+        return body.decode(response.encoding or 'utf-8', errors='replace')
+    
     def build_url(self, base_url: str, path: str, path_params: Dict[str, str]) -> str:
         """
         Build full URL with path parameters substituted.
@@ -167,11 +422,26 @@ class GenericAPIExecutor:
             build_url('https://api.com', '/users/{id}', {'id': '123'})
             -> 'https://api.com/users/123'
         """
-        # Substitute path parameters
-        formatted_path = path
-        for param_name, param_value in path_params.items():
-            placeholder = f"{{{param_name}}}"
-            formatted_path = formatted_path.replace(placeholder, str(param_value))
+        # Substitute path parameters from the cached parsed template;
+        # unknown placeholders are left as-is
+        template = _compile_path(path)
+        if template is not None:
+            pieces = []
+            for literal, field in template:
+                pieces.append(literal)
+                if field is None:
+                    continue
+                if field in path_params:
+                    pieces.append(str(path_params[field]))
+                else:
+                    pieces.append('{' + field + '}')
+            formatted_path = ''.join(pieces)
+        else:
+            # Not a plain {name} template: substitute literally
+            formatted_path = path
+            for param_name, param_value in path_params.items():
+                placeholder = f"{{{param_name}}}"
+                formatted_path = formatted_path.replace(placeholder, str(param_value))
         
         # Combine base URL and path
         return urljoin(base_url.rstrip('/') + '/', formatted_path.lstrip('/'))
@@ -189,10 +459,7 @@ class GenericAPIExecutor:
         Returns:
             Headers dictionary
         """
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        headers = DEFAULT_HEADERS.copy()
         
         auth_type = auth_config.get('type', 'none').lower()
         
@@ -209,10 +476,8 @@ class GenericAPIExecutor:
         
         elif auth_type == 'basic':
             # Basic auth (handled by requests.auth, but can set header manually)
-            import base64
             username = auth_config.get('username', '')
             password = auth_config.get('password', '')
-            credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
-            headers['Authorization'] = f'Basic {credentials}'
+            headers['Authorization'] = _basic_auth_header(username, password)
         
         return headers
\ No newline at end of file
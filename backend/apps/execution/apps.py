@@ -15,4 +15,23 @@ class ExecutionConfig(AppConfig):
 
     default_auto_field: str = "django.db.models.BigAutoField"
     name: str = "apps.execution"
-    verbose_name: str = "Execution"
\ No newline at end of file
+    verbose_name: str = "Execution"
+
+    def ready(self) -> None:
+        """Keep the node registry in sync with uploaded OpenAPI specs."""
+        from django.db.models.signals import post_delete, post_save
+
+        from apps.core.signals import active_state_changed
+        from apps.execution.node_registry import clear_registry
+        from apps.integrations.models import OpenAPISpec
+
+        post_save.connect(
+            clear_registry, sender=OpenAPISpec, dispatch_uid="node_registry_save"
+        )
+        post_delete.connect(
+            clear_registry, sender=OpenAPISpec, dispatch_uid="node_registry_delete"
+        )
+        # Soft delete/restore are plain UPDATEs that skip the signals above
+        active_state_changed.connect(
+            clear_registry, sender=OpenAPISpec, dispatch_uid="node_registry_active"
+        )
\ No newline at end of file
@@ -1,24 +1,207 @@
 """
 Workflow execution engine that runs nodes in order.
 """
-import logging
+import contextvars
 import csv
+import hashlib
+import heapq
+import itertools
 import json
+import logging
+import multiprocessing
 import os
-from typing import Dict, List, Any, Optional
+import pickle
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from io import BytesIO
-from typing import Dict, List, Set, Any, Optional, Tuple
-import logging
-from collections import defaultdict, deque
-from django.db import transaction
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import orjson
+from django.core.cache import cache
+from django.db import connections
+
+from apps.execution.api_executor import APIExecutionError, GenericAPIExecutor
+from apps.execution.node_registry import get_provider_nodes
+from apps.execution.pdf_report import render_pdf_report
+from apps.integrations.chainalysis_client import BATCH_SIZE, ChainalysisAPIError, ChainalysisClient
+from apps.workflows.planning import (
+    cached_topological_levels,
+    canvas_hash,
+    plan_matches,
+    topological_levels,
+)
 
 logger = logging.getLogger(__name__)
 
 # Default output directory for exports - use user's Desktop
 DEFAULT_OUTPUT_DIR = Path.home() / "Desktop"
 
+# Write buffer for export files (fewer write syscalls on large exports)
+EXPORT_BUFFER_SIZE = 64 * 1024
+
+# CSV exports stream row by row, so they can afford a larger buffer
+CSV_BUFFER_SIZE = 1 << 20
+
+# Prepared export rows kept per run for export nodes sharing their inputs
+EXPORT_ROWS_CACHE_SIZE = 16
+
+# Upper bound on nodes of one dependency level running at the same time
+MAX_PARALLEL_NODES = 8
+
+# Read-only query nodes whose result depends only on their config and
+# inputs (credentials included); results are reused across executions
+PURE_NODE_TYPES = frozenset({
+    'chainalysis_cluster_info',
+    'chainalysis_cluster_balance',
+    'chainalysis_cluster_counterparties',
+    'chainalysis_transaction_details',
+    'chainalysis_exposure_category',
+    'chainalysis_exposure_service',
+})
+NODE_RESULT_CACHE_PREFIX = 'executor:node_result:v2'
+NODE_RESULT_CACHE_TTL = 60 * 60  # seconds
+# Larger results (e.g. big counterparty lists) are not kept in the cache,
+# which would otherwise hold a second copy of them for the whole TTL
+NODE_RESULT_CACHE_MAX_BYTES = 1024 * 1024
+
+# Exposure categories flagged as high risk (substring match, lowercase)
+HIGH_RISK_CATEGORIES = (
+    'darknet', 'ransomware', 'scam', 'stolen funds',
+    'sanctions', 'child abuse', 'terrorism financing',
+    'fraud', 'illicit'
+)
+HIGH_RISK_RE = re.compile('|'.join(map(re.escape, HIGH_RISK_CATEGORIES)))
+
+# Worker processes rendering PDF reports (started on first use)
+PDF_RENDER_WORKERS = 2
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+# Per-node log buffer while a level runs concurrently, so each node's
+# block of log lines stays contiguous in the execution log
+_node_log_buffer: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    '_node_log_buffer', default=None
+)
+
+
+# =============================================================================
+# JSON AND LOG FORMATTING
+# =============================================================================
+
+def _truncated_json(obj: Any, limit: int = 500, indent: Optional[int] = None) -> str:
+    """
+    Serialize obj to JSON, stopping once limit characters are produced.
+
+    Large node outputs are only ever shown as short previews, so encoding
+    stops early instead of serializing the whole structure and slicing.
+
+    Args:
+        obj: Value to serialize (non-JSON types fall back to str())
+        limit: Maximum length of the result
+        indent: JSON indent, as for json.dumps()
+
+    Returns:
+        At most limit characters of the JSON encoding
+    """
+    encoder = json.JSONEncoder(indent=indent, default=str)
+    parts = []
+    size = 0
+    for chunk in encoder.iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return ''.join(parts)[:limit]
+
+
+def _json_bytes(value: Any, indent: bool = False) -> bytes:
+    """
+    Serialize value to JSON with orjson.
+
+    Falls back to the json module for what orjson rejects, such as
+    integers wider than 64 bits (e.g. wei amounts).
+
+    Args:
+        value: Value to serialize (non-JSON types fall back to str())
+        indent: Indent with two spaces
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        return orjson.dumps(value, option=option, default=str)
+    except orjson.JSONEncodeError:
+        return json.dumps(
+            value, indent=2 if indent else None, default=str, ensure_ascii=False
+        ).encode('utf-8')
+
+
+@lru_cache(maxsize=1024)
+def _is_high_risk_category(category: str) -> bool:
+    """
+    Whether an exposure category is high risk.
+
+    Chainalysis returns a small, fixed set of category names, so the
+    answer is cached per name instead of re-scanned for every entry.
+    """
+    return HIGH_RISK_RE.search(category.lower()) is not None
+
+
+def _preview(value: Any, limit: int) -> str:
+    """Short display form of a node input, config or output value."""
+    if isinstance(value, str):
+        return value[:limit]
+    return _truncated_json(value, limit)
+
+
+# =============================================================================
+# EXPORT LIBRARIES
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _openpyxl_workbook():
+    """
+    Import openpyxl's Workbook class once (openpyxl is optional).
+
+    Raises:
+        ImportError: If openpyxl is not installed
+    """
+    from openpyxl import Workbook
+
+    return Workbook
+
+
+def _render_pdf(file_path: str, rows: List[dict], **options: Any) -> None:
+    """
+    Run pdf_report.render_pdf_report() in the PDF worker pool and wait.
+
+    Workers are spawned rather than forked, so they do not inherit the
+    server's threads or open database connections. A pool whose worker
+    died is discarded and recreated on the next report.
+    """
+    global _pdf_pool
+
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=PDF_RENDER_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        pool = _pdf_pool
+
+    try:
+        pool.submit(render_pdf_report, file_path, rows, **options).result()
+    except BrokenProcessPool:
+        with _pdf_pool_lock:
+            if _pdf_pool is pool:
+                _pdf_pool = None
+        raise
+
 
 # =============================================================================
 # EXCEPTIONS
@@ -42,11 +225,39 @@ class WorkflowExecutor:
         self.workflow = workflow
         self.execution_context: Dict[str, Any] = {}  # Stores node outputs
         self.execution_log: List[str] = []  # Execution log messages
+        self._capture_log = True  # Record messages in execution_log
+        self._context_lock = threading.Lock()  # Guards execution_context writes
+        self._incoming: Dict[str, List[dict]] = {}  # Edges by target node ID
+        self._chainalysis_clients: Dict[Tuple[str, str], Any] = {}  # By (api_key, api_url)
+        self._clients_lock = threading.Lock()
+        self._export_rows_cache: Dict[tuple, Tuple[tuple, List[dict]]] = {}  # See _prepare_export_data()
+        self._export_rows_lock = threading.Lock()
+
+    def _log_enabled(self) -> bool:
+        """Whether _log() messages are recorded or emitted anywhere."""
+        return self._capture_log or logger.isEnabledFor(logging.INFO)
+
+    def _log(self, message: str, *args):
+        """
+        Add message to execution log.
+
+        With args, message is %-formatted only when it is actually
+        recorded or emitted.
+        """
+        emit = logger.isEnabledFor(logging.INFO)
+        if not (self._capture_log or emit):
+            return
+
+        if args:
+            message = message % args
 
-    def _log(self, message: str):
-        """Add message to execution log."""
-        self.execution_log.append(message)
-        logger.info(message)
+        if self._capture_log:
+            buffer = _node_log_buffer.get()
+            if buffer is None:
+                buffer = self.execution_log
+            buffer.append(message)
+        if emit:
+            logger.info(message)
 
     def execute(self):
         """
@@ -57,14 +268,14 @@ class WorkflowExecutor:
         """
         from apps.execution.models import ExecutionLog
 
-        # Create execution log
-        execution = ExecutionLog.objects.create(
-            workflow=self.workflow,
-            status='PENDING'
-        )
+        # Only node outputs are stored on the ExecutionLog, so the message
+        # list is never read; messages still go to the logger
+        self._capture_log = False
+
+        # Create execution log, already marked as running
+        execution = ExecutionLog.create_started(self.workflow)
 
         try:
-            execution.start()
             result = self._execute_workflow()
             execution.complete(result_data=result)
 
@@ -125,18 +336,32 @@ class WorkflowExecutor:
         self._log(f"📊 Total Nodes: {len(nodes)}")
         self._log(f"🔗 Total Connections: {len(edges)}")
 
-        # Determine execution order (topological sort)
-        execution_order = self._topological_sort(nodes, edges)
+        # Determine execution order (topological sort, grouped by level)
+        levels = self._execution_levels(canvas_data, nodes, edges)
+
+        # Index edges by target once so gathering inputs never scans them all
+        self._incoming = {}
+        for edge in edges:
+            self._incoming.setdefault(edge.get('target'), []).append(edge)
 
         self._log("")
         self._log("📋 EXECUTION ORDER:")
-        for i, node_data in enumerate(execution_order):
-            node_type = node_data.get('type', node_data.get('data', {}).get('type', 'unknown'))
-            self._log(f"   {i + 1}. {node_type} ({node_data['id']})")
-
-        # Execute each node in order
-        for node_data in execution_order:
-            self._execute_node(node_data, edges)
+        position = 0
+        for level_index, level in enumerate(levels):
+            for node_data in level:
+                position += 1
+                node_type = self._node_type(node_data)
+                self._log(f"   {position}. {node_type} ({node_data['id']}) [level {level_index + 1}]")
+
+        # Execute level by level; nodes within a level are independent
+        with ThreadPoolExecutor(
+            max_workers=MAX_PARALLEL_NODES, thread_name_prefix='workflow-node'
+        ) as pool:
+            for level in levels:
+                if len(level) == 1:
+                    self._execute_node(level[0])
+                else:
+                    self._execute_level(pool, level)
 
         self._log("")
         self._log("═" * 60)
@@ -145,10 +370,61 @@ class WorkflowExecutor:
 
         return self.execution_context
 
-    def _execute_node(self, node_data: dict, edges: List[dict]):
+    def _execute_level(self, pool: ThreadPoolExecutor, level: List[dict]):
+        """
+        Execute the independent nodes of one dependency level concurrently.
+
+        Node handlers are synchronous and may query the ORM, so each one
+        runs on a pool thread. Log lines are flushed in level order once
+        every node has finished, and the first failure (in level order)
+        is re-raised after the others complete.
+        """
+        futures = [
+            pool.submit(self._execute_node_in_thread, node_data)
+            for node_data in level
+        ]
+
+        first_error = None
+        for future in futures:
+            buffer, error = future.result()
+            self.execution_log.extend(buffer)
+            if error is not None and first_error is None:
+                first_error = error
+
+        if first_error is not None:
+            raise first_error
+
+    def _execute_node_in_thread(self, node_data: dict) -> Tuple[List[str], Optional[BaseException]]:
+        """
+        Execute a node on a pool thread, buffering its log lines.
+
+        Returns:
+            Tuple of (log lines, exception raised or None)
+        """
+        buffer: List[str] = []
+        token = _node_log_buffer.set(buffer)
+        try:
+            self._execute_node(node_data)
+        except Exception as e:
+            return buffer, e
+        finally:
+            _node_log_buffer.reset(token)
+            connections.close_all()
+        return buffer, None
+
+    @staticmethod
+    def _node_type(node_data: dict) -> str:
+        """Node type from the node itself or, failing that, its data."""
+        node_type = node_data.get('type')
+        if node_type is None:
+            data = node_data.get('data')
+            node_type = data.get('type', 'unknown') if data else 'unknown'
+        return node_type
+
+    def _execute_node(self, node_data: dict):
         """Execute a single node."""
         node_id = node_data['id']
-        node_type = node_data.get('type', node_data.get('data', {}).get('type', 'unknown'))
+        node_type = self._node_type(node_data)
         config = node_data.get('data', {}).get('configValues', {})
 
         self._log("")
@@ -157,31 +433,35 @@ class WorkflowExecutor:
         self._log(f"  Node ID: {node_id}")
 
         # Get input data from connected nodes
-        input_data = self._get_node_inputs(node_id, edges)
+        input_data = self._get_node_inputs(node_id)
 
-        if input_data:
+        # str() of large inputs is costly, so only render them if logged
+        log_enabled = self._log_enabled()
+
+        if not input_data:
+            self._log("  📥 INPUTS: None (entry node)")
+        elif log_enabled:
             self._log("  📥 INPUTS:")
             for key, value in input_data.items():
-                display_value = str(value)[:80] if value else "(none)"
+                display_value = _preview(value, 80) if value else "(none)"
                 self._log(f"     • {key}: {display_value}")
-        else:
-            self._log("  📥 INPUTS: None (entry node)")
 
-        if config:
+        if config and log_enabled:
             self._log("  ⚙️ CONFIG:")
             for key, value in config.items():
-                display_value = str(value)[:50] if value else "(none)"
+                display_value = _preview(value, 50) if value else "(none)"
                 self._log(f"     • {key}: {display_value}")
 
         # Execute based on node type
         try:
-            result = self._run_node(node_type, node_id, input_data, config)
-            self.execution_context[node_id] = result
+            result = self._run_node_memoized(node_type, node_id, input_data, config)
+            with self._context_lock:
+                self.execution_context[node_id] = result
 
-            if result:
+            if result and log_enabled:
                 self._log("  📤 OUTPUTS:")
                 for key, value in result.items():
-                    display_value = str(value)[:80] if value else "(none)"
+                    display_value = _preview(value, 80) if value else "(none)"
                     self._log(f"     • {key}: {display_value}")
 
             self._log("  ✅ Node completed successfully")
@@ -190,162 +470,180 @@ class WorkflowExecutor:
             self._log(f"  ❌ Node FAILED: {str(e)}")
             raise
 
-    def _run_node(self, node_type: str, node_id: str, inputs: dict, config: dict) -> dict:
+    def _run_node_memoized(self, node_type: str, node_id: str, inputs: dict, config: dict) -> dict:
         """
-        Execute node based on type.
+        Run a node, reusing a cached result for pure node types.
 
-        This routes to the appropriate handler for each node type.
+        Only PURE_NODE_TYPES are cached, keyed by a hash of the node type,
+        config and inputs. Results carrying an 'error', or pickling to more
+        than NODE_RESULT_CACHE_MAX_BYTES, are never stored.
         """
-        # ═══════════════════════════════════════════════════════════════
-        # INPUT NODES
-        # ═══════════════════════════════════════════════════════════════
-
-        if node_type == 'single_address':
-            return {
-                'address': config.get('address', ''),
-                'blockchain': config.get('blockchain', 'bitcoin')
-            }
-
-        if node_type == 'batch_input':
-            # Parse uploaded file and extract addresses
-            file_info = config.get('file', {})
-            return self._parse_batch_input(file_info, config)
-
-        if node_type == 'transaction_hash':
-            return {
-                'tx_hash': config.get('tx_hash', ''),
-                'blockchain': config.get('blockchain', 'bitcoin')
-            }
-
-        if node_type == 'batch_transaction':
-            # Parse uploaded file and extract transaction hashes
-            file_info = config.get('file', {})
-            return self._parse_batch_transactions(file_info, config)
+        if node_type not in PURE_NODE_TYPES:
+            return self._run_node(node_type, node_id, inputs, config)
 
-        # ═══════════════════════════════════════════════════════════════
-        # CREDENTIAL NODES
-        # ═══════════════════════════════════════════════════════════════
+        payload = orjson.dumps(
+            [node_type, config, inputs],
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+        key = f"{NODE_RESULT_CACHE_PREFIX}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+        cached = cache.get(key)
+        if cached is not None:
+            self._log("  ♻️ Reusing cached result (same config and inputs)")
+            return pickle.loads(cached)
+
+        result = self._run_node(node_type, node_id, inputs, config)
+        if isinstance(result, dict) and not result.get('error'):
+            # Pickled here once so the size check and the cache share it
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            if len(data) <= NODE_RESULT_CACHE_MAX_BYTES:
+                cache.set(key, data, NODE_RESULT_CACHE_TTL)
+        return result
+
+    # Built-in node type -> name of its handler(inputs, config) method.
+    # Names rather than functions, so subclasses and tests can override them.
+    _NODE_HANDLERS: Dict[str, str] = {
+        # Input nodes
+        'single_address': '_single_address_node',
+        'batch_input': '_batch_input_node',
+        'transaction_hash': '_transaction_hash_node',
+        'batch_transaction': '_batch_transaction_node',
+        # Credential nodes
+        'credential_chainalysis': '_chainalysis_credentials_node',
+        'credential_trm': '_trm_credentials_node',
+        # Chainalysis query nodes
+        'chainalysis_cluster_info': '_execute_chainalysis_cluster_info',
+        'chainalysis_cluster_balance': '_execute_chainalysis_cluster_balance',
+        'chainalysis_cluster_counterparties': '_execute_chainalysis_counterparties',
+        'chainalysis_transaction_details': '_execute_chainalysis_transaction_details',
+        'chainalysis_exposure_category': '_execute_chainalysis_exposure_category',
+        'chainalysis_exposure_service': '_execute_chainalysis_exposure_service',
+        # TRM query nodes
+        'trm_address_risk': '_execute_trm_risk',
+        'trm_address_ownership': '_execute_trm_ownership',
+        # Output nodes
+        'csv_export': '_export_csv',
+        'pdf_export': '_pdf_export_node',
+        'json_export': '_export_json',
+        'excel_export': '_export_excel',
+        'txt_export': '_export_txt',
+        'output_path': '_output_path_node',
+        'console_log': '_console_log_node',
+    }
 
-        if node_type == 'credential_chainalysis':
-            return {
-                'credentials': {
-                    'type': 'chainalysis',
-                    'api_key': config.get('api_key', ''),
-                    'api_url': config.get('api_url', 'https://iapi.chainalysis.com'),
-                    'authenticated': bool(config.get('api_key'))
-                }
-            }
+    def _run_node(self, node_type: str, node_id: str, inputs: dict, config: dict) -> dict:
+        """
+        Execute node based on type.
 
-        if node_type == 'credential_trm':
-            return {
-                'credentials': {
-                    'type': 'trm',
-                    'api_key': config.get('api_key', ''),
-                    'authenticated': bool(config.get('api_key'))
-                }
-            }            
-            
-        # ═══════════════════════════════════════════════════════════════
-        # DATABASE-GENERATED CONFIG NODES
-        # ═══════════════════════════════════════════════════════════════
+        Built-in node types are looked up in _NODE_HANDLERS; anything else
+        is a '*_config' credential node or a database-generated API node.
+        """
+        handler = self._NODE_HANDLERS.get(node_type)
+        if handler is not None:
+            return getattr(self, handler)(inputs, config)
 
         if node_type.endswith('_config'):
-            # Configuration nodes (like coingecko_config)
-            return {
-                'credentials': {
-                    'type': 'apikey',
-                    'api_key': config.get('api_key', ''),
-                    'header': config.get('header_name', 'x-cg-demo-api-key'),
-                    'base_url': config.get('base_url', ''),
-                    'authenticated': bool(config.get('api_key'))
-                }
-            }
-
-        # ═══════════════════════════════════════════════════════════════
-        # CHAINALYSIS QUERY NODES
-        # ═══════════════════════════════════════════════════════════════
-
-        if node_type == 'chainalysis_cluster_info':
-            return self._execute_chainalysis_cluster_info(inputs, config)
-
-        if node_type == 'chainalysis_cluster_balance':
-            return self._execute_chainalysis_cluster_balance(inputs, config)
-
-        if node_type == 'chainalysis_cluster_counterparties':
-            return self._execute_chainalysis_counterparties(inputs, config)
-
-        if node_type == 'chainalysis_transaction_details':
-            return self._execute_chainalysis_transaction_details(inputs, config)
+            return self._api_config_node(inputs, config)
 
-        if node_type == 'chainalysis_exposure_category':
-            return self._execute_chainalysis_exposure_category(inputs, config)
+        return self._run_database_generated_node(node_type, inputs, config)
 
-        if node_type == 'chainalysis_exposure_service':
-            return self._execute_chainalysis_exposure_service(inputs, config)
-
-        # ═══════════════════════════════════════════════════════════════
-        # TRM QUERY NODES
-        # ═══════════════════════════════════════════════════════════════
-
-        if node_type == 'trm_address_risk':
-            return self._execute_trm_risk(inputs, config)
+    # ═══════════════════════════════════════════════════════════════════════
+    # BUILT-IN NODE HANDLERS
+    # ═══════════════════════════════════════════════════════════════════════
 
-        if node_type == 'trm_address_ownership':
-            return self._execute_trm_ownership(inputs, config)
+    def _single_address_node(self, inputs: dict, config: dict) -> dict:
+        """Input node: a single configured address."""
+        return {
+            'address': config.get('address', ''),
+            'blockchain': config.get('blockchain', 'bitcoin')
+        }
 
-        # ═══════════════════════════════════════════════════════════════
-        # OUTPUT NODES
-        # ═══════════════════════════════════════════════════════════════
+    def _batch_input_node(self, inputs: dict, config: dict) -> dict:
+        """Input node: parse uploaded file and extract addresses."""
+        file_info = config.get('file', {})
+        return self._parse_batch_input(file_info, config)
 
-        if node_type == 'csv_export':
-            return self._export_csv(inputs, config)
+    def _transaction_hash_node(self, inputs: dict, config: dict) -> dict:
+        """Input node: a single configured transaction hash."""
+        return {
+            'tx_hash': config.get('tx_hash', ''),
+            'blockchain': config.get('blockchain', 'bitcoin')
+        }
 
-        if node_type == 'pdf_export':
-            # Check which render engine to use
-            render_engine = config.get('render_engine', 'template')
-            if render_engine == 'template':
-                return self._export_pdf_template(inputs, config)
-            else:
-                return self._export_pdf(inputs, config)
+    def _batch_transaction_node(self, inputs: dict, config: dict) -> dict:
+        """Input node: parse uploaded file and extract transaction hashes."""
+        file_info = config.get('file', {})
+        return self._parse_batch_transactions(file_info, config)
 
-        if node_type == 'json_export':
-            return self._export_json(inputs, config)
+    def _chainalysis_credentials_node(self, inputs: dict, config: dict) -> dict:
+        """Credential node for the Chainalysis API."""
+        return {
+            'credentials': {
+                'type': 'chainalysis',
+                'api_key': config.get('api_key', ''),
+                'api_url': config.get('api_url', 'https://iapi.chainalysis.com'),
+                'authenticated': bool(config.get('api_key'))
+            }
+        }
 
-        if node_type == 'excel_export':
-            return self._export_excel(inputs, config)
+    def _trm_credentials_node(self, inputs: dict, config: dict) -> dict:
+        """Credential node for the TRM API."""
+        return {
+            'credentials': {
+                'type': 'trm',
+                'api_key': config.get('api_key', ''),
+                'authenticated': bool(config.get('api_key'))
+            }
+        }
 
-        if node_type == 'txt_export':
-            return self._export_txt(inputs, config)
+    def _api_config_node(self, inputs: dict, config: dict) -> dict:
+        """Database-generated configuration node (like coingecko_config)."""
+        return {
+            'credentials': {
+                'type': 'apikey',
+                'api_key': config.get('api_key', ''),
+                'header': config.get('header_name', 'x-cg-demo-api-key'),
+                'base_url': config.get('base_url', ''),
+                'authenticated': bool(config.get('api_key'))
+            }
+        }
 
-        if node_type == 'output_path':
-            # Output path node receives file_path from export node and can
-            # also provide its own configured path
-            output_config = config.get('output_path', {})
-            incoming_path = inputs.get('file_path_input', inputs.get('file_path', ''))
+    def _pdf_export_node(self, inputs: dict, config: dict) -> dict:
+        """Output node: PDF report using the configured render engine."""
+        render_engine = config.get('render_engine', 'template')
+        if render_engine == 'template':
+            return self._export_pdf_template(inputs, config)
+        else:
+            return self._export_pdf(inputs, config)
 
-            # If we have an incoming file and a configured destination, we could move/copy
-            # For now, just pass through the information
-            return {
-                'file_path': incoming_path if isinstance(incoming_path, str) else incoming_path.get('file_path', ''),
-                'configured_path': output_config.get('path', ''),
-                'final_path': incoming_path if isinstance(incoming_path, str) else incoming_path.get('file_path', '')
-            }
+    def _output_path_node(self, inputs: dict, config: dict) -> dict:
+        """
+        Output node: receives file_path from an export node and can also
+        provide its own configured path.
+        """
+        output_config = config.get('output_path', {})
+        incoming_path = inputs.get('file_path_input', inputs.get('file_path', ''))
+        file_path = incoming_path if isinstance(incoming_path, str) else incoming_path.get('file_path', '')
 
-        if node_type == 'console_log':
-            # Log all input data to console
-            self._log(f"  📝 CONSOLE OUTPUT:")
-            for key, value in inputs.items():
-                display = json.dumps(value, indent=2, default=str)[:500]
-                self._log(f"     {key}: {display}")
-            return {'logged': True, 'data': inputs}
+        # If we have an incoming file and a configured destination, we could move/copy
+        # For now, just pass through the information
+        return {
+            'file_path': file_path,
+            'configured_path': output_config.get('path', ''),
+            'final_path': file_path
+        }
 
-        # Check if this is a database-generated node
-        # ═══════════════════════════════════════════════════════════════
-        # DATABASE-GENERATED NODES (from OpenAPI specs)
-        # ═══════════════════════════════════════════════════════════════
+    def _console_log_node(self, inputs: dict, config: dict) -> dict:
+        """Output node: log all input data to console."""
+        self._log(f"  📝 CONSOLE OUTPUT:")
+        for key, value in inputs.items():
+            display = _truncated_json(value, 500, indent=2)
+            self._log(f"     {key}: {display}")
+        return {'logged': True, 'data': inputs}
 
-        # Check if this is a database-generated node
-        from apps.integrations.models import OpenAPISpec
+    def _run_database_generated_node(self, node_type: str, inputs: dict, config: dict) -> dict:
+        """Execute a node generated from a provider's OpenAPI spec."""
 
         try:
             # Parse node_type: "etherscan_getaddresstokenbalance"
@@ -362,35 +660,24 @@ class WorkflowExecutor:
             
             self._log(f"  [DATABASE] Looking for provider='{provider}', operation_id='{operation_id_lower}'")
             
-            # Get the OpenAPI spec for this provider
-            spec = OpenAPISpec.objects.filter(
-                provider=provider,
-                is_active=True,
-                is_parsed=True
-            ).first()
+            # Get the registered endpoints of the provider's OpenAPI spec
+            provider_nodes = get_provider_nodes(provider)
             
-            if not spec:
+            if not provider_nodes:
                 self._log(f"  [DATABASE] No active spec for provider: {provider}")
                 return {}
             
-            # Find matching endpoint (case-insensitive operation_id match)
-            endpoints = spec.parsed_data.get('endpoints', [])
-            if not endpoints:
+            spec = provider_nodes.spec
+            if not provider_nodes.operation_ids:
                 self._log(f"  [DATABASE] No endpoints in spec for: {provider}")
                 return {}
             
-            endpoint = None
-            for ep in endpoints:
-                ep_op_id = ep.get('operation_id', '')
-                
-                # Case-insensitive comparison
-                if ep_op_id.lower() == operation_id_lower:
-                    endpoint = ep
-                    break
+            # Find matching endpoint (case-insensitive operation_id match)
+            endpoint = provider_nodes.endpoints.get(operation_id_lower)
             
             if not endpoint:
                 self._log(f"  [DATABASE] No endpoint found with operation_id matching '{operation_id_lower}'")
-                self._log(f"  [DATABASE] Available: {[e.get('operation_id') for e in endpoints]}")
+                self._log(f"  [DATABASE] Available: {provider_nodes.operation_ids}")
                 return {}
             
             # Found it!
@@ -404,10 +691,6 @@ class WorkflowExecutor:
             import traceback
             self._log(f"  [DATABASE] Traceback: {traceback.format_exc()}")
             return {}
-        
-        # # Unknown node type - return empty
-        # self._log(f"  ⚠️ Unknown node type: {node_type}")
-        # return {}
 
     # ═══════════════════════════════════════════════════════════════════════
     # DATABASE NODE EXECUTION METHODS
@@ -430,7 +713,6 @@ class WorkflowExecutor:
             Returns:
                 Execution results
             """
-            from apps.execution.api_executor import GenericAPIExecutor, APIExecutionError
             
             self._log(f"  [EXEC] Executing: {db_node.get('node_type')}")
             
@@ -537,22 +819,70 @@ class WorkflowExecutor:
         """
         Get Chainalysis API client with credentials.
 
+        One client is kept per (api_key, api_url) for the lifetime of the
+        executor; all clients share the module's HTTP/2 connection pool.
+
         Args:
             credentials: Credentials from node input (may contain api_key, api_url)
 
         Returns:
             ChainalysisClient instance
         """
-        from apps.integrations.chainalysis_client import ChainalysisClient, ChainalysisAPIError
 
         api_key = credentials.get('api_key', '') if credentials else ''
         api_url = credentials.get('api_url', '') if credentials else ''
+        key = (api_key, api_url if api_key else '')
+
+        with self._clients_lock:
+            client = self._chainalysis_clients.get(key)
+            if client is None:
+                # If no credentials from node, client will use settings
+                if api_key:
+                    client = ChainalysisClient(api_key=api_key, base_url=api_url if api_url else None)
+                else:
+                    client = ChainalysisClient()
+                self._chainalysis_clients[key] = client
+            return client
 
-        # If no credentials from node, client will use settings
-        if api_key:
-            return ChainalysisClient(api_key=api_key, base_url=api_url if api_url else None)
-        else:
-            return ChainalysisClient()
+    @staticmethod
+    def _normalize_addresses(inputs: dict) -> List[str]:
+        """
+        Get the addresses a batch query node should look up.
+
+        Accepts a list on the 'address' input, a batch node's 'addresses'
+        input, or a single address string.
+
+        Args:
+            inputs: Node inputs
+
+        Returns:
+            List of addresses (empty if none were provided)
+        """
+        address = inputs.get('address', '')
+        if isinstance(address, list):
+            return address
+        if 'addresses' in inputs:
+            return inputs.get('addresses', [])
+        return [address] if address else []
+
+    def _address_batch(self, addresses: List[str]) -> List[str]:
+        """
+        Limit addresses to one client batch, noting repeated addresses.
+
+        The client's batch methods request each unique address once and
+        the result rows are fanned back out to every position.
+
+        Args:
+            addresses: Normalized node addresses
+
+        Returns:
+            The first BATCH_SIZE addresses, duplicates included
+        """
+        batch = addresses[:BATCH_SIZE]
+        duplicates = len(batch) - len(set(batch))
+        if duplicates:
+            self._log("  [API] %s repeated address(es) looked up once", duplicates)
+        return batch
 
     def _execute_chainalysis_cluster_info(self, inputs: dict, config: dict) -> dict:
         """
@@ -561,18 +891,9 @@ class WorkflowExecutor:
         API Endpoint: GET /clusters/{address}
         Returns: cluster name, category, and root address
         """
-        from apps.integrations.chainalysis_client import ChainalysisClient, ChainalysisAPIError
 
         credentials = inputs.get('credentials', {})
-        address = inputs.get('address', '')
-
-        # Handle batch addresses
-        if isinstance(address, list):
-            addresses = address
-        elif 'addresses' in inputs:
-            addresses = inputs.get('addresses', [])
-        else:
-            addresses = [address] if address else []
+        addresses = self._normalize_addresses(inputs)
 
         if not addresses:
             return {'error': 'No address provided'}
@@ -584,11 +905,13 @@ class WorkflowExecutor:
         try:
             client = self._get_chainalysis_client(credentials)
 
-            results = []
-            for addr in addresses[:100]:  # Limit to 100 per batch
-                try:
-                    response = client.get_cluster_info(address=addr, asset=asset)
+            batch = self._address_batch(addresses)
+            responses = client.get_cluster_info_batch(batch, asset=asset)
 
+            results = []
+            for addr in batch:
+                response = responses[addr]
+                if not isinstance(response, ChainalysisAPIError):
                     results.append({
                         'address': addr,
                         'cluster_name': response.get('clusterName', 'Unknown'),
@@ -596,20 +919,24 @@ class WorkflowExecutor:
                         'cluster_address': response.get('rootAddress', addr)
                     })
 
-                    self._log(f"     {addr[:12]}... -> {response.get('clusterName', 'Unknown')} ({response.get('category', 'Unknown')})")
-
-                except ChainalysisAPIError as e:
-                    if e.status_code == 404:
-                        # Address not found - not an error, just unknown
-                        results.append({
-                            'address': addr,
-                            'cluster_name': 'Unknown',
-                            'category': 'Unknown',
-                            'cluster_address': addr
-                        })
-                        self._log(f"     {addr[:12]}... -> Not found in database")
-                    else:
-                        raise
+                    self._log(
+                        "     %s... -> %s (%s)",
+                        addr[:12],
+                        response.get('clusterName', 'Unknown'),
+                        response.get('category', 'Unknown')
+                    )
+
+                elif response.status_code == 404:
+                    # Address not found - not an error, just unknown
+                    results.append({
+                        'address': addr,
+                        'cluster_name': 'Unknown',
+                        'category': 'Unknown',
+                        'cluster_address': addr
+                    })
+                    self._log("     %s... -> Not found in database", addr[:12])
+                else:
+                    raise response
 
             # Return both list for batch and individual fields for single address
             return {
@@ -725,7 +1052,6 @@ class WorkflowExecutor:
             # === MAKE REQUEST ===
             self._log(f"  [REQUEST] Params: {list(params.keys())}")
             
-            from apps.execution.api_executor import GenericAPIExecutor
 
             executor = GenericAPIExecutor()
             response = executor.execute({
@@ -754,18 +1080,9 @@ class WorkflowExecutor:
         API Endpoint: GET /clusters/{address}/{asset}/summary
         Returns: balance, totalSent, totalReceived, transferCount, etc.
         """
-        from apps.integrations.chainalysis_client import ChainalysisClient, ChainalysisAPIError
 
         credentials = inputs.get('credentials', {})
-        address = inputs.get('address', '')
-
-        # Also check for 'addresses' from batch input
-        if isinstance(address, list):
-            addresses = address
-        elif 'addresses' in inputs:
-            addresses = inputs.get('addresses', [])
-        else:
-            addresses = [address] if address else []
+        addresses = self._normalize_addresses(inputs)
 
         if not addresses:
             return {'error': 'No address provided'}
@@ -780,15 +1097,17 @@ class WorkflowExecutor:
         try:
             client = self._get_chainalysis_client(credentials)
 
-            results = []
-            for addr in addresses[:100]:  # Limit to 100 per batch
-                try:
-                    response = client.get_cluster_balance(
-                        address=addr,
-                        asset=asset,
-                        output_asset=output_asset
-                    )
+            batch = self._address_batch(addresses)
+            responses = client.get_cluster_balance_batch(
+                batch,
+                asset=asset,
+                output_asset=output_asset
+            )
 
+            results = []
+            for addr in batch:
+                response = responses[addr]
+                if not isinstance(response, ChainalysisAPIError):
                     results.append({
                         'address': addr,
                         'balance': response.get('balance', 0),
@@ -802,26 +1121,30 @@ class WorkflowExecutor:
                         'total_received_fees': response.get('totalReceivedFees', 0)
                     })
 
-                    self._log(f"     {addr[:12]}... -> Balance: {response.get('balance', 0)}, Transfers: {response.get('transferCount', 0)}")
-
-                except ChainalysisAPIError as e:
-                    if e.status_code == 404:
-                        # Address not found - return zeros
-                        results.append({
-                            'address': addr,
-                            'balance': 0,
-                            'total_sent': 0,
-                            'total_received': 0,
-                            'transfer_count': 0,
-                            'deposit_count': 0,
-                            'withdrawal_count': 0,
-                            'address_count': 0,
-                            'total_sent_fees': 0,
-                            'total_received_fees': 0
-                        })
-                        self._log(f"     {addr[:12]}... -> Not found in database")
-                    else:
-                        raise
+                    self._log(
+                        "     %s... -> Balance: %s, Transfers: %s",
+                        addr[:12],
+                        response.get('balance', 0),
+                        response.get('transferCount', 0)
+                    )
+
+                elif response.status_code == 404:
+                    # Address not found - return zeros
+                    results.append({
+                        'address': addr,
+                        'balance': 0,
+                        'total_sent': 0,
+                        'total_received': 0,
+                        'transfer_count': 0,
+                        'deposit_count': 0,
+                        'withdrawal_count': 0,
+                        'address_count': 0,
+                        'total_sent_fees': 0,
+                        'total_received_fees': 0
+                    })
+                    self._log("     %s... -> Not found in database", addr[:12])
+                else:
+                    raise response
 
             return {
                 'balance_data': results,
@@ -857,18 +1180,9 @@ class WorkflowExecutor:
         Returns: list of counterparty addresses with transaction volumes,
                  grouped by source address when multiple addresses are input.
         """
-        from apps.integrations.chainalysis_client import ChainalysisClient, ChainalysisAPIError
 
         credentials = inputs.get('credentials', {})
-        address = inputs.get('address', '')
-
-        # Handle batch addresses - process ALL of them, not just the first
-        if isinstance(address, list):
-            addresses = address
-        elif 'addresses' in inputs:
-            addresses = inputs.get('addresses', [])
-        else:
-            addresses = [address] if address else []
+        addresses = self._normalize_addresses(inputs)
 
         if not addresses:
             return {'error': 'No address provided'}
@@ -888,16 +1202,18 @@ class WorkflowExecutor:
             all_counterparties = []
             total_count = 0
 
-            for addr in addresses[:100]:  # Limit to 100 addresses per batch
-                try:
-                    response = client.get_cluster_counterparties(
-                        address=addr,
-                        asset=asset,
-                        output_asset=output_asset,
-                        direction=direction,
-                        limit=100
-                    )
+            batch = self._address_batch(addresses)
+            responses = client.get_cluster_counterparties_batch(
+                batch,
+                asset=asset,
+                output_asset=output_asset,
+                direction=direction,
+                limit=100
+            )
 
+            for addr in batch:
+                response = responses[addr]
+                if not isinstance(response, ChainalysisAPIError):
                     # Parse counterparties from response
                     counterparties = response if isinstance(response, list) else response.get('items', [])
 
@@ -915,20 +1231,19 @@ class WorkflowExecutor:
                     })
 
                     total_count += len(counterparties)
-                    self._log(f"     {addr[:12]}... -> {len(counterparties)} counterparties")
-
-                except ChainalysisAPIError as e:
-                    if e.status_code == 404:
-                        # Address not found - add empty result
-                        results_by_address.append({
-                            'source_address': addr,
-                            'counterparties': [],
-                            'count': 0,
-                            'error': 'Not found in database'
-                        })
-                        self._log(f"     {addr[:12]}... -> Not found in database")
-                    else:
-                        raise
+                    self._log("     %s... -> %s counterparties", addr[:12], len(counterparties))
+
+                elif response.status_code == 404:
+                    # Address not found - add empty result
+                    results_by_address.append({
+                        'source_address': addr,
+                        'counterparties': [],
+                        'count': 0,
+                        'error': 'Not found in database'
+                    })
+                    self._log("     %s... -> Not found in database", addr[:12])
+                else:
+                    raise response
 
             self._log(f"     Total: {total_count} counterparties from {len(addresses)} addresses")
 
@@ -973,7 +1288,6 @@ class WorkflowExecutor:
         API Endpoint: GET /transactions/{hash}/{asset}/details
         Returns: transaction details including inputs, outputs, fees, etc.
         """
-        from apps.integrations.chainalysis_client import ChainalysisClient, ChainalysisAPIError
 
         credentials = inputs.get('credentials', {})
         tx_hash = inputs.get('tx_hash', inputs.get('transaction_hash', ''))
@@ -1034,38 +1348,85 @@ class WorkflowExecutor:
                 'tx_hash': tx_hash
             }
 
+    @staticmethod
+    def _summarize_exposure(exposures: List[dict], exposure_type: str, high_risk_flags: List[dict]):
+        """
+        Total exposure values and collect high-risk categories in one pass.
+
+        Args:
+            exposures: Exposure entries ({'category', 'value', 'percentage'})
+            exposure_type: 'direct' or 'indirect', recorded on each flag
+            high_risk_flags: List that high-risk entries are appended to
+
+        Returns:
+            Sum of the entries' values
+        """
+        total = 0
+        for exp in exposures:
+            value = exp.get('value', 0)
+            total += value
+            category = exp.get('category')
+            if category and _is_high_risk_category(category):
+                high_risk_flags.append({
+                    'category': category,
+                    'value': value,
+                    'percentage': exp.get('percentage', 0),
+                    'exposure_type': exposure_type
+                })
+        return total
+
+    @staticmethod
+    def _summarize_services(exposures: List[dict], top_n: int = 5) -> Tuple[float, List[dict]]:
+        """
+        Total and largest entries of an exposure by service list.
+
+        Args:
+            exposures: Exposure entries (dicts with 'value')
+            top_n: Number of largest entries to keep
+
+        Returns:
+            Sum of the entries' values, and the top_n entries by value
+            (largest first, earlier entries first on ties)
+        """
+        total = 0
+        # Min-heap of (value, -position, entry); the position breaks ties
+        # so entries themselves are never compared
+        top = []
+        for position, exp in enumerate(exposures):
+            value = exp.get('value', 0)
+            total += value
+            item = (value, -position, exp)
+            if len(top) < top_n:
+                heapq.heappush(top, item)
+            elif item[:2] > top[0][:2]:
+                heapq.heapreplace(top, item)
+        return total, [exp for _, _, exp in sorted(top, key=lambda item: item[:2], reverse=True)]
+
     def _execute_chainalysis_exposure_category(self, inputs: dict, config: dict) -> dict:
         """
         Execute Chainalysis Exposure by Category query.
 
         API Endpoint: GET /exposures/clusters/{address}/{asset}/directions/{direction}
-        Returns: exposure analysis by category (direct and indirect)
+        Returns: exposure analysis by category (direct and indirect);
+                 batches are queried concurrently and aggregated.
         """
-        from apps.integrations.chainalysis_client import ChainalysisClient, ChainalysisAPIError
 
         credentials = inputs.get('credentials', {})
-        address = inputs.get('address', '')
+        addresses = self._normalize_addresses(inputs)
 
-        # Handle batch addresses - use first one
-        if isinstance(address, list):
-            address = address[0] if address else ''
-
-        if not address:
+        if not addresses:
             return {'error': 'No address provided'}
 
+        if len(addresses) > 1:
+            return self._execute_chainalysis_exposure_category_batch(addresses, credentials, config)
+
+        address = addresses[0]
         asset = config.get('asset', 'bitcoin')
         direction = config.get('direction', 'sent')
         output_asset = config.get('output_asset', 'USD')
 
         self._log(f"  [API] Chainalysis: Exposure by Category for {address[:12]}... ({direction})")
 
-        # High-risk categories for flagging
-        HIGH_RISK_CATEGORIES = [
-            'darknet', 'ransomware', 'scam', 'stolen funds',
-            'sanctions', 'child abuse', 'terrorism financing',
-            'fraud', 'illicit'
-        ]
-
         try:
             client = self._get_chainalysis_client(credentials)
 
@@ -1075,70 +1436,12 @@ class WorkflowExecutor:
                 direction=direction,
                 output_asset=output_asset
             )
-
-            # Parse exposure data
-            direct_exposure = response.get('direct', [])
-            indirect_exposure = response.get('indirect', [])
-
-            # Calculate totals
-            total_direct = sum(e.get('value', 0) for e in direct_exposure)
-            total_indirect = sum(e.get('value', 0) for e in indirect_exposure)
-            total_risk = total_direct + total_indirect
-
-            # Identify high-risk flags
-            high_risk_flags = []
-            for exp in direct_exposure:
-                category = exp.get('category', '').lower()
-                if any(hr in category for hr in HIGH_RISK_CATEGORIES):
-                    high_risk_flags.append({
-                        'category': exp.get('category'),
-                        'value': exp.get('value', 0),
-                        'percentage': exp.get('percentage', 0),
-                        'exposure_type': 'direct'
-                    })
-
-            for exp in indirect_exposure:
-                category = exp.get('category', '').lower()
-                if any(hr in category for hr in HIGH_RISK_CATEGORIES):
-                    high_risk_flags.append({
-                        'category': exp.get('category'),
-                        'value': exp.get('value', 0),
-                        'percentage': exp.get('percentage', 0),
-                        'exposure_type': 'indirect'
-                    })
-
-            self._log(f"     Direct exposure: {len(direct_exposure)} categories, total: {total_direct:,.2f}")
-            self._log(f"     Indirect exposure: {len(indirect_exposure)} categories, total: {total_indirect:,.2f}")
-            if high_risk_flags:
-                self._log(f"     ⚠️ HIGH RISK FLAGS: {len(high_risk_flags)}")
-
-            return {
-                'exposure_data': response,
-                'direct_exposure': direct_exposure,
-                'indirect_exposure': indirect_exposure,
-                'total_direct': total_direct,
-                'total_indirect': total_indirect,
-                'total_risk': total_risk,
-                'high_risk_flags': high_risk_flags,
-                'has_high_risk': len(high_risk_flags) > 0,
-                'address': address,
-                'direction': direction
-            }
+            return self._exposure_category_result(address, response, direction)
 
         except ChainalysisAPIError as e:
             if e.status_code == 404:
                 self._log(f"     Address not found in database")
-                return {
-                    'exposure_data': {},
-                    'direct_exposure': [],
-                    'indirect_exposure': [],
-                    'total_direct': 0,
-                    'total_indirect': 0,
-                    'total_risk': 0,
-                    'high_risk_flags': [],
-                    'has_high_risk': False,
-                    'address': address
-                }
+                return self._exposure_category_result(address, None, direction)
 
             self._log(f"  [ERROR] Chainalysis API: {e.user_message}")
             return {
@@ -1154,25 +1457,153 @@ class WorkflowExecutor:
                 'address': address
             }
 
+    def _exposure_category_result(self, address: str, response: Optional[dict], direction: str) -> dict:
+        """
+        Build the exposure by category output for one address.
+
+        Args:
+            address: Queried address
+            response: API response, or None if the address was not found
+            direction: Exposure direction queried
+        """
+        if response is None:
+            return {
+                'exposure_data': {},
+                'direct_exposure': [],
+                'indirect_exposure': [],
+                'total_direct': 0,
+                'total_indirect': 0,
+                'total_risk': 0,
+                'high_risk_flags': [],
+                'has_high_risk': False,
+                'address': address
+            }
+
+        # Parse exposure data
+        direct_exposure = response.get('direct', [])
+        indirect_exposure = response.get('indirect', [])
+
+        # Calculate totals and identify high-risk flags in one pass each
+        high_risk_flags = []
+        total_direct = self._summarize_exposure(direct_exposure, 'direct', high_risk_flags)
+        total_indirect = self._summarize_exposure(indirect_exposure, 'indirect', high_risk_flags)
+        total_risk = total_direct + total_indirect
+
+        self._log(f"     Direct exposure: {len(direct_exposure)} categories, total: {total_direct:,.2f}")
+        self._log(f"     Indirect exposure: {len(indirect_exposure)} categories, total: {total_indirect:,.2f}")
+        if high_risk_flags:
+            self._log(f"     ⚠️ HIGH RISK FLAGS: {len(high_risk_flags)}")
+
+        return {
+            'exposure_data': response,
+            'direct_exposure': direct_exposure,
+            'indirect_exposure': indirect_exposure,
+            'total_direct': total_direct,
+            'total_indirect': total_indirect,
+            'total_risk': total_risk,
+            'high_risk_flags': high_risk_flags,
+            'has_high_risk': len(high_risk_flags) > 0,
+            'address': address,
+            'direction': direction
+        }
+
+    def _execute_chainalysis_exposure_category_batch(
+        self,
+        addresses: List[str],
+        credentials: dict,
+        config: dict
+    ) -> dict:
+        """
+        Exposure by category for several addresses, queried concurrently.
+
+        Returns:
+            Per-address results (same shape as a single-address query)
+            plus totals and high-risk flags summed across the batch
+        """
+        direction = config.get('direction', 'sent')
+
+        self._log(f"  [API] Chainalysis: Exposure by Category for {len(addresses)} address(es) ({direction})")
+
+        try:
+            client = self._get_chainalysis_client(credentials)
+            batch = self._address_batch(addresses)
+            responses = client.get_exposure_by_category_batch(
+                batch,
+                asset=config.get('asset', 'bitcoin'),
+                direction=direction,
+                output_asset=config.get('output_asset', 'USD')
+            )
+
+            per_address = []
+            for addr in batch:
+                self._log("     %s...", addr[:12])
+                per_address.append(
+                    self._exposure_category_result(addr, self._exposure_response(responses[addr]), direction)
+                )
+
+            high_risk_flags = [
+                dict(flag, address=result['address'])
+                for result in per_address
+                for flag in result['high_risk_flags']
+            ]
+            total_direct = sum(result['total_direct'] for result in per_address)
+            total_indirect = sum(result['total_indirect'] for result in per_address)
+
+            return {
+                'per_address': per_address,
+                'count': len(per_address),
+                'total_direct': total_direct,
+                'total_indirect': total_indirect,
+                'total_risk': total_direct + total_indirect,
+                'high_risk_flags': high_risk_flags,
+                'has_high_risk': len(high_risk_flags) > 0,
+                'address': addresses,
+                'direction': direction
+            }
+
+        except ChainalysisAPIError as e:
+            self._log(f"  [ERROR] Chainalysis API: {e.user_message}")
+            return {'error': e.user_message, 'per_address': [], 'count': 0}
+        except ValueError as e:
+            self._log(f"  [ERROR] {str(e)}")
+            return {'error': str(e), 'per_address': [], 'count': 0}
+
+    def _exposure_response(self, response):
+        """
+        Unwrap one batch exposure response.
+
+        Returns:
+            The response, or None for an address not in the database
+
+        Raises:
+            ChainalysisAPIError: For any other API error
+        """
+        if isinstance(response, ChainalysisAPIError):
+            if response.status_code != 404:
+                raise response
+            self._log("     Address not found in database")
+            return None
+        return response
+
     def _execute_chainalysis_exposure_service(self, inputs: dict, config: dict) -> dict:
         """
         Execute Chainalysis Exposure by Service query.
 
         API Endpoint: GET /exposures/clusters/{address}/{asset}/directions/{direction}/services
-        Returns: exposure analysis by specific services
+        Returns: exposure analysis by specific services; batches are
+                 queried concurrently and aggregated.
         """
-        from apps.integrations.chainalysis_client import ChainalysisClient, ChainalysisAPIError
 
         credentials = inputs.get('credentials', {})
-        address = inputs.get('address', '')
-
-        # Handle batch addresses - use first one
-        if isinstance(address, list):
-            address = address[0] if address else ''
+        addresses = self._normalize_addresses(inputs)
 
-        if not address:
+        if not addresses:
             return {'error': 'No address provided'}
 
+        if len(addresses) > 1:
+            return self._execute_chainalysis_exposure_service_batch(addresses, credentials, config)
+
+        address = addresses[0]
         asset = config.get('asset', 'bitcoin')
         direction = config.get('direction', 'sent')
         output_asset = config.get('output_asset', 'USD')
@@ -1188,53 +1619,12 @@ class WorkflowExecutor:
                 direction=direction,
                 output_asset=output_asset
             )
-
-            # Parse exposure data
-            direct_exposure = response.get('direct', [])
-            indirect_exposure = response.get('indirect', [])
-
-            # Calculate totals
-            total_direct = sum(e.get('value', 0) for e in direct_exposure)
-            total_indirect = sum(e.get('value', 0) for e in indirect_exposure)
-
-            # Get top services
-            top_direct_services = sorted(direct_exposure, key=lambda x: x.get('value', 0), reverse=True)[:5]
-            top_indirect_services = sorted(indirect_exposure, key=lambda x: x.get('value', 0), reverse=True)[:5]
-
-            self._log(f"     Direct exposure: {len(direct_exposure)} services, total: {total_direct:,.2f}")
-            self._log(f"     Indirect exposure: {len(indirect_exposure)} services, total: {total_indirect:,.2f}")
-
-            if top_direct_services:
-                top_names = [s.get('service', s.get('name', 'Unknown')) for s in top_direct_services[:3]]
-                self._log(f"     Top services: {', '.join(top_names)}")
-
-            return {
-                'exposure_data': response,
-                'direct_exposure': direct_exposure,
-                'indirect_exposure': indirect_exposure,
-                'total_direct': total_direct,
-                'total_indirect': total_indirect,
-                'top_direct_services': top_direct_services,
-                'top_indirect_services': top_indirect_services,
-                'service_count': len(direct_exposure) + len(indirect_exposure),
-                'address': address,
-                'direction': direction
-            }
+            return self._exposure_service_result(address, response, direction)
 
         except ChainalysisAPIError as e:
             if e.status_code == 404:
                 self._log(f"     Address not found in database")
-                return {
-                    'exposure_data': {},
-                    'direct_exposure': [],
-                    'indirect_exposure': [],
-                    'total_direct': 0,
-                    'total_indirect': 0,
-                    'top_direct_services': [],
-                    'top_indirect_services': [],
-                    'service_count': 0,
-                    'address': address
-                }
+                return self._exposure_service_result(address, None, direction)
 
             self._log(f"  [ERROR] Chainalysis API: {e.user_message}")
             return {
@@ -1250,6 +1640,127 @@ class WorkflowExecutor:
                 'address': address
             }
 
+    def _exposure_service_result(self, address: str, response: Optional[dict], direction: str) -> dict:
+        """
+        Build the exposure by service output for one address.
+
+        Args:
+            address: Queried address
+            response: API response, or None if the address was not found
+            direction: Exposure direction queried
+        """
+        if response is None:
+            return {
+                'exposure_data': {},
+                'direct_exposure': [],
+                'indirect_exposure': [],
+                'total_direct': 0,
+                'total_indirect': 0,
+                'top_direct_services': [],
+                'top_indirect_services': [],
+                'service_count': 0,
+                'address': address
+            }
+
+        # Parse exposure data
+        direct_exposure = response.get('direct', [])
+        indirect_exposure = response.get('indirect', [])
+
+        # Calculate totals and top services in one pass each
+        total_direct, top_direct_services = self._summarize_services(direct_exposure)
+        total_indirect, top_indirect_services = self._summarize_services(indirect_exposure)
+
+        self._log(f"     Direct exposure: {len(direct_exposure)} services, total: {total_direct:,.2f}")
+        self._log(f"     Indirect exposure: {len(indirect_exposure)} services, total: {total_indirect:,.2f}")
+
+        if top_direct_services:
+            top_names = [s.get('service', s.get('name', 'Unknown')) for s in top_direct_services[:3]]
+            self._log(f"     Top services: {', '.join(top_names)}")
+
+        return {
+            'exposure_data': response,
+            'direct_exposure': direct_exposure,
+            'indirect_exposure': indirect_exposure,
+            'total_direct': total_direct,
+            'total_indirect': total_indirect,
+            'top_direct_services': top_direct_services,
+            'top_indirect_services': top_indirect_services,
+            'service_count': len(direct_exposure) + len(indirect_exposure),
+            'address': address,
+            'direction': direction
+        }
+
+    @staticmethod
+    def _top_batch_services(per_address: List[dict], key: str, top_n: int = 5) -> List[dict]:
+        """
+        Largest services across a batch, each tagged with its address.
+
+        The batch top_n is always among the per-address top_n lists, so
+        only those are ranked.
+        """
+        return heapq.nlargest(
+            top_n,
+            (
+                dict(service, address=result['address'])
+                for result in per_address
+                for service in result[key]
+            ),
+            key=lambda x: x.get('value', 0)
+        )
+
+    def _execute_chainalysis_exposure_service_batch(
+        self,
+        addresses: List[str],
+        credentials: dict,
+        config: dict
+    ) -> dict:
+        """
+        Exposure by service for several addresses, queried concurrently.
+
+        Returns:
+            Per-address results (same shape as a single-address query)
+            plus totals and service counts summed across the batch
+        """
+        direction = config.get('direction', 'sent')
+
+        self._log(f"  [API] Chainalysis: Exposure by Service for {len(addresses)} address(es) ({direction})")
+
+        try:
+            client = self._get_chainalysis_client(credentials)
+            batch = self._address_batch(addresses)
+            responses = client.get_exposure_by_service_batch(
+                batch,
+                asset=config.get('asset', 'bitcoin'),
+                direction=direction,
+                output_asset=config.get('output_asset', 'USD')
+            )
+
+            per_address = []
+            for addr in batch:
+                self._log("     %s...", addr[:12])
+                per_address.append(
+                    self._exposure_service_result(addr, self._exposure_response(responses[addr]), direction)
+                )
+
+            return {
+                'per_address': per_address,
+                'count': len(per_address),
+                'total_direct': sum(result['total_direct'] for result in per_address),
+                'total_indirect': sum(result['total_indirect'] for result in per_address),
+                'service_count': sum(result['service_count'] for result in per_address),
+                'top_direct_services': self._top_batch_services(per_address, 'top_direct_services'),
+                'top_indirect_services': self._top_batch_services(per_address, 'top_indirect_services'),
+                'address': addresses,
+                'direction': direction
+            }
+
+        except ChainalysisAPIError as e:
+            self._log(f"  [ERROR] Chainalysis API: {e.user_message}")
+            return {'error': e.user_message, 'per_address': [], 'count': 0}
+        except ValueError as e:
+            self._log(f"  [ERROR] {str(e)}")
+            return {'error': str(e), 'per_address': [], 'count': 0}
+
     # ═══════════════════════════════════════════════════════════════════════
     # TRM API METHODS
     # ═══════════════════════════════════════════════════════════════════════
@@ -1330,108 +1841,134 @@ class WorkflowExecutor:
     # EXPORT METHODS
     # ═══════════════════════════════════════════════════════════════════════
 
+    # Recognized query node outputs -> method turning them into export
+    # rows (None when the value does not have the expected shape)
+    _EXPORT_SOURCES = (
+        ('balance_data', '_record_rows'),  # cluster_balance node
+        ('cluster_info', '_record_rows'),  # cluster_info node
+        # Grouped counterparties (new format with source tracking)
+        ('counterparties_by_address', '_grouped_counterparty_rows'),
+        # Flat counterparties list (already has source_address if from new method)
+        ('counterparties', '_record_rows'),
+        ('addresses', '_address_rows'),  # batch_input node
+    )
+
+    @staticmethod
+    def _record_rows(value: Any) -> Optional[Iterable[dict]]:
+        """A list of records as-is, or a single record as one row."""
+        if isinstance(value, list):
+            return value
+        if isinstance(value, dict):
+            return (value,)
+        return None
+
+    @staticmethod
+    def _grouped_counterparty_rows(groups: List[dict]) -> Optional[Iterable[dict]]:
+        """Flatten grouped data, copying each counterparty with its source_address."""
+        if not any(group.get('counterparties') for group in groups):
+            return None
+        return (
+            {**cp, 'source_address': group.get('source_address', '')}
+            for group in groups
+            for cp in group.get('counterparties', ())
+        )
+
+    @staticmethod
+    def _address_rows(addresses: Any) -> Optional[Iterable[dict]]:
+        """Convert list of addresses to list of dicts."""
+        if not isinstance(addresses, list):
+            return None
+        return ({'address': addr} for addr in addresses)
+
     def _prepare_export_data(self, inputs: dict) -> List[dict]:
         """
         Convert input data into a list of flat dictionaries for export.
         Handles various input structures from query nodes.
+
+        Export nodes fed by the same upstream outputs (e.g. a PDF and a
+        TXT export of one query) share the rows built for the first of
+        them. Treat the returned list as read-only.
         """
-        rows = []
+        # Inputs dicts are rebuilt per node, but their values are the
+        # upstream output objects, which the cache entry keeps alive so
+        # their ids cannot be reused during this run
+        key = tuple((name, id(value)) for name, value in inputs.items())
+        with self._export_rows_lock:
+            cached = self._export_rows_cache.get(key)
+        if cached is not None:
+            return cached[1]
+
+        # Built outside the lock; nodes racing on the same key each build
+        # their own rows and the last one stored wins
+        rows = list(self._iter_export_rows(inputs))
+        with self._export_rows_lock:
+            self._export_rows_cache[key] = (tuple(inputs.values()), rows)
+            if len(self._export_rows_cache) > EXPORT_ROWS_CACHE_SIZE:
+                self._export_rows_cache.pop(next(iter(self._export_rows_cache)))
+        return rows
 
+    def _iter_export_rows(self, inputs: dict) -> Iterator[dict]:
+        """
+        Yield the export rows for the input data, one at a time.
+
+        Rows come from the first recognized structure, so lists passed in
+        from query nodes are streamed as-is rather than copied.
+        """
         # First, check for 'data' input which may contain the full source output
         data_input = inputs.get('data', {})
-
-        # Check for common data structures from query nodes
-        # These can be in either the 'data' input or directly in inputs
-
-        # balance_data from cluster_balance node
-        balance_data = data_input.get('balance_data') if isinstance(data_input, dict) else None
-        balance_data = balance_data or inputs.get('balance_data')
-        if balance_data:
-            if isinstance(balance_data, list):
-                rows.extend(balance_data)
-            elif isinstance(balance_data, dict):
-                rows.append(balance_data)
-
-        # cluster_info from cluster_info node
-        cluster_info = data_input.get('cluster_info') if isinstance(data_input, dict) else None
-        cluster_info = cluster_info or inputs.get('cluster_info')
-        if cluster_info and not rows:
-            if isinstance(cluster_info, list):
-                rows.extend(cluster_info)
-            elif isinstance(cluster_info, dict):
-                rows.append(cluster_info)
-
-        # counterparties from counterparties node
-        # First check for grouped counterparties_by_address (new format with source tracking)
-        counterparties_by_address = data_input.get('counterparties_by_address') if isinstance(data_input, dict) else None
-        counterparties_by_address = counterparties_by_address or inputs.get('counterparties_by_address')
-        if counterparties_by_address and not rows:
-            # Flatten grouped data, adding source_address to each counterparty
-            for group in counterparties_by_address:
-                source_addr = group.get('source_address', '')
-                for cp in group.get('counterparties', []):
-                    row = dict(cp)  # Copy counterparty data
-                    row['source_address'] = source_addr  # Add source tracking
-                    rows.append(row)
-
-        # Fall back to flat counterparties list (which already has source_address if from new method)
-        counterparties = data_input.get('counterparties') if isinstance(data_input, dict) else None
-        counterparties = counterparties or inputs.get('counterparties')
-        if counterparties and not rows:
-            if isinstance(counterparties, list):
-                rows.extend(counterparties)
-            elif isinstance(counterparties, dict):
-                rows.append(counterparties)
-
-        # addresses from batch_input node
-        addresses = data_input.get('addresses') if isinstance(data_input, dict) else None
-        addresses = addresses or inputs.get('addresses')
-        if addresses and not rows:
-            if isinstance(addresses, list):
-                # Convert list of addresses to list of dicts
-                rows.extend([{'address': addr} for addr in addresses])
+        data_dict = data_input if isinstance(data_input, dict) else {}
+
+        # Check for common data structures from query nodes, in priority
+        # order. These can be in either the 'data' input or directly in inputs
+        for key, handler in self._EXPORT_SOURCES:
+            value = data_dict.get(key) or inputs.get(key)
+            if value:
+                rows = getattr(self, handler)(value)
+                if rows is not None:
+                    yield from rows
+                    return
 
         # If no recognized list structure, check if data_input is a dict with row-like data
-        if not rows and isinstance(data_input, dict):
+        if data_dict:
             # Look for any list of dicts in the data
-            for key, value in data_input.items():
+            for key, value in data_dict.items():
                 if isinstance(value, list) and len(value) > 0 and isinstance(value[0], dict):
-                    rows.extend(value)
-                    break
+                    yield from value
+                    return
 
             # If still no rows, and data_input has scalar values, treat it as a single row
-            if not rows:
-                # Filter out non-exportable keys
-                exportable = {k: v for k, v in data_input.items()
-                             if k not in ('_source_data', 'count', 'error') and not isinstance(v, list)}
-                if exportable:
-                    rows.append(exportable)
+            # Filter out non-exportable keys
+            exportable = {k: v for k, v in data_dict.items()
+                         if k not in ('_source_data', 'count', 'error') and not isinstance(v, list)}
+            if exportable:
+                yield exportable
+                return
 
         # If no recognized structure and still no rows, try to flatten all inputs
-        if not rows:
-            for key, value in inputs.items():
-                if key.startswith('_'):  # Skip internal keys
-                    continue
-                if isinstance(value, list) and len(value) > 0:
-                    if isinstance(value[0], dict):
-                        rows.extend(value)
-                    else:
-                        # List of primitives - create rows
-                        rows.extend([{key: v} for v in value])
-                elif isinstance(value, dict):
-                    # Check for nested data arrays
-                    found_nested = False
-                    for k, v in value.items():
-                        if isinstance(v, list) and len(v) > 0 and isinstance(v[0], dict):
-                            rows.extend(v)
-                            found_nested = True
-                            break
-                    if not found_nested and value:
-                        # Filter to exportable values
-                        exportable = {k: v for k, v in value.items()
-                                     if not isinstance(v, (list, dict)) or k in ('address',)}
-                        if exportable:
-                            rows.append(exportable)
+        rows = []
+        for key, value in inputs.items():
+            if key.startswith('_'):  # Skip internal keys
+                continue
+            if isinstance(value, list) and len(value) > 0:
+                if isinstance(value[0], dict):
+                    rows.extend(value)
+                else:
+                    # List of primitives - create rows
+                    rows.extend([{key: v} for v in value])
+            elif isinstance(value, dict):
+                # Check for nested data arrays
+                found_nested = False
+                for k, v in value.items():
+                    if isinstance(v, list) and len(v) > 0 and isinstance(v[0], dict):
+                        rows.extend(v)
+                        found_nested = True
+                        break
+                if not found_nested and value:
+                    # Filter to exportable values
+                    exportable = {k: v for k, v in value.items()
+                                 if not isinstance(v, (list, dict)) or k in ('address',)}
+                    if exportable:
+                        rows.append(exportable)
 
         # If still no rows, create one from all scalar inputs
         if not rows:
@@ -1444,7 +1981,7 @@ class WorkflowExecutor:
             if row:
                 rows.append(row)
 
-        return rows
+        yield from rows
 
     def _get_output_path(self, config: dict, default_filename: str) -> str:
         """Get the output file path from config or generate default."""
@@ -1464,112 +2001,129 @@ class WorkflowExecutor:
         filename = f"{default_filename}_{timestamp}"
         return str(DEFAULT_OUTPUT_DIR / filename)
 
+    @staticmethod
+    def _collect_columns(rows: List[dict]) -> List[str]:
+        """Unique column names across all rows, in first-seen order."""
+        columns = {}
+        for row in rows:
+            columns.update(dict.fromkeys(row))
+        return list(columns)
+
     def _export_csv(self, inputs: dict, config: dict) -> dict:
-        """Export data to CSV file."""
-        rows = self._prepare_export_data(inputs)
+        """
+        Export data to CSV file.
 
-        if not rows:
+        Rows are streamed from _iter_export_rows() twice (once for the
+        header, once to write), so the export never holds its own copy.
+        """
+        # Get all unique columns from all rows
+        columns = self._collect_columns(self._iter_export_rows(inputs))
+
+        if not columns:
             self._log("  ⚠️ No data to export")
             return {'file_path': None, 'rows_written': 0, 'error': 'No data to export'}
 
         # Get output path
         file_path = self._get_output_path(config, 'output') + '.csv'
 
-        # Get all unique columns from all rows
-        columns = []
-        for row in rows:
-            for key in row.keys():
-                if key not in columns:
-                    columns.append(key)
-
-        self._log(f"  📤 Exporting {len(rows)} rows to CSV...")
-        self._log(f"  📝 Columns: {', '.join(columns)}")
+        self._log("  📤 Exporting rows to CSV...")
+        self._log("  📝 Columns: %s", ', '.join(columns))
 
         # Write CSV file
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        rows_written = 0
+        with open(file_path, 'w', buffering=CSV_BUFFER_SIZE, newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
             writer.writeheader()
-            writer.writerows(rows)
+            for row in self._iter_export_rows(inputs):
+                writer.writerow(row)
+                rows_written += 1
 
-        self._log(f"  💾 Written to: {file_path}")
+        self._log("  💾 Written %s rows to: %s", rows_written, file_path)
 
         return {
             'file_path': file_path,
-            'rows_written': len(rows),
+            'rows_written': rows_written,
             'columns': columns
         }
 
     def _export_json(self, inputs: dict, config: dict) -> dict:
-        """Export data to JSON file."""
-        rows = self._prepare_export_data(inputs)
+        """
+        Export data to JSON file.
 
-        if not rows:
+        The array is written one record at a time, with each record
+        re-indented one level, giving the same output as encoding the
+        whole list at once without holding it all in memory.
+        """
+        rows = self._iter_export_rows(inputs)
+        first = next(rows, None)
+
+        if first is None:
             self._log("  ⚠️ No data to export")
             return {'file_path': None, 'rows_written': 0, 'error': 'No data to export'}
 
         # Get output path
         file_path = self._get_output_path(config, 'output') + '.json'
 
-        self._log(f"  📤 Exporting {len(rows)} records to JSON...")
+        self._log("  📤 Exporting records to JSON...")
 
-        # Write JSON file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(rows, f, indent=2, default=str)
+        # Write JSON file (JSON strings never contain a raw newline, so
+        # indenting every line break only shifts the layout)
+        rows_written = 0
+        with open(file_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write(b'[\n  ')
+            for row in itertools.chain((first,), rows):
+                if rows_written:
+                    f.write(b',\n  ')
+                f.write(_json_bytes(row, indent=True).replace(b'\n', b'\n  '))
+                rows_written += 1
+            f.write(b'\n]')
 
-        self._log(f"  💾 Written to: {file_path}")
+        self._log("  💾 Written %s records to: %s", rows_written, file_path)
 
         return {
             'file_path': file_path,
-            'rows_written': len(rows)
+            'rows_written': rows_written
         }
 
     def _export_excel(self, inputs: dict, config: dict) -> dict:
-        """Export data to Excel file."""
-        rows = self._prepare_export_data(inputs)
+        """Export data to Excel file, streaming rows like _export_csv()."""
+        # Get all unique columns
+        columns = self._collect_columns(self._iter_export_rows(inputs))
 
-        if not rows:
+        if not columns:
             self._log("  ⚠️ No data to export")
             return {'file_path': None, 'rows_written': 0, 'error': 'No data to export'}
 
         # Get output path
         file_path = self._get_output_path(config, 'output') + '.xlsx'
 
-        # Get all unique columns
-        columns = []
-        for row in rows:
-            for key in row.keys():
-                if key not in columns:
-                    columns.append(key)
-
-        self._log(f"  📤 Exporting {len(rows)} rows to Excel...")
+        self._log("  📤 Exporting rows to Excel...")
 
         try:
-            import openpyxl
-            from openpyxl import Workbook
+            Workbook = _openpyxl_workbook()
 
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Data"
+            # Write-only mode streams rows to disk instead of keeping a
+            # cell object for every value in memory
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Data")
 
             # Write header
-            for col_idx, col_name in enumerate(columns, 1):
-                ws.cell(row=1, column=col_idx, value=col_name)
-
-            # Write data rows
-            for row_idx, row_data in enumerate(rows, 2):
-                for col_idx, col_name in enumerate(columns, 1):
-                    value = row_data.get(col_name, '')
-                    # Convert lists/dicts to string
-                    if isinstance(value, (list, dict)):
-                        value = json.dumps(value)
-                    ws.cell(row=row_idx, column=col_idx, value=value)
+            ws.append(columns)
+
+            # Write data rows (one append per row; the cell value
+            # conversion is bound once rather than looked up per cell)
+            excel_value = self._excel_value
+            rows_written = 0
+            for row_data in self._iter_export_rows(inputs):
+                ws.append([excel_value(row_data.get(col_name, '')) for col_name in columns])
+                rows_written += 1
 
             wb.save(file_path)
-            self._log(f"  💾 Written to: {file_path}")
+            self._log("  💾 Written %s rows to: %s", rows_written, file_path)
 
             return {
                 'file_path': file_path,
-                'rows_written': len(rows),
+                'rows_written': rows_written,
                 'columns': columns
             }
 
@@ -1577,16 +2131,20 @@ class WorkflowExecutor:
             self._log("  ⚠️ openpyxl not installed, falling back to CSV")
             return self._export_csv(inputs, config)
 
+    @staticmethod
+    def _excel_value(value: Any) -> Any:
+        """Cell value for an export field (lists/dicts become JSON text)."""
+        if isinstance(value, (list, dict)):
+            return _json_bytes(value).decode('utf-8')
+        return value
+
     def _export_pdf(self, inputs: dict, config: dict) -> dict:
         """
         Export data to a professional PDF report matching the HTML template style.
 
-        Features:
-        - Professional cover page with blue sidebar (matching HTML template)
-        - Executive summary with stats cards
-        - Data sections adapted to content type
-        - Formatted data tables with professional styling
-        - Consistent #1a237e color scheme
+        The report is rendered by pdf_report.render_pdf_report() in the
+        PDF worker process pool, so layout and charts do not hold this
+        process' GIL while other nodes run.
         """
         rows = self._prepare_export_data(inputs)
 
@@ -1594,472 +2152,23 @@ class WorkflowExecutor:
             self._log("  ⚠️ No data to export")
             return {'file_path': None, 'rows_written': 0, 'error': 'No data to export'}
 
-        # Get configuration
-        report_title = config.get('report_title', 'Blockchain Intelligence Report')
-        include_graphs = config.get('include_graphs', True)
-        graph_type = config.get('graph_type', 'auto')
-
         # Get output path
         file_path = self._get_output_path(config, 'report') + '.pdf'
 
         self._log(f"  📑 Generating PDF report with {len(rows)} records...")
 
         try:
-            from reportlab.lib import colors
-            from reportlab.lib.pagesizes import A4, landscape
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch, cm, mm
-            from reportlab.platypus import (
-                SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-                Image, PageBreak, KeepTogether, NextPageTemplate, PageTemplate,
-                Frame, BaseDocTemplate, Flowable
-            )
-            from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY, TA_RIGHT
-            from reportlab.pdfgen import canvas
-            import matplotlib
-            matplotlib.use('Agg')  # Non-interactive backend
-            import matplotlib.pyplot as plt
-            import uuid
-
-            # Define page sizes
-            PAGE_WIDTH, PAGE_HEIGHT = A4
-
-            # ═══════════════════════════════════════════════════════════════
-            # COLOR SCHEME (matching HTML template)
-            # ═══════════════════════════════════════════════════════════════
-            PRIMARY_BLUE = colors.HexColor('#1a237e')       # Dark blue (sidebar, headers)
-            SECONDARY_BLUE = colors.HexColor('#283593')     # Medium blue
-            ACCENT_BLUE = colors.HexColor('#3949ab')        # Light blue accent
-            SECTION_BORDER = colors.HexColor('#e8eaf6')     # Light blue-gray border
-            TEXT_DARK = colors.HexColor('#333333')
-            TEXT_MUTED = colors.HexColor('#666666')
-            TEXT_LIGHT = colors.HexColor('#999999')
-            BG_LIGHT = colors.HexColor('#f5f5f5')
-            BG_ROW_ALT = colors.HexColor('#fafafa')
-
-            # Get styles
-            styles = getSampleStyleSheet()
-
-            # ═══════════════════════════════════════════════════════════════
-            # CUSTOM STYLES (matching HTML template)
-            # ═══════════════════════════════════════════════════════════════
-
-            # Section title style (matches .section-title in HTML)
-            section_title_style = ParagraphStyle(
-                'SectionTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                fontName='Helvetica-Bold',
-                spaceBefore=25,
-                spaceAfter=12,
-                textColor=PRIMARY_BLUE,
-                borderPadding=(0, 0, 8, 0),
-            )
-
-            # Body text style
-            body_style = ParagraphStyle(
-                'BodyText',
-                parent=styles['Normal'],
-                fontSize=11,
-                spaceAfter=10,
-                alignment=TA_LEFT,
-                leading=16,
-                textColor=TEXT_DARK
-            )
-
-            # Key-value label style
-            kv_label_style = ParagraphStyle(
-                'KVLabel',
-                parent=styles['Normal'],
-                fontSize=9,
-                textColor=TEXT_MUTED,
-                spaceAfter=2
-            )
-
-            # Key-value value style
-            kv_value_style = ParagraphStyle(
-                'KVValue',
-                parent=styles['Normal'],
-                fontSize=11,
-                fontName='Helvetica-Bold',
-                textColor=TEXT_DARK,
-                spaceAfter=8
-            )
-
-            # Create custom document
-            doc = SimpleDocTemplate(
+            _render_pdf(
                 file_path,
-                pagesize=A4,
-                rightMargin=15*mm,
-                leftMargin=15*mm,
-                topMargin=15*mm,
-                bottomMargin=15*mm
-            )
-
-            story = []
-            report_id = str(uuid.uuid4())[:8].upper()
-            generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-            # ═══════════════════════════════════════════════════════════════
-            # PAGE 1: COVER PAGE (matching HTML template layout)
-            # ═══════════════════════════════════════════════════════════════
-
-            # Calculate dimensions
-            content_width = PAGE_WIDTH - 30*mm
-            sidebar_width = content_width * 0.35
-            main_width = content_width * 0.65
-            cover_height = PAGE_HEIGHT - 30*mm
-
-            # Build sidebar content
-            sidebar_content = []
-            sidebar_content.append(Paragraph(
-                "🔗",
-                ParagraphStyle('LogoIcon', fontSize=36, alignment=TA_CENTER, textColor=colors.white, spaceAfter=10)
-            ))
-            sidebar_content.append(Paragraph(
-                "EasyCall",
-                ParagraphStyle('LogoText', fontSize=24, fontName='Helvetica-Bold',
-                              alignment=TA_CENTER, textColor=colors.white, spaceAfter=40)
-            ))
-            sidebar_content.append(Spacer(1, cover_height * 0.5))
-            sidebar_content.append(Paragraph(
-                f"<b>Report Generated:</b><br/>{generated_at}",
-                ParagraphStyle('MetaText', fontSize=9, textColor=colors.white, alignment=TA_LEFT,
-                              leading=14, leftIndent=10)
-            ))
-            sidebar_content.append(Spacer(1, 15))
-            sidebar_content.append(Paragraph(
-                "<b>Classification:</b><br/>CONFIDENTIAL",
-                ParagraphStyle('MetaText', fontSize=9, textColor=colors.white, alignment=TA_LEFT,
-                              leading=14, leftIndent=10)
-            ))
-            sidebar_content.append(Spacer(1, 15))
-            sidebar_content.append(Paragraph(
-                f"<b>Report ID:</b><br/>{report_id}",
-                ParagraphStyle('MetaText', fontSize=9, textColor=colors.white, alignment=TA_LEFT,
-                              leading=14, leftIndent=10)
-            ))
-
-            # Build sidebar as a table cell
-            sidebar_table = Table([[sidebar_content]], colWidths=[sidebar_width - 10])
-            sidebar_table.setStyle(TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('TOPPADDING', (0, 0), (-1, -1), 30),
-            ]))
-
-            # Build main content
-            main_content = []
-            main_content.append(Spacer(1, cover_height * 0.25))
-            main_content.append(Paragraph(
-                report_title,
-                ParagraphStyle('CoverTitle', fontSize=28, fontName='Helvetica-Bold',
-                              textColor=PRIMARY_BLUE, spaceAfter=15, leading=34)
-            ))
-            main_content.append(Paragraph(
-                "Comprehensive analysis of blockchain addresses and transactions",
-                ParagraphStyle('CoverSubtitle', fontSize=14, textColor=TEXT_MUTED, spaceAfter=40)
-            ))
-
-            # Cover info items
-            summary_stats = self._calculate_summary_stats(rows)
-            info_items = [
-                ("WORKFLOW", getattr(self.workflow, 'name', 'Untitled Workflow')),
-                ("RECORDS ANALYZED", str(len(rows))),
-            ]
-            if summary_stats.get('unique_addresses'):
-                info_items.append(("ADDRESSES", str(summary_stats['unique_addresses'])))
-            if summary_stats.get('total_transfers'):
-                info_items.append(("TRANSFERS", str(summary_stats['total_transfers'])))
-
-            # Info section with left border
-            info_table_data = []
-            for label, value in info_items:
-                info_table_data.append([
-                    Paragraph(label, ParagraphStyle('InfoLabel', fontSize=9, textColor=TEXT_LIGHT)),
-                ])
-                info_table_data.append([
-                    Paragraph(value, ParagraphStyle('InfoValue', fontSize=12, fontName='Helvetica-Bold',
-                                                   textColor=TEXT_DARK, spaceAfter=12)),
-                ])
-
-            info_table = Table(info_table_data, colWidths=[main_width - 40])
-            info_table.setStyle(TableStyle([
-                ('LEFTPADDING', (0, 0), (-1, -1), 15),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ]))
-
-            main_content.append(Spacer(1, 30))
-
-            # Create bordered info section
-            bordered_info = Table([[info_table]], colWidths=[main_width - 20])
-            bordered_info.setStyle(TableStyle([
-                ('LINEWIDTH', (0, 0), (0, 0), 4),
-                ('LINEBEFORE', (0, 0), (0, 0), 4, PRIMARY_BLUE),
-                ('LEFTPADDING', (0, 0), (-1, -1), 5),
-            ]))
-            main_content.append(bordered_info)
-
-            main_table = Table([[main_content]], colWidths=[main_width])
-            main_table.setStyle(TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 30),
-            ]))
-
-            # Combine sidebar and main into cover
-            cover_table = Table(
-                [[[sidebar_table], [main_table]]],
-                colWidths=[sidebar_width, main_width]
-            )
-            cover_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, 0), PRIMARY_BLUE),
-                ('BACKGROUND', (1, 0), (1, 0), colors.white),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-            ]))
-
-            story.append(cover_table)
-            story.append(PageBreak())
-
-            # ═══════════════════════════════════════════════════════════════
-            # PAGE 2: CONTENT PAGES (matching HTML template sections)
-            # ═══════════════════════════════════════════════════════════════
-
-            # Page header
-            header_table = Table(
-                [[
-                    Paragraph("🔗 EasyCall", ParagraphStyle('HeaderLogo', fontSize=14,
-                              fontName='Helvetica-Bold', textColor=PRIMARY_BLUE)),
-                    Paragraph(report_title, ParagraphStyle('HeaderTitle', fontSize=10,
-                              textColor=TEXT_MUTED, alignment=TA_RIGHT))
-                ]],
-                colWidths=[content_width * 0.5, content_width * 0.5]
-            )
-            header_table.setStyle(TableStyle([
-                ('LINEBELOW', (0, 0), (-1, 0), 2, PRIMARY_BLUE),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ]))
-            story.append(header_table)
-            story.append(Spacer(1, 20))
-
-            # --- SECTION: Executive Summary ---
-            story.append(Paragraph("Executive Summary", section_title_style))
-
-            # Executive summary box (gray background like HTML)
-            total_records = len(rows)
-            columns = list(rows[0].keys()) if rows else []
-
-            summary_text = f"This report analyzed <b>{total_records}</b> records"
-            if summary_stats.get('unique_addresses'):
-                summary_text += f" covering <b>{summary_stats['unique_addresses']}</b> blockchain address(es)"
-            if summary_stats.get('total_transfers'):
-                summary_text += f" with <b>{summary_stats['total_transfers']:,}</b> total transfers"
-            summary_text += "."
-
-            summary_box = Table(
-                [[Paragraph(summary_text, body_style)]],
-                colWidths=[content_width - 10]
-            )
-            summary_box.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, -1), BG_LIGHT),
-                ('TOPPADDING', (0, 0), (-1, -1), 15),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
-                ('LEFTPADDING', (0, 0), (-1, -1), 20),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 20),
-                ('ROUNDEDCORNERS', [8, 8, 8, 8]),
-            ]))
-            story.append(summary_box)
-
-            # Summary stats cards
-            stat_cards = []
-            stat_cards.append(("Records", str(total_records)))
-            if summary_stats.get('unique_addresses'):
-                stat_cards.append(("Addresses", str(summary_stats['unique_addresses'])))
-            if summary_stats.get('total_transfers'):
-                stat_cards.append(("Transfers", str(summary_stats['total_transfers'])))
-            if summary_stats.get('total_balance'):
-                stat_cards.append(("Balance", f"{summary_stats['total_balance']:.4f}"))
-
-            if stat_cards:
-                card_width = (content_width - 30) / len(stat_cards)
-                card_data = []
-                for label, value in stat_cards:
-                    card_content = [
-                        Paragraph(str(value), ParagraphStyle('StatValue', fontSize=20,
-                                  fontName='Helvetica-Bold', textColor=PRIMARY_BLUE, alignment=TA_CENTER)),
-                        Paragraph(label.upper(), ParagraphStyle('StatLabel', fontSize=9,
-                                  textColor=TEXT_MUTED, alignment=TA_CENTER))
-                    ]
-                    card_data.append(card_content)
-
-                stats_table = Table([card_data], colWidths=[card_width] * len(stat_cards))
-                stats_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.5, colors.HexColor('#e0e0e0')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e0e0e0')),
-                    ('TOPPADDING', (0, 0), (-1, -1), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
-                story.append(Spacer(1, 15))
-                story.append(stats_table)
-
-            # --- SECTION: Data Visualization ---
-            if include_graphs and rows:
-                story.append(Spacer(1, 10))
-                story.append(Paragraph("Data Visualization", section_title_style))
-                graph_image = self._generate_graph(rows, graph_type)
-                if graph_image:
-                    story.append(Image(graph_image, width=5*inch, height=3*inch))
-                    story.append(Paragraph(
-                        "<i>Figure 1: Analysis results visualization</i>",
-                        ParagraphStyle('Caption', parent=styles['Normal'], fontSize=9,
-                                      alignment=TA_CENTER, textColor=TEXT_MUTED)
-                    ))
-
-            # --- SECTION: Query Results (Key-Value pairs for first few records) ---
-            story.append(PageBreak())
-
-            # Page header again
-            story.append(header_table)
-            story.append(Spacer(1, 20))
-
-            story.append(Paragraph("Query Results", section_title_style))
-
-            # Show first 5 records as key-value cards
-            for idx, row in enumerate(rows[:5]):
-                # Create card for each record
-                card_title = f"Record {idx + 1}"
-                if 'address' in row:
-                    card_title = f"Address: {str(row['address'])[:20]}..."
-                elif 'clusterName' in row or 'cluster_name' in row:
-                    card_title = row.get('clusterName') or row.get('cluster_name', f'Record {idx + 1}')
-
-                story.append(Paragraph(card_title, ParagraphStyle(
-                    'CardTitle', fontSize=12, fontName='Helvetica-Bold',
-                    textColor=TEXT_DARK, spaceBefore=15, spaceAfter=8
-                )))
-
-                # Key-value pairs in 2-column grid
-                kv_data = []
-                items = list(row.items())[:8]  # Limit to 8 fields per record
-                for i in range(0, len(items), 2):
-                    row_cells = []
-                    for j in range(2):
-                        if i + j < len(items):
-                            key, value = items[i + j]
-                            # Format the value
-                            if isinstance(value, float):
-                                value = f"{value:,.4f}"
-                            elif isinstance(value, (list, dict)):
-                                value = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
-                            elif value is None:
-                                value = "N/A"
-                            elif isinstance(value, str) and len(value) > 50:
-                                value = value[:47] + "..."
-
-                            cell_content = [
-                                Paragraph(key.replace('_', ' ').upper(), kv_label_style),
-                                Paragraph(str(value), kv_value_style)
-                            ]
-                            row_cells.append(cell_content)
-                        else:
-                            row_cells.append(["", ""])
-                    kv_data.append(row_cells)
-
-                if kv_data:
-                    kv_table = Table(kv_data, colWidths=[(content_width - 20) / 2] * 2)
-                    kv_table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, -1), BG_ROW_ALT),
-                        ('LINEBEFORE', (0, 0), (0, -1), 3, PRIMARY_BLUE),
-                        ('LINEBEFORE', (1, 0), (1, -1), 3, PRIMARY_BLUE),
-                        ('TOPPADDING', (0, 0), (-1, -1), 8),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 12),
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ]))
-                    story.append(kv_table)
-
-            # --- SECTION: Full Data Table ---
-            if len(rows) > 5:
-                story.append(PageBreak())
-                story.append(header_table)
-                story.append(Spacer(1, 20))
-
-                story.append(Paragraph("Detailed Results", section_title_style))
-
-                if len(rows) > 50:
-                    story.append(Paragraph(
-                        f"<i>Showing first 50 of {len(rows)} records</i>",
-                        ParagraphStyle('Note', parent=styles['Normal'], fontSize=9,
-                                      textColor=TEXT_MUTED, spaceAfter=10)
-                    ))
-
-                # Prepare table
-                display_columns = columns[:8]  # Limit columns
-                table_data = [[col.replace('_', ' ').title()[:15] for col in display_columns]]
-
-                for row in rows[:50]:
-                    row_data = []
-                    for col in display_columns:
-                        value = row.get(col, '')
-                        if isinstance(value, str) and len(value) > 25:
-                            value = value[:22] + '...'
-                        elif isinstance(value, (list, dict)):
-                            value = str(value)[:22] + '...'
-                        elif isinstance(value, float):
-                            value = f"{value:,.2f}"
-                        elif value is None:
-                            value = 'N/A'
-                        row_data.append(str(value))
-                    table_data.append(row_data)
-
-                # Calculate column widths
-                num_cols = len(display_columns)
-                col_widths = [(content_width - 10) / num_cols] * num_cols
-
-                table = Table(table_data, colWidths=col_widths)
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_BLUE),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 8),
-                    ('FONTSIZE', (0, 1), (-1, -1), 7),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                    ('TOPPADDING', (0, 0), (-1, 0), 10),
-                    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-                    ('TOPPADDING', (0, 1), (-1, -1), 6),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, BG_ROW_ALT]),
-                    ('LINEBELOW', (0, 0), (-1, 0), 1, colors.HexColor('#e0e0e0')),
-                    ('LINEBELOW', (0, 1), (-1, -2), 0.5, colors.HexColor('#e0e0e0')),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ]))
-
-                story.append(table)
-
-            # Footer
-            story.append(Spacer(1, 30))
-            footer_table = Table(
-                [[
-                    Paragraph(f"Generated by EasyCall | {generated_at}", ParagraphStyle(
-                        'FooterLeft', fontSize=8, textColor=TEXT_LIGHT)),
-                    Paragraph("CONFIDENTIAL", ParagraphStyle(
-                        'FooterRight', fontSize=8, textColor=TEXT_LIGHT, alignment=TA_RIGHT))
-                ]],
-                colWidths=[content_width * 0.7, content_width * 0.3]
+                rows,
+                report_title=config.get('report_title', 'Blockchain Intelligence Report'),
+                workflow_name=getattr(self.workflow, 'name', 'Untitled Workflow'),
+                summary_stats=self._calculate_summary_stats(rows),
+                # Columns of the rows shown in the data table
+                columns=self._collect_columns(rows[:50]),
+                include_graphs=config.get('include_graphs', True),
+                graph_type=config.get('graph_type', 'auto'),
             )
-            footer_table.setStyle(TableStyle([
-                ('LINEABOVE', (0, 0), (-1, 0), 0.5, colors.HexColor('#dddddd')),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ]))
-            story.append(footer_table)
-
-            # Build PDF
-            doc.build(story)
 
             self._log(f"  💾 PDF report written to: {file_path}")
 
@@ -2224,144 +2333,49 @@ class WorkflowExecutor:
             return self._export_pdf(inputs, config)
 
     def _calculate_summary_stats(self, rows: List[dict]) -> dict:
-        """Calculate summary statistics from data rows."""
+        """Calculate summary statistics from data rows (in a single pass)."""
         stats = {}
 
         if not rows:
             return stats
 
-        # Look for balance field
+        total_balance = None
+        total_transfers = None
+        addresses = set()
+        high_risk_count = 0
+
         for row in rows:
+            # Look for balance and transfer count fields
             if 'balance' in row:
-                stats['total_balance'] = stats.get('total_balance', 0) + float(row.get('balance', 0) or 0)
+                total_balance = (total_balance or 0) + float(row.get('balance', 0) or 0)
             if 'transferCount' in row or 'transfer_count' in row:
                 count = row.get('transferCount') or row.get('transfer_count') or 0
-                stats['total_transfers'] = stats.get('total_transfers', 0) + int(count)
+                total_transfers = (total_transfers or 0) + int(count)
 
-        # Count unique addresses
-        addresses = set()
-        for row in rows:
+            # Count unique addresses
             if 'address' in row:
                 addresses.add(row['address'])
             if 'source_address' in row:
                 addresses.add(row['source_address'])
-        if addresses:
-            stats['unique_addresses'] = len(addresses)
 
-        # Count high-risk flags
-        high_risk_count = 0
-        for row in rows:
+            # Count high-risk flags
             if row.get('has_high_risk'):
                 high_risk_count += 1
-            if 'high_risk_flags' in row and row['high_risk_flags']:
-                high_risk_count += len(row['high_risk_flags']) if isinstance(row['high_risk_flags'], list) else 1
+            flags = row.get('high_risk_flags')
+            if flags:
+                high_risk_count += len(flags) if isinstance(flags, list) else 1
+
+        if total_balance is not None:
+            stats['total_balance'] = total_balance
+        if total_transfers is not None:
+            stats['total_transfers'] = total_transfers
+        if addresses:
+            stats['unique_addresses'] = len(addresses)
         if high_risk_count:
             stats['high_risk_count'] = high_risk_count
 
         return stats
 
-    def _generate_graph(self, rows: List[dict], graph_type: str) -> Optional[BytesIO]:
-        """Generate a graph image from data rows."""
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-
-        if not rows:
-            return None
-
-        # Analyze data to determine best graph type
-        sample_row = rows[0]
-
-        # Find numeric columns
-        numeric_cols = []
-        category_cols = []
-
-        for key, value in sample_row.items():
-            if isinstance(value, (int, float)) and key not in ('count', 'rows_written'):
-                numeric_cols.append(key)
-            elif isinstance(value, str) and len(value) < 50:
-                category_cols.append(key)
-
-        if not numeric_cols:
-            return None
-
-        # Auto-detect best graph type
-        if graph_type == 'auto':
-            if 'category' in sample_row or 'cluster_name' in sample_row or 'clusterName' in sample_row:
-                graph_type = 'pie'
-            elif len(rows) > 10:
-                graph_type = 'bar'
-            else:
-                graph_type = 'bar'
-
-        # Create figure
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        # Style
-        plt.style.use('seaborn-v0_8-whitegrid')
-        colors_list = ['#1565c0', '#00897b', '#f57c00', '#d32f2f', '#7b1fa2', '#388e3c']
-
-        try:
-            if graph_type == 'pie' and 'category' in sample_row:
-                # Pie chart for category distribution
-                categories = {}
-                value_field = 'value' if 'value' in sample_row else numeric_cols[0]
-                for row in rows:
-                    cat = row.get('category', row.get('cluster_name', row.get('clusterName', 'Unknown')))
-                    val = float(row.get(value_field, 1) or 1)
-                    categories[cat] = categories.get(cat, 0) + val
-
-                if categories:
-                    labels = list(categories.keys())[:8]  # Max 8 slices
-                    values = [categories[l] for l in labels]
-                    ax.pie(values, labels=labels, autopct='%1.1f%%', colors=colors_list[:len(labels)])
-                    ax.set_title('Distribution by Category', fontsize=14, fontweight='bold')
-
-            elif graph_type == 'bar':
-                # Bar chart
-                if 'balance' in numeric_cols:
-                    # Balance by address/cluster
-                    label_field = 'address' if 'address' in sample_row else 'cluster_name'
-                    data = [(row.get(label_field, f'Item {i}')[:15], float(row.get('balance', 0) or 0))
-                            for i, row in enumerate(rows[:10])]
-                    labels, values = zip(*data) if data else ([], [])
-                    ax.barh(labels, values, color=colors_list[0])
-                    ax.set_xlabel('Balance', fontsize=11)
-                    ax.set_title('Balance by Address', fontsize=14, fontweight='bold')
-                else:
-                    # Generic numeric data
-                    num_col = numeric_cols[0]
-                    values = [float(row.get(num_col, 0) or 0) for row in rows[:15]]
-                    labels = [f'Record {i+1}' for i in range(len(values))]
-                    ax.bar(labels, values, color=colors_list[0])
-                    ax.set_ylabel(num_col, fontsize=11)
-                    ax.set_title(f'{num_col} Distribution', fontsize=14, fontweight='bold')
-                    plt.xticks(rotation=45, ha='right')
-
-            elif graph_type == 'line':
-                # Line chart
-                num_col = numeric_cols[0]
-                values = [float(row.get(num_col, 0) or 0) for row in rows[:50]]
-                ax.plot(range(len(values)), values, color=colors_list[0], linewidth=2, marker='o', markersize=4)
-                ax.set_xlabel('Record Index', fontsize=11)
-                ax.set_ylabel(num_col, fontsize=11)
-                ax.set_title(f'{num_col} Trend', fontsize=14, fontweight='bold')
-                ax.fill_between(range(len(values)), values, alpha=0.3, color=colors_list[0])
-
-            plt.tight_layout()
-
-            # Save to BytesIO
-            img_buffer = BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-            img_buffer.seek(0)
-            plt.close(fig)
-
-            return img_buffer
-
-        except Exception as e:
-            plt.close(fig)
-            return None
-
     def _export_txt(self, inputs: dict, config: dict) -> dict:
         """Export data to TXT file."""
         rows = self._prepare_export_data(inputs)
@@ -2376,7 +2390,7 @@ class WorkflowExecutor:
         self._log(f"  📤 Exporting {len(rows)} records to TXT...")
 
         # Write TXT file (formatted output)
-        with open(file_path, 'w', encoding='utf-8') as f:
+        with open(file_path, 'w', buffering=EXPORT_BUFFER_SIZE, encoding='utf-8') as f:
             f.write(f"Workflow Export - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write("=" * 60 + "\n\n")
 
@@ -2385,7 +2399,7 @@ class WorkflowExecutor:
                 f.write("-" * 40 + "\n")
                 for key, value in row.items():
                     if isinstance(value, (list, dict)):
-                        value = json.dumps(value, indent=2)
+                        value = _json_bytes(value, indent=True).decode('utf-8')
                     f.write(f"  {key}: {value}\n")
                 f.write("\n")
 
@@ -2400,70 +2414,73 @@ class WorkflowExecutor:
     # HELPER METHODS
     # ═══════════════════════════════════════════════════════════════════════
 
-    def _get_node_inputs(self, node_id: str, edges: List[dict]) -> dict:
+    def _get_node_inputs(self, node_id: str) -> dict:
         """Get input values from connected nodes."""
         inputs = {}
 
-        for edge in edges:
-            if edge.get('target') == node_id:
-                source_id = edge.get('source')
-                source_handle = edge.get('sourceHandle', 'output')
-                target_handle = edge.get('targetHandle', 'input')
-
-                # Get output from source node
-                source_outputs = self.execution_context.get(source_id, {})
-
-                # Map source output to target input
-                if source_handle in source_outputs:
-                    value = source_outputs[source_handle]
-                    inputs[target_handle] = value
-
-                    # For 'data' inputs (like csv_export), also include the full source output
-                    # so the export node has access to all data from the connected node
-                    if target_handle == 'data':
-                        # Merge all source outputs into the data
-                        if isinstance(value, dict):
-                            inputs[target_handle] = source_outputs
-                        else:
-                            inputs[target_handle] = source_outputs
-                            inputs['_source_data'] = source_outputs
-                elif source_outputs:
-                    # If no specific handle, pass all outputs
-                    inputs[target_handle] = source_outputs
+        for edge in self._incoming.get(node_id, ()):
+            source_id = edge.get('source')
+            source_handle = edge.get('sourceHandle', 'output')
+            target_handle = edge.get('targetHandle', 'input')
+
+            # Get output from source node
+            source_outputs = self.execution_context.get(source_id, {})
+
+            # Map source output to target input
+            if source_handle in source_outputs:
+                value = source_outputs[source_handle]
+                inputs[target_handle] = value
+
+                # For 'data' inputs (like csv_export), also include the full source output
+                # so the export node has access to all data from the connected node
+                if target_handle == 'data':
+                    # Merge all source outputs into the data
+                    if isinstance(value, dict):
+                        inputs[target_handle] = source_outputs
+                    else:
+                        inputs[target_handle] = source_outputs
+                        inputs['_source_data'] = source_outputs
+            elif source_outputs:
+                # If no specific handle, pass all outputs
+                inputs[target_handle] = source_outputs
 
         return inputs
 
-    def _topological_sort(self, nodes: List[dict], edges: List[dict]) -> List[dict]:
+    def _execution_levels(
+        self,
+        canvas_data: dict,
+        nodes: List[dict],
+        edges: List[dict]
+    ) -> List[List[dict]]:
         """
-        Sort nodes in execution order (topological sort).
+        Get the node levels to execute, reusing a precomputed order.
 
-        Nodes with no dependencies execute first.
+        The plan saved on the workflow is used when it was built from this
+        exact canvas. Otherwise (unsaved or stale workflows) the order
+        comes from a process-wide cache keyed by the canvas hash, so
+        re-running the same canvas never sorts twice.
         """
-        # Build dependency graph
-        node_map = {n['id']: n for n in nodes}
-        dependencies = {n['id']: set() for n in nodes}
-
-        for edge in edges:
-            target = edge.get('target')
-            source = edge.get('source')
-            if target in dependencies:
-                dependencies[target].add(source)
 
-        # Kahn's algorithm
-        sorted_nodes = []
-        no_deps = [n['id'] for n in nodes if not dependencies[n['id']]]
+        digest = canvas_hash(canvas_data)
+        plan = getattr(self.workflow, 'execution_plan', None)
+        if plan_matches(plan, canvas_data, digest):
+            levels = plan['levels']
+        else:
+            levels = cached_topological_levels(digest, nodes, edges)
 
-        while no_deps:
-            node_id = no_deps.pop(0)
-            sorted_nodes.append(node_map[node_id])
+        node_map = {n['id']: n for n in nodes}
+        return [[node_map[node_id] for node_id in level] for level in levels]
 
-            # Remove this node from all dependency sets
-            for dep_set in dependencies.values():
-                dep_set.discard(node_id)
+    def _topological_sort(self, nodes: List[dict], edges: List[dict]) -> List[List[dict]]:
+        """
+        Sort nodes in execution order, grouped into dependency levels.
 
-            # Check for new nodes with no dependencies
-            for nid, deps in dependencies.items():
-                if not deps and nid not in [n['id'] for n in sorted_nodes] and nid not in no_deps:
-                    no_deps.append(nid)
+        Nodes within a level are independent and can run concurrently.
+        See apps.workflows.planning.topological_levels.
+        """
 
-        return sorted_nodes
\ No newline at end of file
+        node_map = {n['id']: n for n in nodes}
+        return [
+            [node_map[node_id] for node_id in level]
+            for level in topological_levels(nodes, edges)
+        ]
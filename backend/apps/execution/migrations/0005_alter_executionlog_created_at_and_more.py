@@ -0,0 +1,41 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("execution", "0004_alter_executionlog_uuid"),
+        (
+            "workflows",
+            "0003_alter_workflow_created_at_alter_workflow_is_active_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="executionlog",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                help_text="Timestamp when this record was created.",
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="executionlog",
+            name="is_active",
+            field=models.BooleanField(
+                default=True,
+                help_text="Whether this record is active.",
+                verbose_name="Is Active",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="executionlog",
+            index=models.Index(
+                fields=["is_active", "-created_at"], name="executionlog_active_created"
+            ),
+        ),
+    ]
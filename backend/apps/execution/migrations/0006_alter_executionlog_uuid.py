@@ -0,0 +1,28 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:40
+
+import apps.core.fields
+import utils.helpers
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("execution", "0005_alter_executionlog_created_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="executionlog",
+            name="uuid",
+            field=apps.core.fields.BinaryUUIDField(
+                default=utils.helpers.uuid7,
+                editable=False,
+                help_text="Unique identifier for this record.",
+                primary_key=True,
+                serialize=False,
+                verbose_name="UUID",
+            ),
+        ),
+        apps.core.fields.convert_uuid_storage("execution", "executionlog"),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("execution", "0006_alter_executionlog_uuid"),
+        ("workflows", "0006_activity_feed_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="executionlog",
+            index=models.Index(
+                fields=["-started_at"], name="execution_l_started_7b0d95_idx"
+            ),
+        ),
+    ]
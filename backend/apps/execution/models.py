@@ -17,7 +17,7 @@ from typing import Optional
 from django.db import models
 from django.utils import timezone
 
-from apps.core.models import BaseModel
+from apps.core.models import ACTIVE_CREATED_INDEX, BaseModel
 from fields.choices import EXECUTION_STATUS_CHOICES, ExecutionStatus
 from fields.names import (
     FIELD_EXECUTION_STATUS,
@@ -102,12 +102,15 @@ class ExecutionLog(BaseModel):
         help_text="Aggregated results from all nodes",
     )
     
-    class Meta:
+    class Meta(BaseModel.Meta):
         db_table = "execution_logs"
         verbose_name = "Execution Log"
         verbose_name_plural = "Execution Logs"
         ordering = ["-started_at"]
         indexes = [
+            ACTIVE_CREATED_INDEX,
+            # Recent activity feed (runs by start time, newest first)
+            models.Index(fields=["-started_at"]),
             models.Index(fields=["workflow", "-started_at"]),
             models.Index(fields=["status", "-started_at"]),
         ]
@@ -116,12 +119,33 @@ class ExecutionLog(BaseModel):
         """String representation of the execution."""
         return f"Execution {self.uuid} - {self.workflow.name} ({self.status})"
     
+    @classmethod
+    def create_started(cls, workflow) -> "ExecutionLog":
+        """
+        Create an execution that is already running.
+        
+        Equivalent to create() followed by start(), in a single INSERT.
+        
+        Args:
+            workflow: The workflow being executed.
+        
+        Returns:
+            The new ExecutionLog.
+        """
+        execution = cls.objects.create(
+            workflow=workflow,
+            status=ExecutionStatus.RUNNING.value,
+            started_at=timezone.now(),
+        )
+        logger.info("Execution %s started", execution.uuid)
+        return execution
+    
     def start(self) -> None:
         """Mark execution as started."""
         self.status = ExecutionStatus.RUNNING.value
         self.started_at = timezone.now()
         self.save(update_fields=["status", "started_at", "updated_at"])
-        logger.info(f"Execution {self.uuid} started")
+        logger.info("Execution %s started", self.uuid)
     
     def complete(self, result_data: dict) -> None:
         """
@@ -134,7 +158,7 @@ class ExecutionLog(BaseModel):
         self.completed_at = timezone.now()
         self.result_data = result_data
         self.save(update_fields=["status", "completed_at", "result_data", "updated_at"])
-        logger.info(f"Execution {self.uuid} completed successfully")
+        logger.info("Execution %s completed successfully", self.uuid)
     
     def fail(self, error_message: str) -> None:
         """
@@ -147,7 +171,7 @@ class ExecutionLog(BaseModel):
         self.completed_at = timezone.now()
         self.error_message = error_message
         self.save(update_fields=["status", "completed_at", "error_message", "updated_at"])
-        logger.error(f"Execution {self.uuid} failed: {error_message}")
+        logger.error("Execution %s failed: %s", self.uuid, error_message)
     
     def get_duration_seconds(self) -> Optional[float]:
         """
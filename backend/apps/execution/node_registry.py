@@ -0,0 +1,106 @@
+# =============================================================================
+# FILE: backend/apps/execution/node_registry.py
+# =============================================================================
+# Registry of database-generated node types.
+#
+# Maps "{provider}_{operation_id}" node types to the OpenAPI endpoint they
+# call, so executing a node is a dictionary lookup instead of a spec query
+# plus a scan of every endpoint.
+# =============================================================================
+"""
+Registry of database-generated (OpenAPI) node types.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# =============================================================================
+# LOGGER
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+@dataclass(frozen=True)
+class ProviderNodes:
+    """
+    Endpoints of the active OpenAPI spec for one provider.
+
+    Attributes:
+        spec: The OpenAPISpec instance the endpoints came from
+        endpoints: Endpoint definitions keyed by lowercased operation_id
+        operation_ids: Operation IDs in spec order (for diagnostics)
+    """
+
+    spec: Any
+    endpoints: Dict[str, dict] = field(default_factory=dict)
+    operation_ids: List[str] = field(default_factory=list)
+
+
+# provider -> ProviderNodes, or None when the provider has no usable spec.
+# Filled lazily (no queries during app loading) and cleared whenever an
+# OpenAPISpec is saved or deleted in this process.
+_PROVIDERS: Dict[str, Optional[ProviderNodes]] = {}
+_lock = threading.Lock()
+
+
+def _load_provider(provider: str) -> Optional[ProviderNodes]:
+    """Query the active, parsed spec for a provider and index its endpoints."""
+    from apps.integrations.models import OpenAPISpec
+
+    spec = OpenAPISpec.objects.filter(
+        provider=provider,
+        is_active=True,
+        is_parsed=True
+    ).first()
+
+    if not spec:
+        return None
+
+    endpoints: Dict[str, dict] = {}
+    operation_ids: List[str] = []
+    for endpoint in spec.parsed_data.get('endpoints', []):
+        operation_id = endpoint.get('operation_id', '')
+        operation_ids.append(operation_id)
+        # First match wins, as with the previous linear scan
+        endpoints.setdefault(operation_id.lower(), endpoint)
+
+    return ProviderNodes(spec=spec, endpoints=endpoints, operation_ids=operation_ids)
+
+
+def get_provider_nodes(provider: str) -> Optional[ProviderNodes]:
+    """
+    Get the indexed endpoints for a provider.
+
+    Args:
+        provider: Provider prefix of the node type (e.g. 'etherscan')
+
+    Returns:
+        ProviderNodes, or None if the provider has no active parsed spec
+    """
+    try:
+        return _PROVIDERS[provider]
+    except KeyError:
+        pass
+
+    with _lock:
+        if provider not in _PROVIDERS:
+            _PROVIDERS[provider] = _load_provider(provider)
+            logger.debug("Registered node endpoints for provider '%s'", provider)
+        return _PROVIDERS[provider]
+
+
+def clear_registry(sender=None, **kwargs) -> None:
+    """Drop all registered providers (connected to OpenAPISpec changes)."""
+    with _lock:
+        _PROVIDERS.clear()
@@ -0,0 +1,686 @@
+# =============================================================================
+# FILE: backend/apps/execution/pdf_report.py
+# =============================================================================
+# ReportLab PDF report rendering for the pdf_export node.
+#
+# Free of Django imports so the executor can run it in a worker process:
+# page layout and matplotlib charts are CPU-bound and would otherwise hold
+# the GIL while the rest of the workflow runs.
+# =============================================================================
+"""
+ReportLab PDF report rendering for blockchain intelligence workflows.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+# =============================================================================
+# LAZY IMPORTS
+# =============================================================================
+
+
+@lru_cache(maxsize=1)
+def _reportlab() -> SimpleNamespace:
+    """
+    Import the ReportLab names used by the report, once per process.
+
+    Raises:
+        ImportError: If reportlab is not installed
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.lib.units import inch, mm
+    from reportlab.platypus import (
+        Image, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+    )
+
+    return SimpleNamespace(
+        colors=colors, TA_CENTER=TA_CENTER, TA_LEFT=TA_LEFT, TA_RIGHT=TA_RIGHT,
+        A4=A4, ParagraphStyle=ParagraphStyle, getSampleStyleSheet=getSampleStyleSheet,
+        inch=inch, mm=mm, Image=Image, PageBreak=PageBreak, Paragraph=Paragraph,
+        SimpleDocTemplate=SimpleDocTemplate, Spacer=Spacer, Table=Table,
+        TableStyle=TableStyle,
+    )
+
+
+@lru_cache(maxsize=1)
+def _pdf_styles() -> SimpleNamespace:
+    """
+    Colors and paragraph styles of the report, built once per process.
+
+    Raises:
+        ImportError: If reportlab is not installed
+    """
+    rl = _reportlab()
+    ParagraphStyle = rl.ParagraphStyle
+    white = rl.colors.white
+
+    # ═══════════════════════════════════════════════════════════════
+    # COLOR SCHEME (matching HTML template)
+    # ═══════════════════════════════════════════════════════════════
+    PRIMARY_BLUE = rl.colors.HexColor('#1a237e')       # Dark blue (sidebar, headers)
+    TEXT_DARK = rl.colors.HexColor('#333333')
+    TEXT_MUTED = rl.colors.HexColor('#666666')
+    TEXT_LIGHT = rl.colors.HexColor('#999999')
+
+    # Get styles
+    styles = rl.getSampleStyleSheet()
+
+    # ═══════════════════════════════════════════════════════════════
+    # CUSTOM STYLES (matching HTML template)
+    # ═══════════════════════════════════════════════════════════════
+    return SimpleNamespace(
+        PRIMARY_BLUE=PRIMARY_BLUE,
+        TEXT_DARK=TEXT_DARK,
+        TEXT_MUTED=TEXT_MUTED,
+        TEXT_LIGHT=TEXT_LIGHT,
+        BG_LIGHT=rl.colors.HexColor('#f5f5f5'),
+        BG_ROW_ALT=rl.colors.HexColor('#fafafa'),
+        GRID=rl.colors.HexColor('#e0e0e0'),
+        FOOTER_RULE=rl.colors.HexColor('#dddddd'),
+
+        # Section title style (matches .section-title in HTML)
+        section_title=ParagraphStyle(
+            'SectionTitle',
+            parent=styles['Heading1'],
+            fontSize=16,
+            fontName='Helvetica-Bold',
+            spaceBefore=25,
+            spaceAfter=12,
+            textColor=PRIMARY_BLUE,
+            borderPadding=(0, 0, 8, 0),
+        ),
+        body=ParagraphStyle(
+            'BodyText',
+            parent=styles['Normal'],
+            fontSize=11,
+            spaceAfter=10,
+            alignment=rl.TA_LEFT,
+            leading=16,
+            textColor=TEXT_DARK
+        ),
+        kv_label=ParagraphStyle(
+            'KVLabel',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=TEXT_MUTED,
+            spaceAfter=2
+        ),
+        kv_value=ParagraphStyle(
+            'KVValue',
+            parent=styles['Normal'],
+            fontSize=11,
+            fontName='Helvetica-Bold',
+            textColor=TEXT_DARK,
+            spaceAfter=8
+        ),
+
+        # Cover page
+        logo_icon=ParagraphStyle('LogoIcon', fontSize=36, alignment=rl.TA_CENTER, textColor=white, spaceAfter=10),
+        logo_text=ParagraphStyle('LogoText', fontSize=24, fontName='Helvetica-Bold',
+                                 alignment=rl.TA_CENTER, textColor=white, spaceAfter=40),
+        meta=ParagraphStyle('MetaText', fontSize=9, textColor=white, alignment=rl.TA_LEFT,
+                            leading=14, leftIndent=10),
+        cover_title=ParagraphStyle('CoverTitle', fontSize=28, fontName='Helvetica-Bold',
+                                   textColor=PRIMARY_BLUE, spaceAfter=15, leading=34),
+        cover_subtitle=ParagraphStyle('CoverSubtitle', fontSize=14, textColor=TEXT_MUTED, spaceAfter=40),
+        info_label=ParagraphStyle('InfoLabel', fontSize=9, textColor=TEXT_LIGHT),
+        info_value=ParagraphStyle('InfoValue', fontSize=12, fontName='Helvetica-Bold',
+                                  textColor=TEXT_DARK, spaceAfter=12),
+
+        # Content pages
+        header_logo=ParagraphStyle('HeaderLogo', fontSize=14, fontName='Helvetica-Bold', textColor=PRIMARY_BLUE),
+        header_title=ParagraphStyle('HeaderTitle', fontSize=10, textColor=TEXT_MUTED, alignment=rl.TA_RIGHT),
+        stat_value=ParagraphStyle('StatValue', fontSize=20, fontName='Helvetica-Bold',
+                                  textColor=PRIMARY_BLUE, alignment=rl.TA_CENTER),
+        stat_label=ParagraphStyle('StatLabel', fontSize=9, textColor=TEXT_MUTED, alignment=rl.TA_CENTER),
+        caption=ParagraphStyle('Caption', parent=styles['Normal'], fontSize=9,
+                               alignment=rl.TA_CENTER, textColor=TEXT_MUTED),
+        card_title=ParagraphStyle('CardTitle', fontSize=12, fontName='Helvetica-Bold',
+                                  textColor=TEXT_DARK, spaceBefore=15, spaceAfter=8),
+        note=ParagraphStyle('Note', parent=styles['Normal'], fontSize=9,
+                            textColor=TEXT_MUTED, spaceAfter=10),
+        footer_left=ParagraphStyle('FooterLeft', fontSize=8, textColor=TEXT_LIGHT),
+        footer_right=ParagraphStyle('FooterRight', fontSize=8, textColor=TEXT_LIGHT, alignment=rl.TA_RIGHT),
+    )
+
+
+@lru_cache(maxsize=1)
+def _pyplot():
+    """
+    Import matplotlib.pyplot on the non-interactive Agg backend, once.
+
+    Raises:
+        ImportError: If matplotlib is not installed
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Non-interactive backend
+    import matplotlib.pyplot as plt
+
+    return plt
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+
+def render_pdf_report(
+    file_path: str,
+    rows: List[dict],
+    report_title: str,
+    workflow_name: str,
+    summary_stats: Dict[str, Any],
+    columns: List[str],
+    include_graphs: bool = True,
+    graph_type: str = 'auto',
+) -> None:
+    """
+    Write a professional PDF report matching the HTML template style.
+
+    Features:
+    - Professional cover page with blue sidebar (matching HTML template)
+    - Executive summary with stats cards
+    - Data sections adapted to content type
+    - Formatted data tables with professional styling
+    - Consistent #1a237e color scheme
+
+    Args:
+        file_path: Destination of the PDF file
+        rows: Export rows
+        report_title: Title on the cover and page headers
+        workflow_name: Workflow shown on the cover
+        summary_stats: Totals from WorkflowExecutor._calculate_summary_stats()
+        columns: Columns of the detailed results table
+        include_graphs: Add a chart of the data
+        graph_type: 'auto', 'pie', 'bar' or 'line'
+
+    Raises:
+        ImportError: If reportlab or matplotlib is not installed
+    """
+    rl = _reportlab()
+    _pyplot()  # Charts need matplotlib; fail before writing anything
+
+    # Define page sizes
+    PAGE_WIDTH, PAGE_HEIGHT = rl.A4
+
+    # Colors and paragraph styles (matching HTML template)
+    st = _pdf_styles()
+    PRIMARY_BLUE = st.PRIMARY_BLUE
+    BG_LIGHT = st.BG_LIGHT
+    BG_ROW_ALT = st.BG_ROW_ALT
+    section_title_style = st.section_title
+    body_style = st.body
+    kv_label_style = st.kv_label
+    kv_value_style = st.kv_value
+
+    # Create custom document
+    doc = rl.SimpleDocTemplate(
+        file_path,
+        pagesize=rl.A4,
+        rightMargin=15*rl.mm,
+        leftMargin=15*rl.mm,
+        topMargin=15*rl.mm,
+        bottomMargin=15*rl.mm
+    )
+
+    story = []
+    report_id = str(uuid.uuid4())[:8].upper()
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    # ═══════════════════════════════════════════════════════════════
+    # PAGE 1: COVER PAGE (matching HTML template layout)
+    # ═══════════════════════════════════════════════════════════════
+
+    # Calculate dimensions
+    content_width = PAGE_WIDTH - 30*rl.mm
+    sidebar_width = content_width * 0.35
+    main_width = content_width * 0.65
+    cover_height = PAGE_HEIGHT - 30*rl.mm
+
+    # Build sidebar content
+    sidebar_content = []
+    sidebar_content.append(rl.Paragraph(
+        "🔗",
+        st.logo_icon
+    ))
+    sidebar_content.append(rl.Paragraph(
+        "EasyCall",
+        st.logo_text
+    ))
+    sidebar_content.append(rl.Spacer(1, cover_height * 0.5))
+    sidebar_content.append(rl.Paragraph(
+        f"<b>Report Generated:</b><br/>{generated_at}",
+        st.meta
+    ))
+    sidebar_content.append(rl.Spacer(1, 15))
+    sidebar_content.append(rl.Paragraph(
+        "<b>Classification:</b><br/>CONFIDENTIAL",
+        st.meta
+    ))
+    sidebar_content.append(rl.Spacer(1, 15))
+    sidebar_content.append(rl.Paragraph(
+        f"<b>Report ID:</b><br/>{report_id}",
+        st.meta
+    ))
+
+    # Build sidebar as a table cell
+    sidebar_table = rl.Table([[sidebar_content]], colWidths=[sidebar_width - 10])
+    sidebar_table.setStyle(rl.TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('TOPPADDING', (0, 0), (-1, -1), 30),
+    ]))
+
+    # Build main content
+    main_content = []
+    main_content.append(rl.Spacer(1, cover_height * 0.25))
+    main_content.append(rl.Paragraph(
+        report_title,
+        st.cover_title
+    ))
+    main_content.append(rl.Paragraph(
+        "Comprehensive analysis of blockchain addresses and transactions",
+        st.cover_subtitle
+    ))
+
+    # Cover info items
+    info_items = [
+        ("WORKFLOW", workflow_name),
+        ("RECORDS ANALYZED", str(len(rows))),
+    ]
+    if summary_stats.get('unique_addresses'):
+        info_items.append(("ADDRESSES", str(summary_stats['unique_addresses'])))
+    if summary_stats.get('total_transfers'):
+        info_items.append(("TRANSFERS", str(summary_stats['total_transfers'])))
+
+    # Info section with left border
+    info_table_data = []
+    for label, value in info_items:
+        info_table_data.append([
+            rl.Paragraph(label, st.info_label),
+        ])
+        info_table_data.append([
+            rl.Paragraph(value, st.info_value),
+        ])
+
+    info_table = rl.Table(info_table_data, colWidths=[main_width - 40])
+    info_table.setStyle(rl.TableStyle([
+        ('LEFTPADDING', (0, 0), (-1, -1), 15),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ]))
+
+    main_content.append(rl.Spacer(1, 30))
+
+    # Create bordered info section
+    bordered_info = rl.Table([[info_table]], colWidths=[main_width - 20])
+    bordered_info.setStyle(rl.TableStyle([
+        ('LINEWIDTH', (0, 0), (0, 0), 4),
+        ('LINEBEFORE', (0, 0), (0, 0), 4, PRIMARY_BLUE),
+        ('LEFTPADDING', (0, 0), (-1, -1), 5),
+    ]))
+    main_content.append(bordered_info)
+
+    main_table = rl.Table([[main_content]], colWidths=[main_width])
+    main_table.setStyle(rl.TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 30),
+    ]))
+
+    # Combine sidebar and main into cover
+    cover_table = rl.Table(
+        [[[sidebar_table], [main_table]]],
+        colWidths=[sidebar_width, main_width]
+    )
+    cover_table.setStyle(rl.TableStyle([
+        ('BACKGROUND', (0, 0), (0, 0), PRIMARY_BLUE),
+        ('BACKGROUND', (1, 0), (1, 0), rl.colors.white),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+    ]))
+
+    story.append(cover_table)
+    story.append(rl.PageBreak())
+
+    # ═══════════════════════════════════════════════════════════════
+    # PAGE 2: CONTENT PAGES (matching HTML template sections)
+    # ═══════════════════════════════════════════════════════════════
+
+    # Page header
+    header_table = rl.Table(
+        [[
+            rl.Paragraph("🔗 EasyCall", st.header_logo),
+            rl.Paragraph(report_title, st.header_title)
+        ]],
+        colWidths=[content_width * 0.5, content_width * 0.5]
+    )
+    header_table.setStyle(rl.TableStyle([
+        ('LINEBELOW', (0, 0), (-1, 0), 2, PRIMARY_BLUE),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ]))
+    story.append(header_table)
+    story.append(rl.Spacer(1, 20))
+
+    # --- SECTION: Executive Summary ---
+    story.append(rl.Paragraph("Executive Summary", section_title_style))
+
+    # Executive summary box (gray background like HTML)
+    total_records = len(rows)
+
+    summary_text = f"This report analyzed <b>{total_records}</b> records"
+    if summary_stats.get('unique_addresses'):
+        summary_text += f" covering <b>{summary_stats['unique_addresses']}</b> blockchain address(es)"
+    if summary_stats.get('total_transfers'):
+        summary_text += f" with <b>{summary_stats['total_transfers']:,}</b> total transfers"
+    summary_text += "."
+
+    summary_box = rl.Table(
+        [[rl.Paragraph(summary_text, body_style)]],
+        colWidths=[content_width - 10]
+    )
+    summary_box.setStyle(rl.TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), BG_LIGHT),
+        ('TOPPADDING', (0, 0), (-1, -1), 15),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
+        ('LEFTPADDING', (0, 0), (-1, -1), 20),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 20),
+        ('ROUNDEDCORNERS', [8, 8, 8, 8]),
+    ]))
+    story.append(summary_box)
+
+    # Summary stats cards
+    stat_cards = []
+    stat_cards.append(("Records", str(total_records)))
+    if summary_stats.get('unique_addresses'):
+        stat_cards.append(("Addresses", str(summary_stats['unique_addresses'])))
+    if summary_stats.get('total_transfers'):
+        stat_cards.append(("Transfers", str(summary_stats['total_transfers'])))
+    if summary_stats.get('total_balance'):
+        stat_cards.append(("Balance", f"{summary_stats['total_balance']:.4f}"))
+
+    if stat_cards:
+        card_width = (content_width - 30) / len(stat_cards)
+        card_data = []
+        for label, value in stat_cards:
+            card_content = [
+                rl.Paragraph(str(value), st.stat_value),
+                rl.Paragraph(label.upper(), st.stat_label)
+            ]
+            card_data.append(card_content)
+
+        stats_table = rl.Table([card_data], colWidths=[card_width] * len(stat_cards))
+        stats_table.setStyle(rl.TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), rl.colors.white),
+            ('BOX', (0, 0), (-1, -1), 0.5, st.GRID),
+            ('INNERGRID', (0, 0), (-1, -1), 0.5, st.GRID),
+            ('TOPPADDING', (0, 0), (-1, -1), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]))
+        story.append(rl.Spacer(1, 15))
+        story.append(stats_table)
+
+    # --- SECTION: Data Visualization ---
+    if include_graphs and rows:
+        story.append(rl.Spacer(1, 10))
+        story.append(rl.Paragraph("Data Visualization", section_title_style))
+        graph_image = generate_graph(rows, graph_type)
+        if graph_image:
+            story.append(rl.Image(graph_image, width=5*rl.inch, height=3*rl.inch))
+            story.append(rl.Paragraph(
+                "<i>Figure 1: Analysis results visualization</i>",
+                st.caption
+            ))
+
+    # --- SECTION: Query Results (Key-Value pairs for first few records) ---
+    story.append(rl.PageBreak())
+
+    # Page header again
+    story.append(header_table)
+    story.append(rl.Spacer(1, 20))
+
+    story.append(rl.Paragraph("Query Results", section_title_style))
+
+    # Show first 5 records as key-value cards
+    for idx, row in enumerate(rows[:5]):
+        # Create card for each record
+        card_title = f"Record {idx + 1}"
+        if 'address' in row:
+            card_title = f"Address: {str(row['address'])[:20]}..."
+        elif 'clusterName' in row or 'cluster_name' in row:
+            card_title = row.get('clusterName') or row.get('cluster_name', f'Record {idx + 1}')
+
+        story.append(rl.Paragraph(card_title, st.card_title))
+
+        # Key-value pairs in 2-column grid
+        kv_data = []
+        items = list(row.items())[:8]  # Limit to 8 fields per record
+        for i in range(0, len(items), 2):
+            row_cells = []
+            for j in range(2):
+                if i + j < len(items):
+                    key, value = items[i + j]
+                    # Format the value
+                    if isinstance(value, float):
+                        value = f"{value:,.4f}"
+                    elif isinstance(value, (list, dict)):
+                        value = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
+                    elif value is None:
+                        value = "N/A"
+                    elif isinstance(value, str) and len(value) > 50:
+                        value = value[:47] + "..."
+
+                    cell_content = [
+                        rl.Paragraph(key.replace('_', ' ').upper(), kv_label_style),
+                        rl.Paragraph(str(value), kv_value_style)
+                    ]
+                    row_cells.append(cell_content)
+                else:
+                    row_cells.append(["", ""])
+            kv_data.append(row_cells)
+
+        if kv_data:
+            kv_table = rl.Table(kv_data, colWidths=[(content_width - 20) / 2] * 2)
+            kv_table.setStyle(rl.TableStyle([
+                ('BACKGROUND', (0, 0), (-1, -1), BG_ROW_ALT),
+                ('LINEBEFORE', (0, 0), (0, -1), 3, PRIMARY_BLUE),
+                ('LINEBEFORE', (1, 0), (1, -1), 3, PRIMARY_BLUE),
+                ('TOPPADDING', (0, 0), (-1, -1), 8),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+                ('LEFTPADDING', (0, 0), (-1, -1), 12),
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ]))
+            story.append(kv_table)
+
+    # --- SECTION: Full Data rl.Table ---
+    if len(rows) > 5:
+        story.append(rl.PageBreak())
+        story.append(header_table)
+        story.append(rl.Spacer(1, 20))
+
+        story.append(rl.Paragraph("Detailed Results", section_title_style))
+
+        if len(rows) > 50:
+            story.append(rl.Paragraph(
+                f"<i>Showing first 50 of {len(rows)} records</i>",
+                st.note
+            ))
+
+        # Prepare table
+        display_columns = columns[:8]  # Limit columns
+        table_data = [[col.replace('_', ' ').title()[:15] for col in display_columns]]
+
+        for row in rows[:50]:
+            row_data = []
+            for col in display_columns:
+                value = row.get(col, '')
+                if isinstance(value, str) and len(value) > 25:
+                    value = value[:22] + '...'
+                elif isinstance(value, (list, dict)):
+                    value = str(value)[:22] + '...'
+                elif isinstance(value, float):
+                    value = f"{value:,.2f}"
+                elif value is None:
+                    value = 'N/A'
+                row_data.append(str(value))
+            table_data.append(row_data)
+
+        # Calculate column widths
+        num_cols = len(display_columns)
+        col_widths = [(content_width - 10) / num_cols] * num_cols
+
+        table = rl.Table(table_data, colWidths=col_widths)
+        table.setStyle(rl.TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_BLUE),
+            ('TEXTCOLOR', (0, 0), (-1, 0), rl.colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 8),
+            ('FONTSIZE', (0, 1), (-1, -1), 7),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+            ('TOPPADDING', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+            ('TOPPADDING', (0, 1), (-1, -1), 6),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl.colors.white, BG_ROW_ALT]),
+            ('LINEBELOW', (0, 0), (-1, 0), 1, st.GRID),
+            ('LINEBELOW', (0, 1), (-1, -2), 0.5, st.GRID),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ]))
+
+        story.append(table)
+
+    # Footer
+    story.append(rl.Spacer(1, 30))
+    footer_table = rl.Table(
+        [[
+            rl.Paragraph(f"Generated by EasyCall | {generated_at}", st.footer_left),
+            rl.Paragraph("CONFIDENTIAL", st.footer_right)
+        ]],
+        colWidths=[content_width * 0.7, content_width * 0.3]
+    )
+    footer_table.setStyle(rl.TableStyle([
+        ('LINEABOVE', (0, 0), (-1, 0), 0.5, st.FOOTER_RULE),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ]))
+    story.append(footer_table)
+
+    # Build PDF
+    doc.build(story)
+
+
+# =============================================================================
+# CHARTS
+# =============================================================================
+
+
+def generate_graph(rows: List[dict], graph_type: str) -> Optional[BytesIO]:
+    """Generate a graph image from data rows."""
+    plt = _pyplot()
+
+    if not rows:
+        return None
+
+    # Analyze data to determine best graph type
+    sample_row = rows[0]
+
+    # Find numeric columns
+    numeric_cols = []
+    category_cols = []
+
+    for key, value in sample_row.items():
+        if isinstance(value, (int, float)) and key not in ('count', 'rows_written'):
+            numeric_cols.append(key)
+        elif isinstance(value, str) and len(value) < 50:
+            category_cols.append(key)
+
+    if not numeric_cols:
+        return None
+
+    # Auto-detect best graph type
+    if graph_type == 'auto':
+        if 'category' in sample_row or 'cluster_name' in sample_row or 'clusterName' in sample_row:
+            graph_type = 'pie'
+        elif len(rows) > 10:
+            graph_type = 'bar'
+        else:
+            graph_type = 'bar'
+
+    # Create figure
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Style
+    plt.style.use('seaborn-v0_8-whitegrid')
+    colors_list = ['#1565c0', '#00897b', '#f57c00', '#d32f2f', '#7b1fa2', '#388e3c']
+
+    try:
+        if graph_type == 'pie' and 'category' in sample_row:
+            # Pie chart for category distribution
+            categories = {}
+            value_field = 'value' if 'value' in sample_row else numeric_cols[0]
+            for row in rows:
+                cat = row.get('category', row.get('cluster_name', row.get('clusterName', 'Unknown')))
+                val = float(row.get(value_field, 1) or 1)
+                categories[cat] = categories.get(cat, 0) + val
+
+            if categories:
+                labels = list(categories.keys())[:8]  # Max 8 slices
+                values = [categories[l] for l in labels]
+                ax.pie(values, labels=labels, autopct='%1.1f%%', colors=colors_list[:len(labels)])
+                ax.set_title('Distribution by Category', fontsize=14, fontweight='bold')
+
+        elif graph_type == 'bar':
+            # Bar chart
+            if 'balance' in numeric_cols:
+                # Balance by address/cluster
+                label_field = 'address' if 'address' in sample_row else 'cluster_name'
+                data = [(row.get(label_field, f'Item {i}')[:15], float(row.get('balance', 0) or 0))
+                        for i, row in enumerate(rows[:10])]
+                labels, values = zip(*data) if data else ([], [])
+                ax.barh(labels, values, color=colors_list[0])
+                ax.set_xlabel('Balance', fontsize=11)
+                ax.set_title('Balance by Address', fontsize=14, fontweight='bold')
+            else:
+                # Generic numeric data
+                num_col = numeric_cols[0]
+                values = [float(row.get(num_col, 0) or 0) for row in rows[:15]]
+                labels = [f'Record {i+1}' for i in range(len(values))]
+                ax.bar(labels, values, color=colors_list[0])
+                ax.set_ylabel(num_col, fontsize=11)
+                ax.set_title(f'{num_col} Distribution', fontsize=14, fontweight='bold')
+                plt.xticks(rotation=45, ha='right')
+
+        elif graph_type == 'line':
+            # Line chart
+            num_col = numeric_cols[0]
+            values = [float(row.get(num_col, 0) or 0) for row in rows[:50]]
+            ax.plot(range(len(values)), values, color=colors_list[0], linewidth=2, marker='o', markersize=4)
+            ax.set_xlabel('Record Index', fontsize=11)
+            ax.set_ylabel(num_col, fontsize=11)
+            ax.set_title(f'{num_col} Trend', fontsize=14, fontweight='bold')
+            ax.fill_between(range(len(values)), values, alpha=0.3, color=colors_list[0])
+
+        plt.tight_layout()
+
+        # Save to BytesIO
+        img_buffer = BytesIO()
+        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
+        img_buffer.seek(0)
+        plt.close(fig)
+
+        return img_buffer
+
+    except Exception as e:
+        plt.close(fig)
+        return None
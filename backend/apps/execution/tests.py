@@ -0,0 +1,885 @@
+# =============================================================================
+# FILE: backend/apps/execution/tests.py
+# =============================================================================
+# Unit tests for execution app.
+# =============================================================================
+"""
+Tests for the workflow executor and generic API executor.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import json
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from apps.execution import api_executor, node_registry
+from apps.execution.api_executor import APIExecutionError, GenericAPIExecutor
+from apps.execution.executor import WorkflowExecutor, _json_bytes, _truncated_json
+from apps.integrations.chainalysis_client import ChainalysisAPIError, ChainalysisClient
+from apps.integrations.models import OpenAPISpec
+from apps.workflows.models import Workflow
+from apps.workflows.planning import topological_levels
+from fields.choices import ExecutionStatus
+
+
+def _node(node_id, node_type, **config):
+    """Build a canvas node dict."""
+    return {'id': node_id, 'type': node_type, 'data': {'configValues': config}}
+
+
+def _edge(source, target, source_handle='address', target_handle='address'):
+    """Build a canvas edge dict."""
+    return {
+        'source': source,
+        'target': target,
+        'sourceHandle': source_handle,
+        'targetHandle': target_handle,
+    }
+
+
+# =============================================================================
+# WORKFLOW EXECUTOR TESTS
+# =============================================================================
+
+
+class TopologicalSortTests(SimpleTestCase):
+    """Tests for dependency level ordering."""
+
+    def test_levels_group_independent_nodes(self):
+        """Nodes whose inputs are ready share a level, in canvas order."""
+        nodes = [
+            _node('log', 'console_log'),
+            _node('b', 'single_address'),
+            _node('a', 'single_address'),
+        ]
+        edges = [_edge('a', 'log', target_handle='a'), _edge('b', 'log', target_handle='b')]
+
+        levels = WorkflowExecutor(None)._topological_sort(nodes, edges)
+
+        self.assertEqual(
+            [[node['id'] for node in level] for level in levels],
+            [['b', 'a'], ['log']],
+        )
+
+    def test_linear_chain(self):
+        """A pipeline in any canvas order comes out as one node per level."""
+        nodes = [
+            _node('export', 'csv_export'),
+            _node('input', 'single_address'),
+            _node('query', 'chainalysis_cluster_info'),
+        ]
+        edges = [_edge('query', 'export'), _edge('input', 'query')]
+
+        with mock.patch('apps.workflows.planning.defaultdict') as kahn_state:
+            levels = topological_levels(nodes, edges)
+
+        kahn_state.assert_not_called()
+        self.assertEqual(levels, [['input'], ['query'], ['export']])
+
+    def test_chain_with_branch_uses_full_sort(self):
+        """A node with two successors is not a chain but still sorts."""
+        nodes = [_node('a', 'single_address'), _node('b', 'console_log'), _node('c', 'console_log')]
+        edges = [_edge('a', 'b'), _edge('a', 'c')]
+
+        self.assertEqual(topological_levels(nodes, edges), [['a'], ['b', 'c']])
+
+    def test_cycles_are_skipped(self):
+        """Nodes on a cycle never become ready."""
+        nodes = [_node('a', 'console_log'), _node('b', 'console_log'), _node('c', 'single_address')]
+        edges = [_edge('a', 'b'), _edge('b', 'a')]
+
+        levels = WorkflowExecutor(None)._topological_sort(nodes, edges)
+
+        self.assertEqual([[node['id'] for node in level] for level in levels], [['c']])
+
+
+class WorkflowExecutionTests(SimpleTestCase):
+    """Tests for level-by-level workflow execution."""
+
+    def test_fan_in_workflow(self):
+        """Independent nodes run concurrently and feed their dependent."""
+        workflow = SimpleNamespace(canvas_data={
+            'nodes': [
+                _node('a', 'single_address', address='addr-a'),
+                _node('b', 'single_address', address='addr-b'),
+                _node('log', 'console_log'),
+            ],
+            'edges': [
+                _edge('a', 'log', target_handle='first'),
+                _edge('b', 'log', target_handle='second'),
+            ],
+        })
+
+        executor = WorkflowExecutor(workflow)
+        result = executor.execute_direct()
+
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(
+            result['outputs']['log']['data'],
+            {'first': 'addr-a', 'second': 'addr-b'},
+        )
+
+        # Each node's log block stays contiguous and in canvas order
+        node_starts = [
+            i for i, line in enumerate(executor.execution_log)
+            if line.startswith('  Node ID:')
+        ]
+        self.assertEqual(
+            [executor.execution_log[i] for i in node_starts],
+            ['  Node ID: a', '  Node ID: b', '  Node ID: log'],
+        )
+        self.assertIn(
+            '  ✅ Node completed successfully',
+            executor.execution_log[node_starts[0]:node_starts[1]],
+        )
+
+
+class TruncatedJSONTests(SimpleTestCase):
+    """Tests for bounded JSON previews."""
+
+    def test_matches_sliced_dumps(self):
+        """The preview equals the full encoding cut to the limit."""
+        value = {'counterparties': [{'address': f'addr-{i}', 'value': i} for i in range(1000)]}
+
+        self.assertEqual(
+            _truncated_json(value, 500, indent=2),
+            json.dumps(value, indent=2, default=str)[:500]
+        )
+        self.assertEqual(_truncated_json({'a': 1}), '{"a": 1}')
+
+    def test_stops_encoding_early(self):
+        """Items past the limit are never serialized."""
+        class Tracked:
+            seen = 0
+
+            def __str__(self):
+                Tracked.seen += 1
+                return 'tracked'
+
+        _truncated_json([Tracked() for _ in range(1000)], 50)
+
+        self.assertLess(Tracked.seen, 10)
+
+
+class JSONBytesTests(SimpleTestCase):
+    """Tests for orjson serialization with a json fallback."""
+
+    def test_indented_output_matches_json(self):
+        """Indented output matches json.dumps(indent=2) for plain data."""
+        value = [{'address': 'a', 'balance': 1.5, 'tags': ['exchange']}]
+
+        self.assertEqual(_json_bytes(value, indent=True).decode(), json.dumps(value, indent=2))
+
+    def test_wide_integers_fall_back_to_json(self):
+        """Integers beyond 64 bits (wei amounts) are still serialized."""
+        wei = 10 ** 30
+
+        self.assertEqual(_json_bytes({'value': wei}), b'{"value": 1000000000000000000000000000000}')
+
+
+class NodeDispatchTests(SimpleTestCase):
+    """Tests for the node type dispatch table."""
+
+    def test_every_handler_exists(self):
+        """Each built-in node type maps to a method of the executor."""
+        for node_type, handler in WorkflowExecutor._NODE_HANDLERS.items():
+            with self.subTest(node_type=node_type):
+                self.assertTrue(callable(getattr(WorkflowExecutor, handler, None)))
+
+    def test_config_nodes_build_credentials(self):
+        """Unlisted '*_config' node types still produce API key credentials."""
+        result = WorkflowExecutor(None)._run_node(
+            'coingecko_config', 'cfg', {}, {'api_key': 'secret'}
+        )
+
+        self.assertEqual(result['credentials']['type'], 'apikey')
+        self.assertTrue(result['credentials']['authenticated'])
+
+    def test_node_type_falls_back_to_data(self):
+        """The top-level type wins; otherwise data.type, else 'unknown'."""
+        self.assertEqual(WorkflowExecutor._node_type({'type': 'csv_export'}), 'csv_export')
+        self.assertEqual(
+            WorkflowExecutor._node_type({'data': {'type': 'json_export'}}), 'json_export'
+        )
+        self.assertEqual(WorkflowExecutor._node_type({'id': 'n1'}), 'unknown')
+
+
+class ExposureSummaryTests(SimpleTestCase):
+    """Tests for exposure totals and high-risk flagging."""
+
+    def test_totals_and_flags_in_order(self):
+        """Values are summed and risky categories flagged with their type."""
+        client = ChainalysisClient(api_key='test-key')
+        response = {
+            'direct': [
+                {'category': 'exchange', 'value': 100.0, 'percentage': 80},
+                {'category': 'Darknet Market', 'value': 25.0, 'percentage': 20},
+            ],
+            'indirect': [
+                {'category': 'Stolen Funds', 'value': 5.0, 'percentage': 1},
+                {'value': 1.0},
+            ],
+        }
+        executor = WorkflowExecutor(None)
+
+        with mock.patch.object(client, 'get_exposure_by_category', return_value=response), \
+                mock.patch.object(executor, '_get_chainalysis_client', return_value=client):
+            result = executor._execute_chainalysis_exposure_category({'address': 'addr'}, {})
+
+        self.assertEqual(result['total_direct'], 125.0)
+        self.assertEqual(result['total_indirect'], 6.0)
+        self.assertEqual(
+            [(flag['category'], flag['exposure_type']) for flag in result['high_risk_flags']],
+            [('Darknet Market', 'direct'), ('Stolen Funds', 'indirect')]
+        )
+
+    def test_services_total_and_top_match_sort(self):
+        """One-pass top services match a stable sort, ties included."""
+        exposures = [{'service': str(i), 'value': value} for i, value in enumerate([3, 7, 3, 1, 7, 3, 0, 9])]
+
+        total, top = WorkflowExecutor._summarize_services(exposures)
+
+        self.assertEqual(total, 33)
+        self.assertEqual(top, sorted(exposures, key=lambda x: x['value'], reverse=True)[:5])
+        self.assertEqual(WorkflowExecutor._summarize_services([]), (0, []))
+
+
+class ExecutionLogMessageTests(SimpleTestCase):
+    """Tests for lazy execution log formatting."""
+
+    def test_args_formatted_when_captured(self):
+        """%-style arguments are applied to captured messages."""
+        executor = WorkflowExecutor(None)
+
+        executor._log("     %s... -> %s counterparties", 'bc1qxy2kgdyg', 4)
+
+        self.assertEqual(executor.execution_log, ['     bc1qxy2kgdyg... -> 4 counterparties'])
+
+    def test_nothing_formatted_when_not_logged(self):
+        """Without capture or an INFO logger, arguments are never rendered."""
+        executor = WorkflowExecutor(None)
+        executor._capture_log = False
+        value = mock.MagicMock()
+
+        with mock.patch('apps.execution.executor.logger') as executor_logger:
+            executor_logger.isEnabledFor.return_value = False
+            executor._log("value: %s", value)
+
+        value.__str__.assert_not_called()
+        executor_logger.info.assert_not_called()
+        self.assertEqual(executor.execution_log, [])
+
+# =============================================================================
+# GENERIC API EXECUTOR TESTS
+# =============================================================================
+
+
+class ExecuteTests(SimpleTestCase):
+    """Tests for GenericAPIExecutor.execute."""
+
+    def _executor(self, handler):
+        """Build an executor whose client talks to a mocked transport."""
+        executor = GenericAPIExecutor()
+        executor.client = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(executor.client.close)
+        return executor
+
+    def test_returns_parsed_json(self):
+        """The decoded JSON body is returned."""
+        def handler(request):
+            return httpx.Response(200, json={'address': request.url.params['address']})
+
+        executor = self._executor(handler)
+        result = executor.execute({'url': 'https://api.test/x', 'params': {'address': '0x1'}})
+
+        self.assertEqual(result, {'address': '0x1'})
+
+    @mock.patch.object(api_executor, 'HTTP_RETRY_BACKOFF', 0)
+    def test_retries_gateway_errors(self):
+        """Idempotent requests are retried on 502/503/504."""
+        statuses = [503, 502, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), json={'ok': True})
+
+        result = self._executor(handler).execute({'url': 'https://api.test/x'})
+
+        self.assertEqual(result, {'ok': True})
+        self.assertEqual(statuses, [])
+
+    @mock.patch.object(api_executor, 'HTTP_RETRY_BACKOFF', 0)
+    def test_post_not_retried(self):
+        """Non-idempotent requests surface the first gateway error."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, json={'message': 'unavailable'})
+
+        with self.assertRaisesMessage(APIExecutionError, 'unavailable'):
+            self._executor(handler).execute({'method': 'POST', 'url': 'https://api.test/x'})
+        self.assertEqual(len(calls), 1)
+
+    def test_non_json_body_wrapped(self):
+        """Bodies that are not JSON come back as text under 'response'."""
+        def handler(request):
+            return httpx.Response(200, text='pong')
+
+        result = self._executor(handler).execute({'url': 'https://api.test/x'})
+
+        self.assertEqual(result, {'response': 'pong'})
+
+    def test_oversized_response_aborted(self):
+        """Bodies over MAX_RESPONSE_BYTES are rejected mid-stream."""
+        def handler(request):
+            chunks = [b'x' * api_executor.RESPONSE_CHUNK_SIZE] * 200
+            return httpx.Response(200, stream=httpx.ByteStream(b''.join(chunks)))
+
+        with self.assertRaisesMessage(APIExecutionError, 'Response too large'):
+            self._executor(handler).execute({'url': 'https://api.test/huge'})
+
+    def test_error_status_raises(self):
+        """HTTP error statuses raise APIExecutionError."""
+        def handler(request):
+            return httpx.Response(404, json={'message': 'not found'})
+
+        with self.assertRaisesMessage(APIExecutionError, 'not found'):
+            self._executor(handler).execute({'url': 'https://api.test/x'})
+
+
+class ResponseCacheTests(SimpleTestCase):
+    """Tests for GET response caching and revalidation."""
+
+    def setUp(self):
+        """Start each test with an empty cache."""
+        cache.clear()
+
+    def _run_sequential(self, handler, request_config, count):
+        """Send the same request several times, one after another."""
+        executor = GenericAPIExecutor()
+        executor.client = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(executor.client.close)
+        return [executor.execute(request_config) for _ in range(count)]
+
+    def test_max_age_served_from_cache(self):
+        """A fresh cached response skips the network."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={'n': len(calls)}, headers={'Cache-Control': 'max-age=60'})
+
+        results = self._run_sequential(handler, {'url': 'https://api.test/cached'}, 3)
+
+        self.assertEqual(results, [{'n': 1}] * 3)
+        self.assertEqual(len(calls), 1)
+
+    def test_etag_revalidated(self):
+        """A stale entry with an ETag is revalidated with If-None-Match."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={'ok': True}, headers={'ETag': '"v1"'})
+
+        results = self._run_sequential(handler, {'url': 'https://api.test/etag'}, 2)
+
+        self.assertEqual(results, [{'ok': True}] * 2)
+        self.assertEqual(len(calls), 2)
+        self.assertNotIn('If-None-Match', calls[0].headers)
+
+    def test_uncacheable_responses_not_stored(self):
+        """Responses without cache headers or cache_ttl are always fetched."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        self._run_sequential(handler, {'url': 'https://api.test/plain'}, 2)
+
+        self.assertEqual(len(calls), 2)
+
+
+class BuildURLTests(SimpleTestCase):
+    """Tests for GenericAPIExecutor.build_url."""
+
+    def test_substitutes_path_params(self):
+        """Placeholders are filled and unknown ones are preserved."""
+        url = GenericAPIExecutor().build_url(
+            'https://api.test/v1/',
+            '/addresses/{address}/chains/{chain}/{page}',
+            {'address': '0xabc', 'chain': 1},
+        )
+
+        self.assertEqual(url, 'https://api.test/v1/addresses/0xabc/chains/1/{page}')
+
+    def test_template_parsed_once(self):
+        """Repeated calls with the same path reuse the parsed template."""
+        api_executor._compile_path.cache_clear()
+        executor = GenericAPIExecutor()
+
+        for address in ('0x1', '0x2', '0x3'):
+            url = executor.build_url('https://api.test', '/addresses/{address}', {'address': address})
+
+        self.assertEqual(url, 'https://api.test/addresses/0x3')
+        self.assertEqual(api_executor._compile_path.cache_info().misses, 1)
+
+    def test_malformed_template_falls_back(self):
+        """Templates format_map cannot parse are substituted literally."""
+        url = GenericAPIExecutor().build_url('https://api.test', '/a/{id}/{', {'id': 7})
+
+        self.assertEqual(url, 'https://api.test/a/7/{')
+
+
+class BuildHeadersTests(SimpleTestCase):
+    """Tests for GenericAPIExecutor.build_headers."""
+
+    def test_basic_auth(self):
+        """Basic credentials are encoded and defaults are not shared."""
+        executor = GenericAPIExecutor()
+
+        headers = executor.build_headers({'type': 'basic', 'username': 'user', 'password': 'pass'})
+        headers['X-Extra'] = '1'
+
+        self.assertEqual(headers['Authorization'], 'Basic dXNlcjpwYXNz')
+        self.assertNotIn('X-Extra', executor.build_headers({}))
+
+
+class ExecutionPlanTests(TestCase):
+    """Tests for the execution plan stored on workflows."""
+
+    def setUp(self):
+        """Create a workflow with a fan-in canvas."""
+        self.workflow = Workflow.objects.create(name="Plan", canvas_data={
+            'nodes': [
+                _node('a', 'single_address', address='addr-a'),
+                _node('log', 'console_log'),
+            ],
+            'edges': [_edge('a', 'log')],
+        })
+
+    def test_plan_computed_on_save(self):
+        """Saving a workflow stores its dependency levels."""
+        self.assertEqual(self.workflow.execution_plan['levels'], [['a'], ['log']])
+
+        self.workflow.canvas_data['edges'] = []
+        self.workflow.save(update_fields=['canvas_data'])
+
+        self.workflow.refresh_from_db()
+        self.assertEqual(self.workflow.execution_plan['levels'], [['a', 'log']])
+
+    def test_malformed_canvas_saved_without_plan(self):
+        """Nodes or edges the planner cannot index are stored with no plan."""
+        for canvas in (
+            {'nodes': [{'type': 'console_log'}], 'edges': []},
+            {'nodes': ['a'], 'edges': []},
+            {'nodes': [_node('a', 'console_log')], 'edges': ['a->b']},
+            {'nodes': [_node('a', 'console_log')], 'edges': [{'source': ['a']}]},
+        ):
+            with self.subTest(canvas=canvas):
+                self.workflow.canvas_data = canvas
+                self.workflow.save()
+
+                self.workflow.refresh_from_db()
+                self.assertIsNone(self.workflow.execution_plan)
+
+    def test_malformed_canvas_created_through_api(self):
+        """The workflow API accepts canvases it cannot plan."""
+        response = self.client.post(
+            reverse('workflows:workflow-list'),
+            {
+                'name': 'Malformed',
+                'canvas_data': {'nodes': [{'type': 'console_log'}], 'edges': ['x']},
+            },
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertIsNone(Workflow.objects.get(name='Malformed').execution_plan)
+
+    def test_executor_reuses_plan(self):
+        """A matching stored plan is used instead of re-sorting."""
+        executor = WorkflowExecutor(self.workflow)
+
+        with mock.patch('apps.workflows.planning.topological_levels') as sort:
+            result = executor.execute_direct()
+
+        sort.assert_not_called()
+        self.assertEqual(result['status'], 'success')
+
+    def test_unsaved_canvas_sorted_once(self):
+        """Re-running an unsaved canvas reuses the cached order."""
+        canvas = {
+            'nodes': [_node('x', 'single_address'), _node('y', 'console_log')],
+            'edges': [_edge('x', 'y')],
+        }
+        planning = 'apps.workflows.planning'
+
+        with mock.patch(f'{planning}.topological_levels', wraps=topological_levels) as sort:
+            for _ in range(3):
+                result = WorkflowExecutor(Workflow(canvas_data=canvas)).execute_direct()
+
+        self.assertEqual(sort.call_count, 1)
+        self.assertEqual(result['summary']['nodes_executed'], 2)
+
+    def test_stale_plan_ignored(self):
+        """Canvas changes not saved through the model fall back to sorting."""
+        self.workflow.canvas_data['nodes'].append(_node('b', 'single_address'))
+        executor = WorkflowExecutor(self.workflow)
+
+        result = executor.execute_direct()
+
+        self.assertIn('b', result['outputs'])
+
+
+class NodeRegistryTests(TestCase):
+    """Tests for the database-generated node registry."""
+
+    def setUp(self):
+        """Register a parsed spec and start from an empty registry."""
+        node_registry.clear_registry()
+        self.spec = OpenAPISpec.objects.create(
+            provider="etherscan",
+            name="Etherscan",
+            version="1.0",
+            is_parsed=True,
+            parsed_data={'endpoints': [
+                {'operation_id': 'getBalance', 'method': 'GET', 'path': '/balance'},
+            ]},
+        )
+
+    def tearDown(self):
+        """Do not leak rolled-back specs into other tests."""
+        node_registry.clear_registry()
+
+    def test_lookup_cached_until_spec_changes(self):
+        """Endpoints are indexed once and refreshed when a spec is saved."""
+        provider_nodes = node_registry.get_provider_nodes('etherscan')
+        self.assertEqual(provider_nodes.endpoints['getbalance']['path'], '/balance')
+
+        with self.assertNumQueries(0):
+            node_registry.get_provider_nodes('etherscan')
+
+        self.spec.parsed_data['endpoints'][0]['path'] = '/v2/balance'
+        self.spec.save()
+
+        provider_nodes = node_registry.get_provider_nodes('etherscan')
+        self.assertEqual(provider_nodes.endpoints['getbalance']['path'], '/v2/balance')
+
+    def test_soft_deleted_spec_dropped(self):
+        """Soft deleting a spec (an UPDATE, no save signal) clears its nodes."""
+        self.assertIsNotNone(node_registry.get_provider_nodes('etherscan'))
+
+        self.spec.soft_delete()
+        self.assertIsNone(node_registry.get_provider_nodes('etherscan'))
+
+        self.spec.restore()
+        self.assertIsNotNone(node_registry.get_provider_nodes('etherscan'))
+
+        OpenAPISpec.bulk_soft_delete(OpenAPISpec.objects.filter(pk=self.spec.pk))
+        self.assertIsNone(node_registry.get_provider_nodes('etherscan'))
+
+    def test_unknown_provider(self):
+        """Providers without an active parsed spec resolve to None."""
+        self.assertIsNone(node_registry.get_provider_nodes('unknown'))
+
+
+class ExecutionLogWriteTests(TestCase):
+    """Tests for database writes made while executing a workflow."""
+
+    def test_execute_writes_once_per_state(self):
+        """A run costs one INSERT and one UPDATE of its ExecutionLog."""
+        workflow = Workflow.objects.create(name="Writes", canvas_data={
+            'nodes': [_node('a', 'single_address', address='addr-a')],
+            'edges': [],
+        })
+
+        with self.assertNumQueries(2):
+            execution = WorkflowExecutor(workflow).execute()
+
+        execution.refresh_from_db()
+        self.assertEqual(execution.status, ExecutionStatus.COMPLETED.value)
+        self.assertIsNotNone(execution.started_at)
+        self.assertEqual(execution.result_data['a']['address'], 'addr-a')
+
+
+class NodeResultMemoizationTests(SimpleTestCase):
+    """Tests for reuse of pure node results across executions."""
+
+    def setUp(self):
+        """Start each test with an empty cache."""
+        cache.clear()
+
+    def _run(self, address):
+        """Run a Chainalysis cluster info node."""
+        return WorkflowExecutor(None)._run_node_memoized(
+            'chainalysis_cluster_info', 'info', {'address': address}, {'asset': 'bitcoin'}
+        )
+
+    def test_pure_node_result_reused(self):
+        """Identical config and inputs hit the cache; new inputs do not."""
+        with mock.patch.object(
+            WorkflowExecutor, '_execute_chainalysis_cluster_info',
+            return_value={'cluster_name': 'Exchange'},
+        ) as handler:
+            self.assertEqual(self._run('addr-1'), {'cluster_name': 'Exchange'})
+            self.assertEqual(self._run('addr-1'), {'cluster_name': 'Exchange'})
+            self._run('addr-2')
+
+        self.assertEqual(handler.call_count, 2)
+
+    def test_errors_not_cached(self):
+        """Failed lookups are retried on the next execution."""
+        with mock.patch.object(
+            WorkflowExecutor, '_execute_chainalysis_cluster_info',
+            return_value={'error': 'rate limited'},
+        ) as handler:
+            self._run('addr-1')
+            self._run('addr-1')
+
+        self.assertEqual(handler.call_count, 2)
+
+    @mock.patch('apps.execution.executor.NODE_RESULT_CACHE_MAX_BYTES', 64)
+    def test_large_results_not_cached(self):
+        """Results over the size cap are recomputed instead of cached."""
+        large = {'cluster_info': [{'address': f'addr-{i}'} for i in range(20)]}
+
+        with mock.patch.object(
+            WorkflowExecutor, '_execute_chainalysis_cluster_info', return_value=large
+        ) as handler:
+            self.assertEqual(self._run('addr-1'), large)
+            self._run('addr-1')
+
+        self.assertEqual(handler.call_count, 2)
+
+
+class ChainalysisBatchTests(SimpleTestCase):
+    """Tests for batched per-address Chainalysis lookups."""
+
+    def _run_cluster_info(self, get_cluster_info, addresses):
+        """Run a cluster info node against a client with a stubbed lookup."""
+        client = ChainalysisClient(api_key='test-key')
+        executor = self.executor = WorkflowExecutor(None)
+
+        with mock.patch.object(client, 'get_cluster_info', side_effect=get_cluster_info), \
+                mock.patch.object(executor, '_get_chainalysis_client', return_value=client):
+            return executor._execute_chainalysis_cluster_info({'addresses': addresses}, {})
+
+    def test_addresses_queried_concurrently_in_order(self):
+        """Lookups overlap, results keep input order and 404s stay unknown."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def get_cluster_info(address, asset):
+            barrier.wait()
+            if address == 'missing':
+                raise ChainalysisAPIError(404, 'Not found')
+            return {'clusterName': f'Cluster {address}', 'category': 'exchange'}
+
+        result = self._run_cluster_info(get_cluster_info, ['a', 'missing', 'b'])
+
+        self.assertEqual(
+            [item['cluster_name'] for item in result['cluster_info']],
+            ['Cluster a', 'Unknown', 'Cluster b']
+        )
+
+    def test_duplicate_addresses_requested_once(self):
+        """Repeated addresses share one request but keep their result rows."""
+        calls = []
+
+        def get_cluster_info(address, asset):
+            calls.append(address)
+            return {'clusterName': 'Exchange', 'category': 'exchange'}
+
+        result = self._run_cluster_info(get_cluster_info, ['a', 'b', 'a'])
+
+        self.assertEqual(sorted(calls), ['a', 'b'])
+        self.assertEqual(
+            [item['address'] for item in result['cluster_info']], ['a', 'b', 'a']
+        )
+        self.assertIn('  [API] 1 repeated address(es) looked up once', self.executor.execution_log)
+
+    def test_other_api_errors_fail_the_node(self):
+        """A non-404 error still surfaces as the node error."""
+        def get_cluster_info(address, asset):
+            raise ChainalysisAPIError(401, 'Unauthorized')
+
+        result = self._run_cluster_info(get_cluster_info, ['a', 'b'])
+
+        self.assertIn('error', result)
+        self.assertEqual(result['count'], 0)
+
+    def test_exposure_aggregated_across_addresses(self):
+        """Exposure nodes query every address and sum the batch totals."""
+        client = ChainalysisClient(api_key='test-key')
+        executor = WorkflowExecutor(None)
+        exposures = {
+            'a': {'direct': [{'category': 'sanctions', 'value': 10}], 'indirect': []},
+            'b': {'direct': [{'category': 'exchange', 'value': 5}], 'indirect': []},
+        }
+
+        def get_exposure_by_category(address, asset, direction, output_asset):
+            if address not in exposures:
+                raise ChainalysisAPIError(404, 'Not found')
+            return exposures[address]
+
+        with mock.patch.object(client, 'get_exposure_by_category', side_effect=get_exposure_by_category), \
+                mock.patch.object(executor, '_get_chainalysis_client', return_value=client):
+            result = executor._execute_chainalysis_exposure_category(
+                {'addresses': ['a', 'missing', 'b']}, {}
+            )
+
+        self.assertEqual([item['address'] for item in result['per_address']], ['a', 'missing', 'b'])
+        self.assertEqual(result['total_direct'], 15)
+        self.assertEqual(result['high_risk_flags'][0]['address'], 'a')
+        self.assertTrue(result['has_high_risk'])
+
+    def test_batch_top_services_ranked_across_addresses(self):
+        """Batch service exposure ranks the largest services of all addresses."""
+        client = ChainalysisClient(api_key='test-key')
+        executor = WorkflowExecutor(None)
+        exposures = {
+            'a': [{'service': 'A1', 'value': 4}, {'service': 'A2', 'value': 1}],
+            'b': [{'service': 'B1', 'value': 9}, {'service': 'B2', 'value': 2}],
+        }
+
+        def get_exposure_by_service(address, asset, direction, output_asset):
+            return {'direct': exposures[address], 'indirect': []}
+
+        with mock.patch.object(client, 'get_exposure_by_service', side_effect=get_exposure_by_service), \
+                mock.patch.object(executor, '_get_chainalysis_client', return_value=client):
+            result = executor._execute_chainalysis_exposure_service({'addresses': ['a', 'b']}, {})
+
+        self.assertEqual(result['total_direct'], 16)
+        self.assertEqual(
+            [(s['service'], s['address']) for s in result['top_direct_services']],
+            [('B1', 'b'), ('A1', 'a'), ('B2', 'b'), ('A2', 'a')]
+        )
+
+    def test_client_reused_per_credentials(self):
+        """Nodes with the same credentials share one client."""
+        executor = WorkflowExecutor(None)
+        credentials = {'api_key': 'key-1', 'api_url': 'https://iapi.example.com'}
+
+        first = executor._get_chainalysis_client(credentials)
+        second = executor._get_chainalysis_client(dict(credentials))
+        other = executor._get_chainalysis_client({'api_key': 'key-2'})
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(first.base_url, 'https://iapi.example.com')
+
+    def test_clients_share_connection_pool(self):
+        """Clients of different executors and credentials reuse one HTTP pool."""
+        first = WorkflowExecutor(None)._get_chainalysis_client({'api_key': 'key-1'})
+        second = WorkflowExecutor(None)._get_chainalysis_client({'api_key': 'key-2'})
+
+        self.assertIs(first.http, second.http)
+        self.assertNotEqual(first.headers, second.headers)
+
+
+class ExportTests(SimpleTestCase):
+    """Tests for file export nodes."""
+
+    def setUp(self):
+        """Write exports into a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.config = {'output_path': {'path': str(Path(self.tmp.name) / 'export')}}
+        self.inputs = {'data': {'balance_data': [
+            {'address': 'a', 'balance': 1.5},
+            {'address': 'b', 'balance': 2, 'tags': ['exchange']},
+        ]}}
+
+    def test_csv_columns_in_first_seen_order(self):
+        """Columns are the union of row keys, in the order first seen."""
+        result = WorkflowExecutor(None)._export_csv(self.inputs, self.config)
+
+        self.assertEqual(result['columns'], ['address', 'balance', 'tags'])
+        with open(result['file_path'], encoding='utf-8') as f:
+            self.assertEqual(f.readline().strip(), 'address,balance,tags')
+
+    def test_csv_streams_grouped_counterparties(self):
+        """Grouped counterparties are flattened row by row with their source."""
+        inputs = {'counterparties_by_address': [
+            {'source_address': 'a', 'counterparties': [{'name': 'x'}, {'name': 'y'}]},
+            {'source_address': 'b', 'counterparties': [{'name': 'z'}]},
+        ]}
+
+        result = WorkflowExecutor(None)._export_csv(inputs, self.config)
+
+        self.assertEqual(result['rows_written'], 3)
+        self.assertEqual(result['columns'], ['name', 'source_address'])
+        with open(result['file_path'], encoding='utf-8') as f:
+            self.assertEqual(f.read().split(), ['name,source_address', 'x,a', 'y,a', 'z,b'])
+
+    def test_csv_without_rows(self):
+        """An export with no rows writes no file."""
+        result = WorkflowExecutor(None)._export_csv({}, self.config)
+
+        self.assertIsNone(result['file_path'])
+        self.assertEqual(result['rows_written'], 0)
+
+    def test_json_streamed_matches_full_dump(self):
+        """The record-by-record JSON file matches json.dumps(indent=2)."""
+        rows = self.inputs['data']['balance_data'] + [{'nested': {'a': [1, {'b': 'x\ny'}]}}]
+
+        result = WorkflowExecutor(None)._export_json({'data': {'balance_data': rows}}, self.config)
+
+        self.assertEqual(result['rows_written'], 3)
+        with open(result['file_path'], encoding='utf-8') as f:
+            self.assertEqual(f.read(), json.dumps(rows, indent=2))
+
+    def test_export_rows_shared_between_nodes(self):
+        """Export nodes fed the same upstream output reuse its prepared rows."""
+        executor = WorkflowExecutor(None)
+        upstream = {'counterparties_by_address': [
+            {'source_address': 'a', 'counterparties': [{'name': 'x'}]},
+        ]}
+
+        first = executor._prepare_export_data({'data': upstream})
+        second = executor._prepare_export_data({'data': upstream})
+        other = executor._prepare_export_data({'data': dict(upstream)})
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(first, other)
+
+    def test_pdf_rendered_in_worker_process(self):
+        """The PDF report is written by the worker pool."""
+        inputs = {'data': {'balance_data': [
+            {'address': 'a', 'balance': 1.5},
+            {'address': 'b', 'balance': 2},
+        ]}}
+
+        result = WorkflowExecutor(None)._export_pdf(inputs, self.config)
+
+        self.assertNotIn('error', result)
+        self.assertEqual(result['rows_written'], 2)
+        with open(result['file_path'], 'rb') as f:
+            self.assertEqual(f.read(5), b'%PDF-')
+
+    def test_excel_rows_written(self):
+        """The write-only workbook holds the header and every row."""
+        import openpyxl
+
+        result = WorkflowExecutor(None)._export_excel(self.inputs, self.config)
+
+        sheet = openpyxl.load_workbook(result['file_path'])['Data']
+        rows = list(sheet.iter_rows(values_only=True))
+        self.assertEqual(rows[0], ('address', 'balance', 'tags'))
+        self.assertEqual(rows[2], ('b', 2, '["exchange"]'))
+        self.assertEqual(len(rows), 3)
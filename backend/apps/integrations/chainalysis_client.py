@@ -7,12 +7,31 @@ Authentication: Token header with API key
 """
 import logging
 import time
-import requests
-from typing import Optional
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Union
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# Batch lookups: addresses per call and concurrent requests per batch
+BATCH_SIZE = 100
+BATCH_MAX_WORKERS = 10
+
+# Connection pool shared by every ChainalysisClient in the process. Over
+# HTTP/2, concurrent batch lookups from sibling nodes are multiplexed on
+# a few connections instead of each opening its own TLS session.
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+HTTP_CONNECT_RETRIES = 2
+
+_HTTP = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        limits=HTTP_LIMITS,
+        retries=HTTP_CONNECT_RETRIES,
+    )
+)
+
 
 class ChainalysisAPIError(Exception):
     """Chainalysis API error with status code and message."""
@@ -76,12 +95,14 @@ class ChainalysisClient:
         if not self.api_key:
             raise ValueError("Chainalysis API key not configured. Set CHAINALYSIS_API_KEY in .env")
 
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Connections come from the shared pool; credentials travel with
+        # each request so clients for different keys can share it
+        self.http = _HTTP
+        self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
             "Token": self.api_key  # Chainalysis uses 'Token' header
-        })
+        }
 
         logger.info(f"ChainalysisClient initialized with base URL: {self.base_url}")
 
@@ -128,10 +149,11 @@ class ChainalysisClient:
         logger.info(f"  base_url: {self.base_url}")
 
         try:
-            response = self.session.request(
+            response = self.http.request(
                 method=method,
                 url=url,
                 params=params,
+                headers=self.headers,
                 timeout=timeout
             )
 
@@ -152,13 +174,13 @@ class ChainalysisClient:
 
             return response.json()
 
-        except requests.Timeout:
+        except httpx.TimeoutException:
             logger.error(f"Chainalysis API timeout for {path}")
             raise ChainalysisAPIError(
                 status_code=408,
                 message="Request timeout"
             )
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Chainalysis API connection error: {e}")
             raise ChainalysisAPIError(
                 status_code=500,
@@ -266,6 +288,179 @@ class ChainalysisClient:
         logger.info(f"get_cluster_counterparties: asset={asset} -> normalized={normalized_asset}")
         return self._make_request("GET", path, params=params)
 
+    def _fetch_batch(
+        self,
+        fetch: Callable[[str], dict],
+        addresses: List[str]
+    ) -> Dict[str, Union[dict, ChainalysisAPIError]]:
+        """
+        Run a per-address lookup for a batch of addresses.
+
+        The IAPI has no bulk endpoints, so each unique address is requested
+        once and the requests run concurrently over the shared pool.
+
+        Args:
+            fetch: Single-address lookup (e.g. a bound get_* method)
+            addresses: Addresses to look up (at most BATCH_SIZE)
+
+        Returns:
+            Dict mapping each address to its response, or to the
+            ChainalysisAPIError raised for it
+        """
+        unique = list(dict.fromkeys(addresses[:BATCH_SIZE]))
+
+        def call(address):
+            try:
+                return fetch(address)
+            except ChainalysisAPIError as e:
+                return e
+
+        if len(unique) <= 1:
+            return {address: call(address) for address in unique}
+
+        workers = min(BATCH_MAX_WORKERS, len(unique))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chainalysis") as pool:
+            return dict(zip(unique, pool.map(call, unique)))
+
+    def get_cluster_info_batch(
+        self,
+        addresses: List[str],
+        asset: str = "bitcoin"
+    ) -> Dict[str, Union[dict, ChainalysisAPIError]]:
+        """
+        Get cluster info for a batch of addresses.
+
+        Args:
+            addresses: Blockchain addresses (at most BATCH_SIZE)
+            asset: Asset type
+
+        Returns:
+            Dict mapping each address to its get_cluster_info() response
+            or ChainalysisAPIError
+        """
+        return self._fetch_batch(
+            lambda address: self.get_cluster_info(address=address, asset=asset),
+            addresses
+        )
+
+    def get_cluster_balance_batch(
+        self,
+        addresses: List[str],
+        asset: str = "bitcoin",
+        output_asset: str = "NATIVE"
+    ) -> Dict[str, Union[dict, ChainalysisAPIError]]:
+        """
+        Get cluster balances for a batch of addresses.
+
+        Args:
+            addresses: Blockchain addresses (at most BATCH_SIZE)
+            asset: Asset type
+            output_asset: "NATIVE" or "USD"
+
+        Returns:
+            Dict mapping each address to its get_cluster_balance() response
+            or ChainalysisAPIError
+        """
+        return self._fetch_batch(
+            lambda address: self.get_cluster_balance(
+                address=address, asset=asset, output_asset=output_asset
+            ),
+            addresses
+        )
+
+    def get_cluster_counterparties_batch(
+        self,
+        addresses: List[str],
+        asset: str = "bitcoin",
+        output_asset: str = "NATIVE",
+        direction: Optional[str] = None,
+        limit: Optional[str] = None
+    ) -> Dict[str, Union[dict, ChainalysisAPIError]]:
+        """
+        Get counterparties for a batch of addresses.
+
+        Args:
+            addresses: Blockchain addresses (at most BATCH_SIZE)
+            asset: Asset type
+            output_asset: "NATIVE" or "USD"
+            direction: Optional "sent" or "received"
+            limit: Optional max results per address
+
+        Returns:
+            Dict mapping each address to its get_cluster_counterparties()
+            response or ChainalysisAPIError
+        """
+        return self._fetch_batch(
+            lambda address: self.get_cluster_counterparties(
+                address=address,
+                asset=asset,
+                output_asset=output_asset,
+                direction=direction,
+                limit=limit
+            ),
+            addresses
+        )
+
+    def get_exposure_by_category_batch(
+        self,
+        addresses: List[str],
+        asset: str = "bitcoin",
+        direction: str = "sent",
+        output_asset: str = "USD"
+    ) -> Dict[str, Union[dict, ChainalysisAPIError]]:
+        """
+        Get exposure by category for a batch of addresses.
+
+        Args:
+            addresses: Blockchain addresses (at most BATCH_SIZE)
+            asset: Asset type
+            direction: "sent" or "received"
+            output_asset: "NATIVE" or "USD"
+
+        Returns:
+            Dict mapping each address to its get_exposure_by_category()
+            response or ChainalysisAPIError
+        """
+        return self._fetch_batch(
+            lambda address: self.get_exposure_by_category(
+                address=address,
+                asset=asset,
+                direction=direction,
+                output_asset=output_asset
+            ),
+            addresses
+        )
+
+    def get_exposure_by_service_batch(
+        self,
+        addresses: List[str],
+        asset: str = "bitcoin",
+        direction: str = "sent",
+        output_asset: str = "USD"
+    ) -> Dict[str, Union[dict, ChainalysisAPIError]]:
+        """
+        Get exposure by service for a batch of addresses.
+
+        Args:
+            addresses: Blockchain addresses (at most BATCH_SIZE)
+            asset: Asset type
+            direction: "sent" or "received"
+            output_asset: "NATIVE" or "USD"
+
+        Returns:
+            Dict mapping each address to its get_exposure_by_service()
+            response or ChainalysisAPIError
+        """
+        return self._fetch_batch(
+            lambda address: self.get_exposure_by_service(
+                address=address,
+                asset=asset,
+                direction=direction,
+                output_asset=output_asset
+            ),
+            addresses
+        )
+
     def get_exposure_by_category(
         self,
         address: str,
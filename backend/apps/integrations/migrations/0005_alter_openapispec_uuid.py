@@ -0,0 +1,26 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:30
+
+import utils.helpers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("integrations", "0004_alter_openapispec_unique_together"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="openapispec",
+            name="uuid",
+            field=models.UUIDField(
+                default=utils.helpers.uuid7,
+                editable=False,
+                help_text="Unique identifier for this record.",
+                primary_key=True,
+                serialize=False,
+                verbose_name="UUID",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("integrations", "0005_alter_openapispec_uuid"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="openapispec",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                help_text="Timestamp when this record was created.",
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="openapispec",
+            name="is_active",
+            field=models.BooleanField(
+                default=True,
+                help_text="Whether this record is active.",
+                verbose_name="Is Active",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="openapispec",
+            index=models.Index(
+                fields=["is_active", "-created_at"], name="openapispec_active_created"
+            ),
+        ),
+    ]
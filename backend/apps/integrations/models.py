@@ -17,7 +17,7 @@ from typing import Optional, Dict, Any
 from django.db import models
 from django.core.validators import FileExtensionValidator
 
-from apps.core.models import BaseModel
+from apps.core.models import ACTIVE_CREATED_INDEX, BaseModel
 from fields.constants import MAX_LENGTH_NAME, MAX_LENGTH_DESCRIPTION
 from fields.names import (
     FIELD_API_PROVIDER_NAME,
@@ -134,12 +134,13 @@ class OpenAPISpec(BaseModel):
         help_text="Error message if parsing failed",
     )
     
-    class Meta:
+    class Meta(BaseModel.Meta):
         db_table = "api_specs"
         verbose_name = "OpenAPI Specification"
         verbose_name_plural = "OpenAPI Specifications"
         ordering = ["-created_at"]
         indexes = [
+            ACTIVE_CREATED_INDEX,
             models.Index(fields=["provider", "-created_at"]),
             models.Index(fields=["is_parsed", "-created_at"]),
         ]
@@ -18,7 +18,7 @@ configuration that can be used to generate workflow nodes.
 
 import logging
 import yaml
-import json
+import orjson
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
@@ -132,7 +132,7 @@ class OpenAPIParser:
         try:
             # Load spec data
             if file_format.lower() == "json":
-                self.spec_data = json.loads(content)
+                self.spec_data = orjson.loads(content)
             else:  # YAML
                 self.spec_data = yaml.safe_load(content)
             
@@ -146,7 +146,7 @@ class OpenAPIParser:
             )
             return result
             
-        except (json.JSONDecodeError, yaml.YAMLError) as e:
+        except (orjson.JSONDecodeError, yaml.YAMLError) as e:
             logger.error(f"Failed to parse {file_format} content: {e}")
             raise OpenAPIParseError(f"Invalid {file_format} format: {str(e)}")
         except OpenAPIParseError:
@@ -187,11 +187,11 @@ class OpenAPIParser:
             if path.suffix.lower() in [".yaml", ".yml"]:
                 return yaml.safe_load(content)
             elif path.suffix.lower() == ".json":
-                return json.loads(content)
+                return orjson.loads(content)
             else:
                 raise OpenAPIParseError(f"Unsupported file format: {path.suffix}")
                 
-        except (yaml.YAMLError, json.JSONDecodeError) as e:
+        except (yaml.YAMLError, orjson.JSONDecodeError) as e:
             raise OpenAPIParseError(f"Failed to parse file content: {str(e)}")
         except Exception as e:
             raise OpenAPIParseError(f"Failed to load file: {str(e)}")
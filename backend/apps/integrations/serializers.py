@@ -13,7 +13,7 @@ Serializers for API integration management.
 # =============================================================================
 
 import logging
-import json
+import orjson
 import yaml
 from rest_framework import serializers
 
@@ -183,9 +183,9 @@ class OpenAPISpecSerializer(serializers.ModelSerializer):
             # Try to parse as JSON first
             spec_data = None
             try:
-                spec_data = json.loads(content)
+                spec_data = orjson.loads(content)
                 logger.info("Parsed spec file as JSON")
-            except (json.JSONDecodeError, ValueError):
+            except (orjson.JSONDecodeError, ValueError):
                 # Try YAML
                 try:
                     spec_data = yaml.safe_load(content)
@@ -348,8 +348,8 @@ class OpenAPISpecCreateSerializer(serializers.ModelSerializer):
             # Try JSON first
             spec_data = None
             try:
-                spec_data = json.loads(content)
-            except (json.JSONDecodeError, ValueError):
+                spec_data = orjson.loads(content)
+            except (orjson.JSONDecodeError, ValueError):
                 # Try YAML
                 try:
                     spec_data = yaml.safe_load(content)
@@ -14,7 +14,10 @@ Tests for API integration functionality.
 import os
 import json
 import tempfile
-from django.test import TestCase, override_settings
+from unittest import mock
+
+import httpx
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework.test import APITestCase
 from rest_framework import status
@@ -22,6 +25,8 @@ from rest_framework import status
 from apps.integrations.models import OpenAPISpec, APIProvider
 from apps.integrations.openapi_parser import OpenAPIParser, OpenAPIParseError
 from apps.integrations.node_generator import NodeGenerator
+from apps.integrations import chainalysis_client
+from apps.integrations.chainalysis_client import ChainalysisAPIError, ChainalysisClient
 
 
 # =============================================================================
@@ -416,4 +421,52 @@ class OpenAPISpecAPITests(APITestCase):
         
         # Verify soft delete
         spec.refresh_from_db()
-        self.assertFalse(spec.is_active)
\ No newline at end of file
+        self.assertFalse(spec.is_active)
+
+
+# =============================================================================
+# CHAINALYSIS CLIENT TESTS
+# =============================================================================
+
+class ChainalysisClientTests(SimpleTestCase):
+    """Tests for the Chainalysis client over the shared HTTP pool."""
+
+    def _client(self, handler, api_key="key-1"):
+        """Build a client whose shared pool is a mock transport."""
+        http = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(http.close)
+        with mock.patch.object(chainalysis_client, "_HTTP", http):
+            return ChainalysisClient(api_key=api_key, base_url="https://iapi.example.com")
+
+    def test_request_carries_client_token(self):
+        """Each client sends its own key through the shared pool."""
+        seen = []
+
+        def handler(request):
+            seen.append((request.url.path, request.headers["Token"]))
+            return httpx.Response(200, json={"clusterName": "Exchange"})
+
+        result = self._client(handler).get_cluster_info("addr-1")
+        self._client(handler, api_key="key-2").get_cluster_info("addr-2")
+
+        self.assertEqual(result["clusterName"], "Exchange")
+        self.assertEqual(seen, [("/clusters/addr-1", "key-1"), ("/clusters/addr-2", "key-2")])
+
+    def test_error_status_raises_api_error(self):
+        """Non-200 responses raise ChainalysisAPIError with the status."""
+        client = self._client(lambda request: httpx.Response(404, text="missing"))
+
+        with self.assertRaises(ChainalysisAPIError) as ctx:
+            client.get_cluster_info("addr-1")
+
+        self.assertEqual(ctx.exception.status_code, 404)
+
+    def test_connection_error_raises_api_error(self):
+        """Transport failures are reported as API errors."""
+        def handler(request):
+            raise httpx.ConnectError("refused")
+
+        with self.assertRaises(ChainalysisAPIError) as ctx:
+            self._client(handler).get_cluster_info("addr-1")
+
+        self.assertEqual(ctx.exception.status_code, 500)
@@ -0,0 +1,70 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("providers", "0002_alter_apiendpoint_uuid_alter_generatednode_uuid_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="apiendpoint",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                help_text="Timestamp when this record was created.",
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="apiendpoint",
+            name="is_active",
+            field=models.BooleanField(
+                default=True,
+                help_text="Whether this record is active.",
+                verbose_name="Is Active",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="generatednode",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                help_text="Timestamp when this record was created.",
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="generatednode",
+            name="is_active",
+            field=models.BooleanField(
+                default=True,
+                help_text="Whether this record is active.",
+                verbose_name="Is Active",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="provider",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                help_text="Timestamp when this record was created.",
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="apiendpoint",
+            index=models.Index(
+                fields=["is_active", "-created_at"], name="apiendpoint_active_created"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="generatednode",
+            index=models.Index(
+                fields=["is_active", "-created_at"], name="generatednode_active_created"
+            ),
+        ),
+    ]
@@ -28,7 +28,7 @@ from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
-from apps.core.models import BaseModel
+from apps.core.models import ACTIVE_CREATED_INDEX, BaseModel
 from fields.constants import (
     MAX_LENGTH_NAME,
     MAX_LENGTH_DESCRIPTION,
@@ -464,12 +464,13 @@ class APIEndpoint(BaseModel):
     # Meta
     # -------------------------------------------------------------------------
 
-    class Meta:
+    class Meta(BaseModel.Meta):
         db_table = "api_endpoints"
         verbose_name = "API Endpoint"
         verbose_name_plural = "API Endpoints"
         ordering = ["provider", "path", "method"]
         indexes = [
+            ACTIVE_CREATED_INDEX,
             models.Index(fields=["provider", "path"]),
             models.Index(fields=["method"]),
             models.Index(fields=["operation_id"]),
@@ -648,12 +649,13 @@ class GeneratedNode(BaseModel):
     # Meta
     # -------------------------------------------------------------------------
 
-    class Meta:
+    class Meta(BaseModel.Meta):
         db_table = "generated_nodes"
         verbose_name = "Generated Node"
         verbose_name_plural = "Generated Nodes"
         ordering = ["provider", "category", "display_name"]
         indexes = [
+            ACTIVE_CREATED_INDEX,
             models.Index(fields=["node_type"]),
             models.Index(fields=["provider", "category"]),
             models.Index(fields=["category"]),
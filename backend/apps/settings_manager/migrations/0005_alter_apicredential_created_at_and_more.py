@@ -0,0 +1,55 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("settings_manager", "0004_alter_apicredential_uuid_alter_globalsettings_uuid"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="apicredential",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                help_text="Timestamp when this record was created.",
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="apicredential",
+            name="is_active",
+            field=models.BooleanField(
+                default=True,
+                help_text="Whether this record is active.",
+                verbose_name="Is Active",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="globalsettings",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                help_text="Timestamp when this record was created.",
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="globalsettings",
+            name="is_active",
+            field=models.BooleanField(
+                default=True,
+                help_text="Whether this record is active.",
+                verbose_name="Is Active",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="apicredential",
+            index=models.Index(
+                fields=["is_active", "-created_at"], name="apicredential_active_created"
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:40
+
+import apps.core.fields
+import utils.helpers
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("settings_manager", "0005_alter_apicredential_created_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="apicredential",
+            name="uuid",
+            field=apps.core.fields.BinaryUUIDField(
+                default=utils.helpers.uuid7,
+                editable=False,
+                help_text="Unique identifier for this record.",
+                primary_key=True,
+                serialize=False,
+                verbose_name="UUID",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="globalsettings",
+            name="uuid",
+            field=apps.core.fields.BinaryUUIDField(
+                default=utils.helpers.uuid7,
+                editable=False,
+                help_text="Unique identifier for this record.",
+                primary_key=True,
+                serialize=False,
+                verbose_name="UUID",
+            ),
+        ),
+        apps.core.fields.convert_uuid_storage("settings_manager", "apicredential"),
+        apps.core.fields.convert_uuid_storage("settings_manager", "globalsettings"),
+    ]
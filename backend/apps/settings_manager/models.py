@@ -17,7 +17,7 @@ from typing import Any, Dict, Optional
 from django.db import models
 from django.core.cache import cache
 
-from apps.core.models import BaseModel
+from apps.core.models import ACTIVE_CREATED_INDEX, BaseModel
 from fields.constants import (
     MAX_LENGTH_NAME,
     MAX_LENGTH_API_KEY,
@@ -317,11 +317,12 @@ class APICredential(BaseModel):
     # Meta
     # -------------------------------------------------------------------------
 
-    class Meta:
+    class Meta(BaseModel.Meta):
         verbose_name = "API Credential"
         verbose_name_plural = "API Credentials"
         ordering = ["-is_default", "provider", "label"]
         indexes = [
+            ACTIVE_CREATED_INDEX,
             models.Index(fields=["provider", "is_default"]),
             models.Index(fields=["provider", "is_active"]),
         ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workflows", "0002_alter_workflow_uuid"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="workflow",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                help_text="Timestamp when this record was created.",
+                verbose_name="Created At",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="workflow",
+            name="is_active",
+            field=models.BooleanField(
+                default=True,
+                help_text="Whether this record is active.",
+                verbose_name="Is Active",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workflow",
+            index=models.Index(
+                fields=["is_active", "-created_at"], name="workflow_active_created"
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:40
+
+import apps.core.fields
+import utils.helpers
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # ExecutionLog.workflow must be in state so its column is rewritten
+        ("execution", "0005_alter_executionlog_created_at_and_more"),
+        (
+            "workflows",
+            "0003_alter_workflow_created_at_alter_workflow_is_active_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="workflow",
+            name="uuid",
+            field=apps.core.fields.BinaryUUIDField(
+                default=utils.helpers.uuid7,
+                editable=False,
+                help_text="Unique identifier for this record.",
+                primary_key=True,
+                serialize=False,
+                verbose_name="UUID",
+            ),
+        ),
+        apps.core.fields.convert_uuid_storage("workflows", "workflow"),
+    ]
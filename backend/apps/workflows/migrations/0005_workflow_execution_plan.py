@@ -0,0 +1,34 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:50
+
+from django.db import migrations, models
+
+from apps.workflows.planning import build_execution_plan
+
+
+def backfill_execution_plans(apps, schema_editor):
+    Workflow = apps.get_model("workflows", "Workflow")
+    for workflow in Workflow.objects.only("pk", "canvas_data").iterator():
+        Workflow.objects.filter(pk=workflow.pk).update(
+            execution_plan=build_execution_plan(workflow.canvas_data)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workflows", "0004_alter_workflow_uuid"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="workflow",
+            name="execution_plan",
+            field=models.JSONField(
+                blank=True,
+                editable=False,
+                help_text="Execution order derived from canvas_data (computed on save)",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_execution_plans, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-16 18:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workflows", "0005_workflow_execution_plan"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="workflow",
+            index=models.Index(
+                fields=["-created_at"], name="workflows_created_0aa0ab_idx"
+            ),
+        ),
+    ]
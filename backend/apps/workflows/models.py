@@ -13,9 +13,12 @@ Workflow models for the EasyCall application.
 
 import logging
 
+import orjson
+
 from django.db import models
 
-from apps.core.models import BaseModel
+from apps.core.models import ACTIVE_CREATED_INDEX, BaseModel
+from apps.workflows.planning import build_execution_plan, plan_matches
 from fields.constants import MAX_LENGTH_NAME, MAX_LENGTH_DESCRIPTION
 from fields.names import (
     FIELD_WORKFLOW_NAME,
@@ -48,6 +51,8 @@ class Workflow(BaseModel):
         name: Human-readable name for the workflow.
         description: Optional description of what the workflow does.
         canvas_data: JSON data containing React Flow canvas state.
+        execution_plan: Node dependency levels derived from canvas_data,
+            refreshed on save.
     """
     
     name = models.CharField(
@@ -70,12 +75,22 @@ class Workflow(BaseModel):
         help_text="JSON data containing nodes, edges, and viewport state",
     )
     
-    class Meta:
+    execution_plan = models.JSONField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Execution order derived from canvas_data (computed on save)",
+    )
+    
+    class Meta(BaseModel.Meta):
         db_table = "workflows"
         verbose_name = "Workflow"
         verbose_name_plural = "Workflows"
         ordering = ["-updated_at"]
         indexes = [
+            ACTIVE_CREATED_INDEX,
+            # Recent activity feed (all workflows, newest first)
+            models.Index(fields=["-created_at"]),
             models.Index(fields=["name"]),
             models.Index(fields=["is_active", "-updated_at"]),
         ]
@@ -84,6 +99,27 @@ class Workflow(BaseModel):
         """String representation of the workflow."""
         return f"{self.name} ({self.uuid})"
     
+    def save(self, *args, **kwargs) -> None:
+        """Save the workflow, refreshing the execution plan if needed."""
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "canvas_data" in update_fields:
+            if self.refresh_execution_plan() and update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "execution_plan"}
+        super().save(*args, **kwargs)
+    
+    def refresh_execution_plan(self) -> bool:
+        """
+        Recompute execution_plan when canvas_data has changed.
+        
+        Returns:
+            True if the plan was updated.
+        """
+        if plan_matches(self.execution_plan, self.canvas_data):
+            return False
+        self.execution_plan = build_execution_plan(self.canvas_data)
+        logger.debug("Rebuilt execution plan for workflow %s", self.uuid)
+        return True
+    
     def get_node_count(self) -> int:
         """
         Get the number of nodes in this workflow.
@@ -98,9 +134,8 @@ class Workflow(BaseModel):
         # If canvas_data is a string, try to parse it
         if isinstance(self.canvas_data, str):
             try:
-                import json
-                canvas_dict = json.loads(self.canvas_data)
-            except (json.JSONDecodeError, TypeError):
+                canvas_dict = orjson.loads(self.canvas_data)
+            except (orjson.JSONDecodeError, TypeError):
                 return 0
         elif isinstance(self.canvas_data, dict):
             canvas_dict = self.canvas_data
@@ -125,9 +160,8 @@ class Workflow(BaseModel):
         # If canvas_data is a string, try to parse it
         if isinstance(self.canvas_data, str):
             try:
-                import json
-                canvas_dict = json.loads(self.canvas_data)
-            except (json.JSONDecodeError, TypeError):
+                canvas_dict = orjson.loads(self.canvas_data)
+            except (orjson.JSONDecodeError, TypeError):
                 return 0
         elif isinstance(self.canvas_data, dict):
             canvas_dict = self.canvas_data
@@ -0,0 +1,253 @@
+# =============================================================================
+# FILE: easycall/backend/apps/workflows/planning.py
+# =============================================================================
+# Execution planning for workflow canvases.
+# =============================================================================
+"""
+Execution plan helpers for the EasyCall application.
+
+An execution plan is the canvas' nodes grouped into dependency levels.
+It is computed when a workflow is saved and reused by the executor for
+as long as the canvas it was built from is unchanged.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Bump when the plan layout changes so stored plans are recomputed
+EXECUTION_PLAN_VERSION = 1
+
+# Levels of recently executed canvases that had no usable stored plan
+# (unsaved canvases run from the editor, or rows changed with update()),
+# keyed by canvas hash so an edited canvas never hits a stale entry
+LEVELS_CACHE_SIZE = 256
+_levels_cache: "OrderedDict[str, List[List[str]]]" = OrderedDict()
+_levels_cache_lock = threading.Lock()
+
+# =============================================================================
+# PLANNING
+# =============================================================================
+
+
+def canvas_hash(canvas_data: Any) -> str:
+    """
+    Fingerprint canvas data independently of key order.
+
+    Args:
+        canvas_data: React Flow canvas state.
+
+    Returns:
+        Hex digest identifying the canvas contents.
+    """
+    payload = orjson.dumps(
+        canvas_data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _linear_chain(nodes: List[dict], edges: List[dict]) -> Optional[List[str]]:
+    """
+    Order a canvas that is a single pipeline (A -> B -> ... -> Z).
+
+    Most workflows are short chains, for which following the edges from
+    the only root gives the same order as Kahn's algorithm without
+    building dependency sets.
+
+    Args:
+        nodes: Canvas nodes.
+        edges: Canvas edges.
+
+    Returns:
+        Node IDs in chain order, or None if the canvas is not a chain.
+    """
+    if len(edges) != len(nodes) - 1:
+        return None
+
+    node_ids = {node["id"] for node in nodes}
+    successor = {}
+    targets = set()
+    for edge in edges:
+        source = edge.get("source")
+        target = edge.get("target")
+        if source not in node_ids or target not in node_ids:
+            return None
+        if source in successor or target in targets:
+            return None
+        successor[source] = target
+        targets.add(target)
+
+    roots = node_ids - targets
+    if len(roots) != 1:
+        return None
+
+    chain = [roots.pop()]
+    while chain[-1] in successor and len(chain) <= len(nodes):
+        chain.append(successor[chain[-1]])
+
+    return chain if len(chain) == len(nodes) else None
+
+
+def topological_levels(nodes: List[dict], edges: List[dict]) -> List[List[str]]:
+    """
+    Group node IDs into dependency levels (Kahn's algorithm).
+
+    Each level holds the nodes whose inputs are all produced by earlier
+    levels, so nodes within a level can run concurrently. Nodes keep
+    their canvas order within a level; nodes on a cycle, or fed by a
+    missing node, are left out.
+
+    Args:
+        nodes: Canvas nodes.
+        edges: Canvas edges.
+
+    Returns:
+        List of levels, each a list of node IDs.
+    """
+    chain = _linear_chain(nodes, edges)
+    if chain is not None:
+        return [[node_id] for node_id in chain]
+
+    position = {node["id"]: i for i, node in enumerate(nodes)}
+    dependencies = {node_id: set() for node_id in position}
+    dependents = defaultdict(set)
+
+    for edge in edges:
+        target = edge.get("target")
+        source = edge.get("source")
+        if target in dependencies:
+            dependencies[target].add(source)
+            dependents[source].add(target)
+
+    levels = []
+    ready = [node_id for node_id in position if not dependencies[node_id]]
+
+    while ready:
+        levels.append(ready)
+
+        next_ready = []
+        for node_id in ready:
+            for dependent in dependents[node_id]:
+                deps = dependencies[dependent]
+                deps.discard(node_id)
+                if not deps:
+                    next_ready.append(dependent)
+
+        ready = sorted(next_ready, key=position.__getitem__)
+
+    return levels
+
+
+def cached_topological_levels(
+    digest: str,
+    nodes: List[dict],
+    edges: List[dict],
+) -> List[List[str]]:
+    """
+    topological_levels() memoized per canvas hash (LRU).
+
+    Args:
+        digest: canvas_hash() of the canvas the nodes and edges belong to.
+        nodes: Canvas nodes.
+        edges: Canvas edges.
+
+    Returns:
+        List of levels, each a list of node IDs. Treat as read-only.
+    """
+    with _levels_cache_lock:
+        levels = _levels_cache.get(digest)
+        if levels is not None:
+            _levels_cache.move_to_end(digest)
+            return levels
+
+    levels = topological_levels(nodes, edges)
+
+    with _levels_cache_lock:
+        _levels_cache[digest] = levels
+        if len(_levels_cache) > LEVELS_CACHE_SIZE:
+            _levels_cache.popitem(last=False)
+    return levels
+
+
+def _is_plannable(nodes: List[Any], edges: List[Any]) -> bool:
+    """
+    Check that nodes and edges have the shape the planner indexes into.
+
+    Canvases are stored as sent by the editor, so saving must not fail
+    on nodes without an ID or on items that are not objects.
+
+    Args:
+        nodes: Canvas nodes.
+        edges: Canvas edges.
+
+    Returns:
+        True if every node is a dict with a str/int "id" and every edge
+        is a dict whose source and target are str, int or missing.
+    """
+    node_ids_ok = all(
+        isinstance(node, dict) and isinstance(node.get("id"), (str, int))
+        for node in nodes
+    )
+    return node_ids_ok and all(
+        isinstance(edge, dict)
+        and isinstance(edge.get("source"), (str, int, type(None)))
+        and isinstance(edge.get("target"), (str, int, type(None)))
+        for edge in edges
+    )
+
+
+def build_execution_plan(canvas_data: Any) -> Optional[Dict[str, Any]]:
+    """
+    Build the stored execution plan for a canvas.
+
+    Args:
+        canvas_data: React Flow canvas state.
+
+    Returns:
+        Plan dict with the canvas hash and node ID levels, or None when
+        the canvas is not a dict of well-formed nodes and edges (the
+        executor then sorts the canvas itself).
+    """
+    if not isinstance(canvas_data, dict):
+        return None
+
+    nodes = canvas_data.get("nodes", [])
+    edges = canvas_data.get("edges", [])
+    if not isinstance(nodes, list) or not isinstance(edges, list):
+        return None
+    if not _is_plannable(nodes, edges):
+        return None
+
+    return {
+        "version": EXECUTION_PLAN_VERSION,
+        "canvas_hash": canvas_hash(canvas_data),
+        "levels": topological_levels(nodes, edges),
+    }
+
+
+def plan_matches(plan: Any, canvas_data: Any, digest: Optional[str] = None) -> bool:
+    """
+    Check whether a stored plan was built from this canvas.
+
+    Args:
+        plan: Stored execution plan (may be None).
+        canvas_data: Current canvas state.
+        digest: canvas_hash(canvas_data), if already computed.
+
+    Returns:
+        True if the plan can be reused as-is.
+    """
+    if not isinstance(plan, dict) or plan.get("version") != EXECUTION_PLAN_VERSION:
+        return False
+    return plan.get("canvas_hash") == (digest or canvas_hash(canvas_data))
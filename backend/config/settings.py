@@ -97,6 +97,9 @@ MIDDLEWARE: list[str] = [
     # CORS headers (must be before CommonMiddleware)
     "corsheaders.middleware.CorsMiddleware",
 
+    # Compress responses (large workflow/AI JSON payloads)
+    "django.middleware.gzip.GZipMiddleware",
+
     # Django built-in middleware
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -149,9 +152,13 @@ DATABASES: dict = {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
         # SQLite optimizations for better performance
+        # (WAL and cache PRAGMAs are applied in apps.core.signals)
         "OPTIONS": {
-            "timeout": 20,
+            "timeout": 30,
         },
+        # Reuse connections across requests instead of reopening per request
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "3600")),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -224,6 +231,12 @@ REST_FRAMEWORK: dict = {
     # Default authentication classes (none for single-user app)
     "DEFAULT_AUTHENTICATION_CLASSES": [],
 
+    # Renderers (orjson for JSON; browsable API kept for development)
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+
     # Pagination
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 50,
@@ -284,6 +297,9 @@ CORS_ALLOW_METHODS: list[str] = [
     "PUT",
 ]
 
+# Let browsers cache preflight responses for a day (skips repeat OPTIONS)
+CORS_PREFLIGHT_MAX_AGE: int = 86400
+
 # =============================================================================
 # CHANNELS (WEBSOCKET) CONFIGURATION
 # =============================================================================
@@ -44,15 +44,15 @@ class TestHealthCheckEndpoint:
     ) -> None:
         """Test that health check returns healthy status."""
         response = api_client.get("/api/v1/health/")
-        assert response.data["status"] == "healthy"
+        assert response.json()["status"] == "healthy"
 
     def test_health_check_includes_timestamp(
         self, api_client: APIClient
     ) -> None:
         """Test that health check includes timestamp."""
         response = api_client.get("/api/v1/health/")
-        assert "timestamp" in response.data
-        assert response.data["timestamp"].endswith("Z")
+        assert "timestamp" in response.json()
+        assert response.json()["timestamp"].endswith("Z")
 
 
 class TestDetailedHealthCheckEndpoint:
@@ -102,32 +102,32 @@ class TestSystemInfoEndpoint:
     ) -> None:
         """Test that system info includes application details."""
         response = api_client.get("/api/v1/info/")
-        assert "application" in response.data
-        assert response.data["application"]["name"] == "EasyCall"
+        assert "application" in response.json()
+        assert response.json()["application"]["name"] == "EasyCall"
 
     def test_system_info_includes_version(
         self, api_client: APIClient
     ) -> None:
         """Test that system info includes version."""
         response = api_client.get("/api/v1/info/")
-        assert "version" in response.data["application"]
+        assert "version" in response.json()["application"]
 
     def test_system_info_includes_system_details(
         self, api_client: APIClient
     ) -> None:
         """Test that system info includes system details."""
         response = api_client.get("/api/v1/info/")
-        assert "system" in response.data
-        assert "python_version" in response.data["system"]
-        assert "django_version" in response.data["system"]
+        assert "system" in response.json()
+        assert "python_version" in response.json()["system"]
+        assert "django_version" in response.json()["system"]
 
     def test_system_info_includes_configuration(
         self, api_client: APIClient
     ) -> None:
         """Test that system info includes configuration."""
         response = api_client.get("/api/v1/info/")
-        assert "configuration" in response.data
-        assert "batch_size_limit" in response.data["configuration"]
+        assert "configuration" in response.json()
+        assert "batch_size_limit" in response.json()["configuration"]
 
 
 # =============================================================================
@@ -146,4 +146,4 @@ class TestPingEndpoint:
     def test_ping_returns_pong(self, api_client: APIClient) -> None:
         """Test that ping returns pong message."""
         response = api_client.get("/api/v1/ping/")
-        assert response.data["message"] == "pong"
\ No newline at end of file
+        assert response.json()["message"] == "pong"
\ No newline at end of file
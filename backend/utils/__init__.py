@@ -36,6 +36,7 @@ from utils.helpers import (  # noqa: F401
     sanitize_filename,
     truncate_string,
     unique_list,
+    uuid7,
 )
 
 # =============================================================================